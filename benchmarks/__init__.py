@@ -0,0 +1,4 @@
+"""benchmarks package contains the benchmark suite for the engine hot paths.
+
+Run it from the repository root with: python -m benchmarks.bench
+"""
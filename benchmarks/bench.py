@@ -0,0 +1,343 @@
+"""bench.py module contains the benchmark suite for the engine hot paths. It
+runs headless, with the SDL dummy video driver, and writes the results as
+JSON. Results are compared against a stored baseline to catch regressions.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench --save-baseline    store the results as baseline
+    python -m benchmarks.bench                    run and compare with baseline
+    python -m benchmarks.bench --output out.json  write the results to a file
+    python -m benchmarks.bench --filter board     run only matching benchmarks
+
+The process exits with status 1 when any benchmark is slower than the
+baseline by more than the threshold ratio. Times depend on the machine, so
+no baseline is shipped: store one with --save-baseline, on the machine used
+to compare, before making changes.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from engine import board
+from engine import gevent
+from engine import handler
+from engine import iclock
+from engine import ihandler
+from engine import isprite
+from engine import itimer
+from engine import menu
+from engine import render
+from engine import scene
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SCREEN_SIZE = (800, 600)
+FPS = 30
+MIN_RUN_TIME = 0.05
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.5
+
+_benchmarks = []
+
+
+def benchmark(a_name, *a_sizes):
+    """benchmark function is a decorator registering a benchmark setup
+    function for every given size (or once, without size, when none is
+    given). The setup function returns the callable to be measured.
+    """
+    def inner(a_setup):
+        """inner function registers the decorated setup function.
+        """
+        for l_size in a_sizes or (None,):
+            v_name = a_name if l_size is None else "{}[{}]".format(a_name, l_size)
+            _benchmarks.append((v_name, a_setup, l_size))
+        return a_setup
+    return inner
+
+
+# Benchmarks -- start --
+@benchmark("board_create", 8, 32, 64)
+def setup_board_create(a_screen, a_size):
+    """setup_board_create function measures creating a NxN board.
+    """
+    def run():
+        v_board = board.Board(0, 0, 8, 8)
+        v_board.create_default_board(a_size)
+    return run
+
+
+@benchmark("board_draw_cold", 8, 32, 64)
+def setup_board_draw_cold(a_screen, a_size):
+    """setup_board_draw_cold function measures drawing a NxN board after all
+    its tiles were invalidated.
+    """
+    v_board = board.Board(0, 0, 8, 8)
+    v_board.create_default_board(a_size)
+    v_board.draw(a_screen)
+
+    def run():
+        v_board.invalidate()
+        v_board.draw(a_screen)
+    return run
+
+
+@benchmark("board_draw_cached", 8, 32, 64)
+def setup_board_draw_cached(a_screen, a_size):
+    """setup_board_draw_cached function measures drawing a NxN board with all
+    its tiles cached.
+    """
+    v_board = board.Board(0, 0, 8, 8)
+    v_board.create_default_board(a_size)
+    v_board.draw(a_screen)
+
+    def run():
+        v_board.draw(a_screen)
+    return run
+
+
+def create_sprites(a_size):
+    """create_sprites function returns a DirtyGroup with the given number of
+    small sprites spread through the screen.
+    """
+    v_group = render.DirtyGroup()
+    for l_index in range(a_size):
+        v_position = pygame.Vector2((l_index * 13) % (SCREEN_SIZE[0] - 8), (l_index * 7) % (SCREEN_SIZE[1] - 8))
+        v_group.add(isprite.ISprite(a_position=v_position, a_width=8, a_length=8))
+    return v_group
+
+
+@benchmark("sprites_update", 100, 1000)
+def setup_sprites_update(a_screen, a_size):
+    """setup_sprites_update function measures moving N sprites and updating
+    their group.
+    """
+    v_group = create_sprites(a_size)
+    v_sprites = v_group.sprites()
+    v_step = [0]
+
+    def run():
+        v_step[0] = (v_step[0] + 1) % 2
+        for l_sprite in v_sprites:
+            l_sprite.set_position(l_sprite.position + pygame.Vector2(1 - 2 * v_step[0], 0))
+        v_group.update(FPS)
+    return run
+
+
+@benchmark("sprites_draw", 100, 1000)
+def setup_sprites_draw(a_screen, a_size):
+    """setup_sprites_draw function measures the renderer drawing N sprites
+    that moved since the last frame.
+    """
+    v_group = create_sprites(a_size)
+    v_sprites = v_group.sprites()
+    v_renderer = render.DirtyRenderer()
+    v_renderer.draw(a_screen, [v_group])
+    v_step = [0]
+
+    def run():
+        v_step[0] = (v_step[0] + 1) % 2
+        for l_sprite in v_sprites:
+            l_sprite.set_position(l_sprite.position + pygame.Vector2(1 - 2 * v_step[0], 0))
+        v_renderer.draw(a_screen, [v_group])
+    return run
+
+
+@benchmark("events", 100, 1000)
+def setup_events(a_screen, a_size):
+    """setup_events function measures notifying N events to a handler and
+    handling all of them.
+    """
+    v_handler = ihandler.IHandler()
+    v_handler.add_action("bench", lambda a_event: True)
+
+    def run():
+        for l_index in range(a_size):
+            v_handler.event_notifier(gevent.GEvent.acquire("action/top/bench", {"index": l_index}))
+        v_handler.handle_all_events()
+    return run
+
+
+@benchmark("timers", 100, 1000)
+def setup_timers(a_screen, a_size):
+    """setup_timers function measures ticking N repeating timers, with
+    different timeouts, for one frame.
+    """
+    v_clock = iclock.VirtualClock()
+    v_handler = ihandler.IHandler(a_clock=v_clock)
+    for l_index in range(a_size):
+        v_timer = itimer.Timer("timer/{}".format(l_index), 10 + l_index % 100, lambda: None, a_time=itimer.ALWAYS_TIME)
+        v_timer.activate()
+        v_handler.add_timer(v_timer)
+
+    def run():
+        v_clock.advance(1000 / FPS)
+        v_handler.tick_timers()
+    return run
+
+
+@benchmark("menu_draw", 10, 1000)
+def setup_menu_draw(a_screen, a_size):
+    """setup_menu_draw function measures redrawing a pop up menu with N
+    options.
+    """
+    v_menu = menu.PopUpMenu(pygame.Vector2(), ["option {}".format(l_index) for l_index in range(a_size)])
+
+    def run():
+        v_menu.draw()
+    return run
+
+
+@benchmark("menu_select", 10, 1000)
+def setup_menu_select(a_screen, a_size):
+    """setup_menu_select function measures moving the selection through a pop
+    up menu with N options, scrolling when required.
+    """
+    v_menu = menu.PopUpMenu(pygame.Vector2(), ["option {}".format(l_index) for l_index in range(a_size)])
+
+    def run():
+        v_menu.select((v_menu.selected + 1) % a_size)
+    return run
+
+
+@benchmark("scene_push_pop", 0, 100, 1000)
+def setup_scene_push_pop(a_screen, a_size):
+    """setup_scene_push_pop function measures activating and deactivating a
+    scene with N sprites on top of another one with N sprites in the game
+    handler.
+    """
+    v_handler = handler.GameHandler(iclock.VirtualClock())
+    v_bottom = scene.Scene(a_name="scene/bottom")
+    v_top = scene.Scene(a_name="scene/top")
+    v_bottom.sprites.add(*create_sprites(a_size).sprites())
+    v_top.sprites.add(*create_sprites(a_size).sprites())
+    v_handler.add_scene(v_bottom)
+    v_handler.add_scene(v_top)
+    v_handler.activate_this_scene(v_bottom)
+    v_handler.draw(a_screen)
+
+    def run():
+        v_handler.activate_this_scene(v_top)
+        v_handler.deactivate_this_scene(v_top)
+    return run
+# Benchmarks -- end --
+
+
+def measure(a_run, a_repeat=DEFAULT_REPEAT):
+    """measure function calls a_run enough times to take at least
+    MIN_RUN_TIME seconds, a_repeat times, and returns a dictionary with the
+    time per call, in microseconds.
+    """
+    v_number = 1
+    while True:
+        v_start = time.perf_counter()
+        for _ in range(v_number):
+            a_run()
+        v_elapsed = time.perf_counter() - v_start
+        if v_elapsed >= MIN_RUN_TIME:
+            break
+        v_number *= 2 if v_elapsed == 0 else max(2, min(10, int(MIN_RUN_TIME / v_elapsed) + 1))
+    v_times = [v_elapsed / v_number]
+    for _ in range(a_repeat - 1):
+        v_start = time.perf_counter()
+        for _ in range(v_number):
+            a_run()
+        v_times.append((time.perf_counter() - v_start) / v_number)
+    return {"min_us": min(v_times) * 1e6,
+            "median_us": statistics.median(v_times) * 1e6,
+            "number": v_number,
+            "repeat": a_repeat}
+
+
+def run_benchmarks(a_filter=None, a_repeat=DEFAULT_REPEAT):
+    """run_benchmarks function runs all benchmarks whose name contains
+    a_filter and returns the results dictionary.
+    """
+    pygame.init()
+    v_screen = pygame.display.set_mode(SCREEN_SIZE)
+    v_results = {}
+    for l_name, l_setup, l_size in _benchmarks:
+        if a_filter and a_filter not in l_name:
+            continue
+        v_results[l_name] = measure(l_setup(v_screen, l_size), a_repeat)
+    pygame.quit()
+    return {"python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "results": v_results}
+
+
+def compare(a_results, a_baseline, a_threshold=DEFAULT_THRESHOLD):
+    """compare function returns a list with (name, baseline, actual, ratio)
+    for every benchmark in both results, using the minimum time, and the list
+    of names slower than the baseline by more than a_threshold.
+    """
+    v_rows = []
+    v_regressions = []
+    for l_name, l_result in a_results["results"].items():
+        v_base = a_baseline["results"].get(l_name)
+        if v_base is None:
+            continue
+        v_ratio = l_result["min_us"] / v_base["min_us"] if v_base["min_us"] else 1.0
+        v_rows.append((l_name, v_base["min_us"], l_result["min_us"], v_ratio))
+        if v_ratio > a_threshold:
+            v_regressions.append(l_name)
+    return v_rows, v_regressions
+
+
+def format_comparison(a_rows, a_regressions):
+    """format_comparison function returns the comparison as a string.
+    """
+    v_lines = ["{:<28} {:>12} {:>12} {:>8}".format("benchmark", "baseline us", "actual us", "ratio")]
+    for l_name, l_base, l_actual, l_ratio in a_rows:
+        v_mark = "  REGRESSION" if l_name in a_regressions else ""
+        v_lines.append("{:<28} {:>12.2f} {:>12.2f} {:>8.2f}{}".format(l_name, l_base, l_actual, l_ratio, v_mark))
+    return "\n".join(v_lines)
+
+
+def main(a_args=None):
+    """main function parses the command line, runs the benchmarks, writes the
+    results and compares them against the baseline. It returns the process
+    exit status.
+    """
+    v_parser = argparse.ArgumentParser(description="dandelo engine benchmarks")
+    v_parser.add_argument("--output", help="file to write the JSON results (stdout by default)")
+    v_parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file to compare against")
+    v_parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    v_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="slowdown ratio reported as a regression")
+    v_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="number of measures for every benchmark")
+    v_parser.add_argument("--filter", help="run only benchmarks whose name contains this string")
+    v_args = v_parser.parse_args(a_args)
+
+    v_results = run_benchmarks(v_args.filter, v_args.repeat)
+    v_json = json.dumps(v_results, indent=2)
+    if v_args.output:
+        with open(v_args.output, "w") as v_file:
+            v_file.write(v_json + "\n")
+    else:
+        print(v_json)
+
+    if v_args.save_baseline:
+        with open(v_args.baseline, "w") as v_file:
+            v_file.write(v_json + "\n")
+        return 0
+    if not os.path.exists(v_args.baseline):
+        print("no baseline {}, store one with --save-baseline".format(v_args.baseline), file=sys.stderr)
+        return 0
+    with open(v_args.baseline) as v_file:
+        v_baseline = json.load(v_file)
+    v_rows, v_regressions = compare(v_results, v_baseline, v_args.threshold)
+    print(format_comparison(v_rows, v_regressions), file=sys.stderr)
+    return 1 if v_regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""engine package contains the game engine framework.
+
+Submodules are imported lazily the first time they are accessed as package
+attributes, so importing the package does not load pygame or NumPy.
+"""
+
+import importlib
+
+__all__ = [
+    "animation", "assets", "atlas", "board", "bobject", "camera", "dice", "ecs", "engine",
+    "equeue", "fonts", "gevent", "gobject", "grid", "handler", "iclock",
+    "icolors", "idefaults", "ihandler", "iobject", "isprite", "itimer",
+    "loading", "memory", "menu", "pathfinding", "preload", "profiler", "registry", "render", "scene",
+    "scheduler", "spatial", "startup", "support",
+]
+
+
+def __getattr__(a_name):
+    """__getattr__ function imports the engine submodule with the given name
+    the first time it is accessed.
+    """
+    if a_name in __all__:
+        return importlib.import_module("." + a_name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, a_name))
+
+
+def __dir__():
+    """__dir__ function returns all engine submodules.
+    """
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,210 @@
+"""animation.py module contains the animation controller that advances all
+animated sprites in one batched step.
+"""
+
+import numpy
+from . import idefaults
+
+
+class Clip:
+    """Clip class contains a named animation: the list of frames, the frame
+    rate and if it loops.
+    """
+
+    __slots__ = ("name", "frames", "rate", "loop")
+
+    def __init__(self, a_name, a_frames, a_rate, a_loop=True):
+        """__init__ method creates a new Clip instance.
+
+        - name attribute stores the clip name.
+
+        - frames list stores the frame surfaces.
+
+        - rate attribute stores the frames displayed per second.
+
+        - loop attribute stores if the clip starts again when it ends. Clips
+        not looping stay in the last frame.
+        """
+        self.name = a_name
+        self.frames = list(a_frames)
+        self.rate = a_rate
+        self.loop = a_loop
+
+
+class Animator:
+    """Animator class implements the animation controller shared by many
+    sprites. The state of every animated sprite is stored in NumPy arrays, so
+    all of them are advanced in one vectorized step, and only sprites whose
+    visible frame changed get a new image.
+
+    Clips are registered once by name and their frame rates, lengths and loop
+    flags are kept in per-clip tables.
+    """
+
+    def __init__(self, a_capacity=idefaults.DEFAULT_ANIMATION_CAPACITY):
+        """__init__ method creates a new Animator instance.
+
+        - clips list stores all Clip instances registered.
+
+        - clip_ids dictionary stores the clip index for every clip name.
+
+        - rates, lengths and loops arrays store the frame rate, number of
+        frames and loop flag for every clip.
+
+        - sprites list stores the sprite in every slot (None for free slots).
+
+        - slots dictionary stores the slot for every sprite.
+
+        - free list stores the slots released to be reused.
+
+        - clip, time, frame and playing arrays store, for every slot, the clip
+        playing, the seconds since it started, the frame displayed and if it
+        is still playing.
+
+        - callbacks dictionary stores the function to call when the one-shot
+        clip playing in a slot ends.
+        """
+        self.clips = []
+        self.clip_ids = {}
+        self.rates = numpy.zeros(0, dtype=numpy.float32)
+        self.lengths = numpy.zeros(0, dtype=numpy.int32)
+        self.loops = numpy.zeros(0, dtype=bool)
+        self.sprites = []
+        self.slots = {}
+        self.free = []
+        self.clip = numpy.zeros(a_capacity, dtype=numpy.int32)
+        self.time = numpy.zeros(a_capacity, dtype=numpy.float64)
+        self.frame = numpy.zeros(a_capacity, dtype=numpy.int32)
+        self.playing = numpy.zeros(a_capacity, dtype=bool)
+        self.callbacks = {}
+
+    def __len__(self):
+        """__len__ method returns the number of sprites animated.
+        """
+        return len(self.slots)
+
+    def __contains__(self, a_sprite):
+        """__contains__ method checks if the sprite is animated.
+        """
+        return a_sprite in self.slots
+
+    # Clip methods -- start --
+    def add_clip(self, a_clip):
+        """add_clip method registers a clip. Clips with a name already
+        registered are not replaced and the registered one is returned.
+        """
+        v_id = self.clip_ids.get(a_clip.name)
+        if v_id is not None:
+            return self.clips[v_id]
+        self.clip_ids[a_clip.name] = len(self.clips)
+        self.clips.append(a_clip)
+        self.rates = numpy.append(self.rates, numpy.float32(a_clip.rate))
+        self.lengths = numpy.append(self.lengths, numpy.int32(len(a_clip.frames)))
+        self.loops = numpy.append(self.loops, a_clip.loop)
+        return a_clip
+
+    def get_clip(self, a_name):
+        """get_clip method returns the clip registered with the given name or
+        None.
+        """
+        v_id = self.clip_ids.get(a_name)
+        return None if v_id is None else self.clips[v_id]
+    # Clip methods -- end --
+
+    # Sprite methods -- start --
+    def resize(self, a_capacity):
+        """resize method grows the slot arrays to the given capacity.
+        """
+        for l_name in ("clip", "time", "frame", "playing"):
+            v_array = getattr(self, l_name)
+            v_new = numpy.zeros(a_capacity, dtype=v_array.dtype)
+            v_new[:len(v_array)] = v_array
+            setattr(self, l_name, v_new)
+
+    def play(self, a_sprite, a_clip_name, a_on_end=None, a_restart=True):
+        """play method starts playing the given clip in the sprite, adding the
+        sprite to the animator when required. a_on_end is called, without
+        arguments, when a one-shot clip ends. When a_restart is False and
+        the clip is already playing, it keeps playing from the same frame.
+        """
+        v_clip_id = self.clip_ids[a_clip_name]
+        v_slot = self.slots.get(a_sprite)
+        if v_slot is None:
+            v_slot = self.free.pop() if self.free else len(self.sprites)
+            if v_slot == len(self.sprites):
+                self.sprites.append(a_sprite)
+                if v_slot >= len(self.clip):
+                    self.resize(len(self.clip) * 2)
+            else:
+                self.sprites[v_slot] = a_sprite
+            self.slots[a_sprite] = v_slot
+        elif not a_restart and self.clip[v_slot] == v_clip_id:
+            if a_on_end is not None:
+                self.callbacks[v_slot] = a_on_end
+            return False
+        self.clip[v_slot] = v_clip_id
+        self.time[v_slot] = 0.0
+        self.frame[v_slot] = 0
+        self.playing[v_slot] = True
+        if a_on_end is None:
+            self.callbacks.pop(v_slot, None)
+        else:
+            self.callbacks[v_slot] = a_on_end
+        a_sprite.image = self.clips[v_clip_id].frames[0]
+        return True
+
+    def stop(self, a_sprite):
+        """stop method removes the sprite from the animator. It keeps the
+        frame displayed.
+        """
+        v_slot = self.slots.pop(a_sprite, None)
+        if v_slot is None:
+            return False
+        self.sprites[v_slot] = None
+        self.playing[v_slot] = False
+        self.callbacks.pop(v_slot, None)
+        self.free.append(v_slot)
+        return True
+
+    def get_clip_name(self, a_sprite):
+        """get_clip_name method returns the name of the clip playing in the
+        sprite or None.
+        """
+        v_slot = self.slots.get(a_sprite)
+        return None if v_slot is None else self.clips[self.clip[v_slot]].name
+    # Sprite methods -- end --
+
+    def update(self, a_fps):
+        """update method advances all animations one frame of the engine,
+        1/a_fps seconds, in one vectorized step. Only sprites whose frame
+        changed get a new image, and callbacks for one-shot clips ended are
+        called after all sprites are updated.
+
+        It returns the number of sprites whose image changed.
+        """
+        v_count = len(self.sprites)
+        if v_count == 0:
+            return 0
+        v_playing = self.playing[:v_count]
+        v_slots = numpy.flatnonzero(v_playing)
+        if len(v_slots) == 0:
+            return 0
+        v_clips = self.clip[v_slots]
+        v_lengths = self.lengths[v_clips]
+        v_times = self.time[v_slots] + 1.0 / a_fps
+        v_frames = (v_times * self.rates[v_clips]).astype(numpy.int64)
+        v_loops = self.loops[v_clips]
+        v_ended = (~v_loops) & (v_frames >= v_lengths)
+        v_frames = numpy.where(v_loops, v_frames % numpy.maximum(v_lengths, 1), numpy.minimum(v_frames, v_lengths - 1))
+        self.time[v_slots] = v_times
+        v_changed = v_frames != self.frame[v_slots]
+        self.frame[v_slots] = v_frames
+        v_ended_slots = v_slots[v_ended]
+        self.playing[v_ended_slots] = False
+        for l_slot, l_clip, l_frame in zip(v_slots[v_changed].tolist(), v_clips[v_changed].tolist(), v_frames[v_changed].tolist()):
+            self.sprites[l_slot].image = self.clips[l_clip].frames[l_frame]
+        for l_slot in v_ended_slots.tolist():
+            v_callback = self.callbacks.pop(l_slot, None)
+            if v_callback is not None:
+                v_callback()
+        return int(numpy.count_nonzero(v_changed))
@@ -0,0 +1,322 @@
+"""assets.py module contains the asset manager shared by the whole process to
+load images only once.
+"""
+
+import os
+import re
+import pygame
+from . import idefaults
+from . import atlas
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga")
+
+
+def surface_bytes(a_surface):
+    """surface_bytes function returns the number of bytes used by the surface
+    pixels.
+    """
+    return a_surface.get_bytesize() * a_surface.get_width() * a_surface.get_height()
+
+
+def natural_key(a_path):
+    """natural_key function returns the key to sort paths with numbers in
+    natural order, so "2.png" goes before "10.png".
+    """
+    return [int(l_part) if l_part.isdigit() else l_part for l_part in re.split(r"(\d+)", a_path)]
+
+
+class AssetManager:
+    """AssetManager class implements a cache with all images loaded, indexed
+    by path. Images are loaded and converted lazily the first time they are
+    requested and every caller shares the same surface.
+
+    The cache is bounded by memory: when it goes over the budget the least
+    recently used images, and then atlases, not pinned by any owner are
+    evicted. Scenes pin the assets they use with preload (or get_atlas) and
+    release them with unload.
+    """
+
+    def __init__(self, a_max_bytes=idefaults.DEFAULT_ASSET_CACHE_BYTES):
+        """__init__ method creates a new AssetManager instance.
+
+        - max_bytes attribute stores the memory budget for all cached images.
+
+        - images dictionary stores the cached surface for every image path, in
+        least recently used order.
+
+        - sizes dictionary stores the bytes used by every cached image and
+        atlas.
+
+        - folders dictionary stores the sorted list of image paths for every
+        folder already listed.
+
+        - atlases dictionary stores the atlas built for every tuple of
+        folders, in least recently used order.
+
+        - owners dictionary stores the set of paths (and atlas keys) pinned by
+        every owner.
+
+        - pins dictionary stores the number of owners pinning every path or
+        atlas key.
+
+        - bytes attribute stores the bytes used by all cached images and
+        atlases.
+
+        - hits, misses and evictions attributes store cache statistics.
+        """
+        self.max_bytes = a_max_bytes
+        self.images = {}
+        self.sizes = {}
+        self.folders = {}
+        self.atlases = {}
+        self.owners = {}
+        self.pins = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """__len__ method returns the number of images cached.
+        """
+        return len(self.images)
+
+    def __contains__(self, a_path):
+        """__contains__ method checks if the image for the given path is
+        cached.
+        """
+        return os.path.normpath(a_path) in self.images
+
+    def decode(self, a_path):
+        """decode method reads and decodes the image file. It does not require
+        the display, so it can run in a worker thread.
+        """
+        return pygame.image.load(a_path)
+
+    def convert(self, a_image):
+        """convert method converts a decoded image to the display format when
+        the display exists. It has to run in the main thread.
+        """
+        if pygame.display.get_surface() is not None:
+            return a_image.convert_alpha()
+        return a_image
+
+    def load(self, a_path):
+        """load method loads the image from disk and converts it to the display
+        format. It can be overridden to load images from other sources.
+        """
+        return self.convert(self.decode(a_path))
+
+    def store(self, a_path, a_image):
+        """store method adds an image already loaded to the cache.
+        """
+        v_path = os.path.normpath(a_path)
+        if v_path in self.images:
+            self.bytes -= self.sizes[v_path]
+        self.images[v_path] = a_image
+        self.sizes[v_path] = surface_bytes(a_image)
+        self.bytes += self.sizes[v_path]
+        self.evict()
+        return a_image
+
+    def get_image(self, a_path):
+        """get_image method returns the shared surface for the given image
+        path, loading it the first time.
+        """
+        v_path = os.path.normpath(a_path)
+        v_image = self.images.pop(v_path, None)
+        if v_image is not None:
+            self.hits += 1
+            self.images[v_path] = v_image
+            return v_image
+        self.misses += 1
+        return self.store(v_path, self.load(v_path))
+
+    def list_folder(self, a_path):
+        """list_folder method returns the list with all image paths in the
+        given folder, in natural order. Folders are listed only once.
+        """
+        v_path = os.path.normpath(a_path)
+        v_files = self.folders.get(v_path)
+        if v_files is None:
+            v_files = []
+            for l_root, _, l_files in os.walk(v_path):
+                v_files.extend(os.path.join(l_root, l_file) for l_file in l_files
+                               if l_file.lower().endswith(IMAGE_EXTENSIONS))
+            v_files.sort(key=natural_key)
+            self.folders[v_path] = v_files
+        return v_files
+
+    def get_images(self, a_path):
+        """get_images method returns a list with the shared surfaces for all
+        images in the given folder, in natural order.
+        """
+        return [self.get_image(l_file) for l_file in self.list_folder(a_path)]
+
+    def get_atlas(self, a_paths, a_owner=None):
+        """get_atlas method returns the shared atlas with one animation for
+        every given folder, building it the first time. Frames are loaded
+        copied into the atlas, so they are only loaded when they are not
+        already cached as single images (like the ones preloaded).
+
+        Atlases are accounted in the memory budget like images. When an owner
+        is given, the atlas is pinned until the owner unloads it.
+        """
+        v_key = tuple(os.path.normpath(l_path) for l_path in a_paths)
+        if a_owner is not None:
+            self.pin(a_owner, [v_key])
+        v_atlas = self.atlases.pop(v_key, None)
+        if v_atlas is not None:
+            self.hits += 1
+            self.atlases[v_key] = v_atlas
+            return v_atlas
+        self.misses += 1
+        v_atlas = atlas.build_atlas(v_key, self.load_frames)
+        self.atlases[v_key] = v_atlas
+        self.sizes[v_key] = surface_bytes(v_atlas.surface)
+        self.bytes += self.sizes[v_key]
+        self.evict()
+        return v_atlas
+
+    def load_frames(self, a_path):
+        """load_frames method returns all images in the given folder, using
+        the cached ones without touching their LRU position.
+        """
+        return [self.images[l_file] if l_file in self.images else self.load(l_file)
+                for l_file in self.list_folder(a_path)]
+
+    def expand(self, a_paths):
+        """expand method returns all image paths for the given image and folder
+        paths.
+        """
+        v_files = []
+        for l_path in a_paths:
+            if os.path.isdir(l_path):
+                v_files.extend(self.list_folder(l_path))
+            else:
+                v_files.append(os.path.normpath(l_path))
+        return v_files
+
+    def preload(self, a_paths, a_owner=None):
+        """preload method loads all images for the given image and folder
+        paths. When an owner is given, images are pinned and they are not
+        evicted until the owner unloads them.
+        """
+        v_files = self.expand(a_paths)
+        if a_owner is not None:
+            self.pin(a_owner, v_files)
+        for l_file in v_files:
+            self.get_image(l_file)
+        return len(v_files)
+
+    def pin(self, a_owner, a_keys):
+        """pin method pins the given image paths or atlas keys for the owner,
+        so they are not evicted until the owner unloads them.
+        """
+        v_pinned = self.owners.setdefault(a_owner, set())
+        for l_key in a_keys:
+            if l_key not in v_pinned:
+                v_pinned.add(l_key)
+                self.pins[l_key] = self.pins.get(l_key, 0) + 1
+
+    def unload(self, a_owner):
+        """unload method releases all images and atlases pinned by the given
+        owner, so they can be evicted when the cache is over the memory
+        budget.
+        """
+        v_pinned = self.owners.pop(a_owner, None)
+        if v_pinned is None:
+            return False
+        for l_file in v_pinned:
+            self.pins[l_file] -= 1
+            if self.pins[l_file] == 0:
+                del self.pins[l_file]
+        self.evict()
+        return True
+
+    def evict(self):
+        """evict method removes least recently used images, and then atlases,
+        not pinned until the cache is inside the memory budget.
+        """
+        if self.max_bytes is None or self.bytes <= self.max_bytes:
+            return 0
+        v_evicted = 0
+        for l_path in list(self.images):
+            if self.bytes <= self.max_bytes:
+                break
+            if l_path in self.pins:
+                continue
+            self.discard(l_path)
+            v_evicted += 1
+        for l_key in list(self.atlases):
+            if self.bytes <= self.max_bytes:
+                break
+            if l_key in self.pins:
+                continue
+            self.discard_atlas(l_key)
+            v_evicted += 1
+        self.evictions += v_evicted
+        return v_evicted
+
+    def discard(self, a_path):
+        """discard method removes the image for the given path from the cache.
+        Surfaces already shared are kept alive by their users.
+        """
+        v_path = os.path.normpath(a_path)
+        if self.images.pop(v_path, None) is None:
+            return False
+        self.bytes -= self.sizes.pop(v_path)
+        return True
+
+    def discard_atlas(self, a_key):
+        """discard_atlas method removes the atlas for the given key from the
+        cache. Frames already shared are kept alive by their users.
+        """
+        if self.atlases.pop(a_key, None) is None:
+            return False
+        self.bytes -= self.sizes.pop(a_key)
+        return True
+
+    def clear(self):
+        """clear method removes all images, atlases and folder lists from the
+        cache.
+        """
+        self.images.clear()
+        self.sizes.clear()
+        self.folders.clear()
+        self.atlases.clear()
+        self.bytes = 0
+
+
+_manager = None
+
+
+def get_manager():
+    """get_manager function returns the asset manager shared by the whole
+    process, creating it the first time.
+    """
+    global _manager
+    if _manager is None:
+        _manager = AssetManager()
+    return _manager
+
+
+def get_image(a_path):
+    """get_image function returns the shared surface for the given image
+    path.
+    """
+    return get_manager().get_image(a_path)
+
+
+def get_images(a_path):
+    """get_images function returns the shared surfaces for all images in the
+    given folder.
+    """
+    return get_manager().get_images(a_path)
+
+
+def get_atlas(a_paths, a_owner=None):
+    """get_atlas function returns the shared atlas for the given animation
+    folders.
+    """
+    return get_manager().get_atlas(a_paths, a_owner)
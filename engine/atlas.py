@@ -0,0 +1,110 @@
+"""atlas.py module contains the sprite atlas, with many animation frames packed
+in a single surface.
+"""
+
+import math
+import os
+import pygame
+
+
+class Atlas:
+    """Atlas class implements a sprite atlas. All frames are packed in one
+    surface using shelves (rows of frames sorted by height), and every frame
+    is exposed as a subsurface sharing the atlas pixels.
+
+    Frames are grouped in named animations and the packing is deterministic:
+    the same frames always produce the same layout.
+    """
+
+    def __init__(self, a_animations, a_padding=1):
+        """__init__ method creates a new Atlas instance.
+
+        - a_animations argument is a dictionary with the list of frames for
+        every animation name.
+
+        - padding attribute stores the pixels left between frames.
+
+        - surface attribute stores the surface with all frames packed.
+
+        - rects dictionary stores the list of frame rectangles, in atlas
+        coordinates, for every animation name.
+
+        - frames dictionary stores the list of frame subsurfaces for every
+        animation name.
+        """
+        self.padding = a_padding
+        self.surface = None
+        self.rects = {}
+        self.frames = {}
+        self.pack(a_animations)
+
+    def __len__(self):
+        """__len__ method returns the number of frames in the atlas.
+        """
+        return sum(len(l_rects) for l_rects in self.rects.values())
+
+    def __contains__(self, a_name):
+        """__contains__ method checks if the atlas contains the given
+        animation.
+        """
+        return a_name in self.frames
+
+    def get_frames(self, a_name):
+        """get_frames method returns the list of frame subsurfaces for the
+        given animation.
+        """
+        return self.frames[a_name]
+
+    def get_rects(self, a_name):
+        """get_rects method returns the list of frame rectangles, in atlas
+        coordinates, for the given animation.
+        """
+        return self.rects[a_name]
+
+    def pack(self, a_animations):
+        """pack method packs all frames in the atlas surface. Frames are placed
+        by decreasing height (ties broken by animation name and frame index) in
+        shelves no wider than the square root of the total area.
+        """
+        v_entries = [(l_name, l_index, l_frame.get_size())
+                     for l_name in sorted(a_animations)
+                     for l_index, l_frame in enumerate(a_animations[l_name])]
+        v_entries.sort(key=lambda entry: (-entry[2][1], entry[0], entry[1]))
+        v_area = sum((l_size[0] + self.padding) * (l_size[1] + self.padding) for _, _, l_size in v_entries)
+        v_max_width = max([int(math.ceil(math.sqrt(v_area)))] + [l_size[0] + self.padding for _, _, l_size in v_entries])
+        v_positions = {}
+        v_x = v_y = v_shelf = v_width = 0
+        for l_name, l_index, (l_width, l_height) in v_entries:
+            if v_x + l_width > v_max_width:
+                v_x = 0
+                v_y += v_shelf + self.padding
+                v_shelf = 0
+            v_positions[(l_name, l_index)] = pygame.Rect(v_x, v_y, l_width, l_height)
+            v_x += l_width + self.padding
+            v_shelf = max(v_shelf, l_height)
+            v_width = max(v_width, v_x - self.padding)
+        v_size = (max(v_width, 1), max(v_y + v_shelf, 1))
+        self.surface = pygame.Surface(v_size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.rects = {}
+        self.frames = {}
+        for l_name in sorted(a_animations):
+            self.rects[l_name] = []
+            self.frames[l_name] = []
+            for l_index, l_frame in enumerate(a_animations[l_name]):
+                v_rect = v_positions[(l_name, l_index)]
+                # frames are copied without blending over the transparent atlas
+                self.surface.blit(l_frame, v_rect, special_flags=pygame.BLEND_RGBA_MAX)
+                self.rects[l_name].append(v_rect)
+                self.frames[l_name].append(self.surface.subsurface(v_rect))
+
+
+def build_atlas(a_paths, a_loader, a_padding=1):
+    """build_atlas function builds an atlas with one animation for every given
+    folder, named after the folder. a_loader is called with every folder and it
+    returns the list of frames in order.
+    """
+    v_animations = {os.path.basename(os.path.normpath(l_path)): a_loader(l_path) for l_path in a_paths}
+    return Atlas(v_animations, a_padding)
@@ -2,18 +2,29 @@
 """
 
 # import random
+import math
+import numpy
 import pygame
 from . import icolors
 from . import idefaults
 from . import gobject
 from . import isprite
+from . import grid
+from . import camera
+from . import spatial
+from . import pathfinding
 
 
 class Board(gobject.GObject):
     """Board class implements the board where the player will move and act.
+
+    Board cells are rendered in tiles (chunks of tile_size x tile_size
+    cells). Tiles are built lazily the first time they are visible in the
+    camera viewport and cached, so only tiles intersecting the viewport are
+    rendered and drawn.
     """
 
-    def __init__(self, a_x_origin, a_y_origin, a_cell_width, a_cell_length):
+    def __init__(self, a_x_origin, a_y_origin, a_cell_width, a_cell_length, a_tile_size=idefaults.DEFAULT_BOARD_TILE_SIZE, a_camera=None):
         """__init__method initializes a Board instance.
 
         - x_origin attribute stores the graphical X position where board
@@ -28,14 +39,38 @@ class Board(gobject.GObject):
         - cell_length attribute stores the length for any graphical cell in the
         board.
 
-        - cells list stores all board cells.
+        - grid attribute stores the Grid instance with all board cells.
 
-        - sprite_group pygame Group contains sprites for all cells in the
-        board.
+        - sprite attribute stores the BoardSprite where visible tiles are
+        composed.
 
         - size attribute contains the size for any square regular board (same
         width and length).
 
+        - tile_size attribute stores the number of cells in every side of a
+        board tile. Tiles are the unit rendered, cached and culled.
+
+        - tiles dictionary stores the cached surface for every tile already
+        built, in least recently used order.
+
+        - scaled_tiles dictionary stores the cached tile surfaces scaled to
+        the camera zoom.
+
+        - scaled_zoom attribute stores the zoom used for scaled_tiles.
+
+        - dirty_tiles set stores the tiles with cells that changed and have
+        to be rendered again.
+
+        - camera attribute stores the Camera used to translate board positions
+        to the screen. By default it displays the whole board at the board
+        origin.
+
+        - occupancy attribute stores the OccupancyIndex with all objects
+        placed in the board.
+
+        - pathfinder attribute stores the PathFinder used to search paths,
+        movement ranges and distance fields in the board.
+
         - notifier attribute keeps the callback to be used to notify events to
         the proper parent.
         """
@@ -44,21 +79,30 @@ class Board(gobject.GObject):
         self.y_origin = a_y_origin
         self.cell_width = a_cell_width
         self.cell_length = a_cell_length
-        self.cells = []
-        self.sprite = pygame.sprite.Group()
+        self.grid = None
+        self.sprite = None
         self.size = None
+        self.tile_size = a_tile_size
+        self.tiles = {}
+        self.scaled_tiles = {}
+        self.scaled_zoom = None
+        self.dirty_tiles = set()
+        self.camera = a_camera
+        self.occupancy = None
+        self.pathfinder = None
 
     def board_to_screen(self, a_position):
         """board_to_screen method translates some board coordinates to screen
         coordinates.
         """
-        return (a_position.x * self.cell_width + self.x_origin, a_position.y * self.cell_length + self.y_origin)
+        return self.camera.world_to_screen((a_position.x * self.cell_width, a_position.y * self.cell_length))
 
     def screen_to_board(self, a_position):
         """screen_to_board method translates some screen coordinates to board
         coordinates.
         """
-        return ((a_position.x - self.x_origin) / self.width, (a_position.y - self.y_origin) / self.length)
+        v_x, v_y = self.camera.screen_to_world((a_position.x, a_position.y))
+        return (v_x / self.cell_width, v_y / self.cell_length)
 
     def in_bounds(self, a_position):
         """in_bounds method checks if the given board coordinates are inside
@@ -75,90 +119,436 @@ class Board(gobject.GObject):
 
     def create_default_board(self, a_number_of_cells=8):
         """create_default_board method creates a default square board with the
-        given ratio.
+        given ratio. No tile is rendered until it is visible.
         """
         self.size = a_number_of_cells
-        for row in range(a_number_of_cells):
-            for column in range(a_number_of_cells):
-                cell_spec = {
-                        "x": row,
-                        "y": column,
-                        "color": icolors.BLUE,
-                        # "color": random.choice([colors.BLACK, colors.RED, colors.GREEN, colors.BLUE, colors.WHITE]),
-                        "gx": self.x_origin + self.cell_width * row,
-                        "gy": self.y_origin + self.cell_length * column,
-                        "width": self.cell_width,
-                        "length": self.cell_length,
-                        "border": 0,
-                        }
-                cell = BCell(cell_spec)
-                self.cells.append(cell)
-                self.sprite.add(cell.gcell)
+        # "color": random.choice([colors.BLACK, colors.RED, colors.GREEN, colors.BLUE, colors.WHITE]),
+        self.grid = grid.Grid(self.size, self.size, color=icolors.BLUE, border=0)
+        self.grid.add_listener(self.on_grid_change)
+        self.occupancy = spatial.OccupancyIndex(self.grid)
+        self.pathfinder = pathfinding.PathFinder(self.grid)
+        self.tiles.clear()
+        self.scaled_tiles.clear()
+        self.dirty_tiles.clear()
+        if self.camera is None:
+            self.camera = camera.Camera((self.x_origin, self.y_origin, self.cell_width * self.size, self.cell_length * self.size))
+        self.camera.add_listener(self.on_camera_change)
+        self.sprite = BoardSprite(a_board=self,
+            a_position=pygame.Vector2(self.get_view_rect().topleft),
+            a_width=self.get_view_rect().width,
+            a_length=self.get_view_rect().height)
+
+    def is_blocked(self, a_position, a_object=None):
+        """is_blocked method checks if the given board coordinates can not be
+        entered: they are outside the board, the cell is flagged as blocked
+        or another blocking object is placed there. a_object is the object
+        moving, which is ignored.
+        """
+        if self.out_of_bounds(a_position):
+            return True
+        v_x, v_y = int(a_position.x), int(a_position.y)
+        if self.grid.cells["flags"][v_x, v_y] & grid.FLAG_BLOCKED:
+            return True
+        for l_object in self.occupancy.at(v_x, v_y):
+            if l_object is not a_object and getattr(l_object, "blocking", False):
+                return True
+        return False
+
+    # Occupancy methods -- start --
+    def place_object(self, a_object, a_position):
+        """place_object method places (or moves) an object in the given board
+        coordinates.
+        """
+        return self.occupancy.place(a_object, a_position.x, a_position.y)
+
+    def remove_object(self, a_object):
+        """remove_object method removes an object from the board.
+        """
+        return self.occupancy.remove(a_object)
+
+    def get_objects_at(self, a_position):
+        """get_objects_at method returns all objects placed in the given
+        board coordinates.
+        """
+        return self.occupancy.at(int(a_position.x), int(a_position.y))
+
+    def get_objects_in_rect(self, a_x, a_y, a_width, a_length):
+        """get_objects_in_rect method returns all objects placed in the given
+        rectangle of cells.
+        """
+        return self.occupancy.in_rect(a_x, a_y, a_width, a_length)
+
+    def get_objects_in_radius(self, a_position, a_radius):
+        """get_objects_in_radius method returns all objects placed at the
+        given distance (in cells) or lower from the given board coordinates.
+        """
+        return self.occupancy.in_radius(int(a_position.x), int(a_position.y), a_radius)
+    # Occupancy methods -- end --
+
+    def get_cell(self, a_x, a_y):
+        """get_cell method returns a BCell view for the cell at the given
+        board coordinates.
+        """
+        return BCell(self.grid, a_x, a_y)
+
+    def update_cell(self, a_x, a_y, **kwargs):
+        """update_cell method changes the given cell fields (like "color" and
+        "border"). Tiles containing the cell are rendered again in the next
+        frame.
+        """
+        self.grid.set_cell(a_x, a_y, **kwargs)
+
+    def on_grid_change(self, a_rect, a_fields, a_mask=None):
+        """on_grid_change method is called by the grid when cells change and
+        it invalidates all tiles with cells whose color or border changed.
+        """
+        if "color" not in a_fields and "border" not in a_fields:
+            return
+        v_first_x, v_first_y = a_rect.left // self.tile_size, a_rect.top // self.tile_size
+        v_last_x, v_last_y = (a_rect.right - 1) // self.tile_size, (a_rect.bottom - 1) // self.tile_size
+        for l_tile_x in range(v_first_x, v_last_x + 1):
+            for l_tile_y in range(v_first_y, v_last_y + 1):
+                if a_mask is not None:
+                    v_x = l_tile_x * self.tile_size - a_rect.left
+                    v_y = l_tile_y * self.tile_size - a_rect.top
+                    v_tile_mask = a_mask[max(v_x, 0):v_x + self.tile_size, max(v_y, 0):v_y + self.tile_size]
+                    if not v_tile_mask.any():
+                        continue
+                self.invalidate_tile((l_tile_x, l_tile_y))
+
+    def on_camera_change(self):
+        """on_camera_change method is called by the camera when it scrolls or
+        zooms, and it composes again the visible tiles and moves the sprites
+        for all objects placed in the board.
+        """
+        if self.sprite is None:
+            return
+        self.sprite.set_view(self.get_view_rect())
+        for l_object in self.occupancy.positions:
+            l_object.sync_sprite_position()
+
+    def invalidate_tile(self, a_tile):
+        """invalidate_tile method drops the cached surfaces for the given tile
+        and marks it to be rendered again, even when it is not cached,
+        because it could be displayed in the board sprite.
+        """
+        self.tiles.pop(a_tile, None)
+        self.scaled_tiles.pop(a_tile, None)
+        self.dirty_tiles.add(a_tile)
+
+    def invalidate_cell(self, a_x, a_y):
+        """invalidate_cell method marks the tile containing the given cell to
+        be rendered again.
+        """
+        self.invalidate_tile((a_x // self.tile_size, a_y // self.tile_size))
+
+    def invalidate(self):
+        """invalidate method marks all board tiles to be rendered again.
+        """
+        for l_tile in list(self.tiles):
+            self.invalidate_tile(l_tile)
+
+    def get_tile_rect(self, a_tile):
+        """get_tile_rect method returns the rectangle, in world coordinates,
+        covered by the given tile.
+        """
+        v_tile_x, v_tile_y = a_tile
+        v_width = self.tile_size * self.cell_width
+        v_length = self.tile_size * self.cell_length
+        v_rect = pygame.Rect(v_tile_x * v_width, v_tile_y * v_length, v_width, v_length)
+        return v_rect.clip(0, 0, self.size * self.cell_width, self.size * self.cell_length)
+
+    def get_view_rect(self):
+        """get_view_rect method returns the screen rectangle where the board
+        is visible, it is the camera viewport clipped to the board.
+        """
+        v_board_rect = self.camera.world_rect_to_screen(pygame.Rect(0, 0, self.size * self.cell_width, self.size * self.cell_length))
+        return v_board_rect.clip(self.camera.viewport)
+
+    def get_visible_tiles(self, a_world_rect=None):
+        """get_visible_tiles method returns all tiles intersecting the camera
+        viewport, or the given world rectangle.
+        """
+        v_tile_width = self.tile_size * self.cell_width
+        v_tile_length = self.tile_size * self.cell_length
+        v_last = (self.size - 1) // self.tile_size
+        v_rect = self.camera.get_world_rect() if a_world_rect is None else a_world_rect
+        v_first_x, v_first_y = max(v_rect.left // v_tile_width, 0), max(v_rect.top // v_tile_length, 0)
+        v_last_x, v_last_y = min(v_rect.right // v_tile_width, v_last), min(v_rect.bottom // v_tile_length, v_last)
+        return [(l_x, l_y) for l_x in range(v_first_x, v_last_x + 1) for l_y in range(v_first_y, v_last_y + 1)]
+
+    def get_view_shift(self, a_scroll, a_zoom):
+        """get_view_shift method returns the (x, y) screen distance all tiles
+        moved since the camera had the given scroll and zoom, or None when
+        tiles can not be moved as a whole, because the zoom changed or
+        because tile edges are rounded to different pixels.
+        """
+        if a_zoom != self.camera.zoom:
+            return None
+        v_shift = []
+        for l_old, l_new, l_origin, l_cell in ((a_scroll.x, self.camera.scroll.x, self.camera.viewport.x, self.cell_width),
+                                               (a_scroll.y, self.camera.scroll.y, self.camera.viewport.y, self.cell_length)):
+            v_delta = (l_old - l_new) * a_zoom
+            v_tile = self.tile_size * l_cell * a_zoom
+            v_board = self.size * l_cell * a_zoom
+            if v_delta != int(v_delta) and (v_tile != int(v_tile) or v_board != int(v_board)):
+                return None
+            v_shift.append(math.floor(l_origin - l_new * a_zoom) - math.floor(l_origin - l_old * a_zoom))
+        return tuple(v_shift)
+
+    def get_tile_surface(self, a_tile):
+        """get_tile_surface method returns the cached surface for the given
+        tile at the camera zoom, building it when it is not cached.
+        """
+        v_surface = self.tiles.pop(a_tile, None)
+        if v_surface is None:
+            v_surface = self.render_tile(a_tile)
+            self.scaled_tiles.pop(a_tile, None)
+        self.tiles[a_tile] = v_surface
+        if self.camera.zoom == 1:
+            return v_surface
+        if self.scaled_zoom != self.camera.zoom:
+            self.scaled_tiles.clear()
+            self.scaled_zoom = self.camera.zoom
+        v_size = self.camera.world_rect_to_screen(self.get_tile_rect(a_tile)).size
+        v_scaled = self.scaled_tiles.get(a_tile)
+        if v_scaled is None or v_scaled.get_size() != v_size:
+            v_scaled = pygame.transform.scale(v_surface, v_size)
+            self.scaled_tiles[a_tile] = v_scaled
+        return v_scaled
+
+    def trim_tiles(self):
+        """trim_tiles method drops the least recently used tiles not visible
+        when there are more cached tiles than the cache size. The cache is
+        never smaller than the number of visible tiles.
+        """
+        v_extra = len(self.tiles) - idefaults.DEFAULT_BOARD_TILE_CACHE
+        if v_extra <= 0:
+            return
+        v_visible = set(self.get_visible_tiles())
+        v_extra = len(self.tiles) - max(idefaults.DEFAULT_BOARD_TILE_CACHE, len(v_visible))
+        for l_tile in [l_tile for l_tile in self.tiles if l_tile not in v_visible][:max(v_extra, 0)]:
+            del self.tiles[l_tile]
+            self.scaled_tiles.pop(l_tile, None)
+
+    def render_tile(self, a_tile):
+        """render_tile method returns a new surface with all cells in the
+        given tile rendered. Cell pixels are computed for the whole tile at
+        once from the grid arrays.
+        """
+        v_tile_x, v_tile_y = a_tile
+        v_first_x = v_tile_x * self.tile_size
+        v_first_y = v_tile_y * self.tile_size
+        v_cells = self.grid.cells[v_first_x:v_first_x + self.tile_size, v_first_y:v_first_y + self.tile_size]
+        v_width, v_length = v_cells.shape
+        v_surface = pygame.Surface((v_width * self.cell_width, v_length * self.cell_length))
+        pygame.surfarray.blit_array(v_surface, self.rasterize_cells(v_cells))
+        return v_surface
+
+    def rasterize_cells(self, a_cells):
+        """rasterize_cells method returns a [x, y, rgb] pixel array for the
+        given cells array.
+
+        Cells with border 0 are filled with their color and outlined with the
+        default sprite color, any other cell displays only a border with the
+        given width.
+        """
+        v_colors = numpy.repeat(numpy.repeat(a_cells["color"], self.cell_width, axis=0), self.cell_length, axis=1)
+        v_borders = numpy.repeat(numpy.repeat(a_cells["border"], self.cell_width, axis=0), self.cell_length, axis=1)
+        v_edge_x = numpy.arange(self.cell_width)
+        v_edge_x = numpy.minimum(v_edge_x, self.cell_width - 1 - v_edge_x)
+        v_edge_y = numpy.arange(self.cell_length)
+        v_edge_y = numpy.minimum(v_edge_y, self.cell_length - 1 - v_edge_y)
+        v_edge = numpy.tile(numpy.minimum.outer(v_edge_x, v_edge_y), a_cells.shape)
+        v_in_border = v_edge < numpy.where(v_borders == 0, 1, v_borders)
+        v_show_color = (v_borders == 0) != v_in_border
+        return numpy.where(v_show_color[..., None], v_colors, numpy.array(idefaults.DEFAULT_SPRITE_COLOR, dtype=numpy.uint8))
+
+    def render_visible_tiles(self, a_surface, a_view_rect, a_tiles=None):
+        """render_visible_tiles method blits the given tiles (all visible
+        tiles by default) into the surface, which covers the given screen
+        view rectangle. It returns the list of rectangles, in surface
+        coordinates, that were drawn.
+        """
+        v_rects = []
+        v_tiles = self.get_visible_tiles() if a_tiles is None else a_tiles
+        for l_tile in v_tiles:
+            v_rect = self.camera.world_rect_to_screen(self.get_tile_rect(l_tile))
+            v_rect.move_ip(-a_view_rect.x, -a_view_rect.y)
+            v_rects.append(a_surface.blit(self.get_tile_surface(l_tile), v_rect))
+        self.trim_tiles()
+        return v_rects
+
+    def render_view_area(self, a_surface, a_view_rect, a_area):
+        """render_view_area method draws again the given area, in surface
+        coordinates, of the surface covering the given screen view rectangle.
+        Only tiles intersecting the area are blitted.
+        """
+        v_left, v_top = self.camera.screen_to_world((a_area.x + a_view_rect.x, a_area.y + a_view_rect.y))
+        v_world_rect = pygame.Rect(math.floor(v_left), math.floor(v_top),
+                                   math.ceil(a_area.width / self.camera.zoom) + 1,
+                                   math.ceil(a_area.height / self.camera.zoom) + 1)
+        a_surface.set_clip(a_area)
+        a_surface.fill(icolors.WHITE)
+        self.render_visible_tiles(a_surface, a_view_rect, self.get_visible_tiles(v_world_rect))
+        a_surface.set_clip(None)
+
+    def refresh(self):
+        """refresh method renders again all invalidated tiles that are
+        visible and marks those areas as dirty to be redrawn. Invalidated
+        tiles not visible are rendered when they become visible.
+        """
+        if not self.dirty_tiles or self.sprite is None:
+            return False
+        v_tiles = [l_tile for l_tile in self.get_visible_tiles() if l_tile in self.dirty_tiles]
+        self.dirty_tiles.clear()
+        for l_rect in self.render_visible_tiles(self.sprite.image, self.sprite.rect, v_tiles):
+            self.sprite.mark_dirty(l_rect)
+        return True
 
     def draw(self, a_screen):
-        """draw method draws all board cells in the surface.
+        """draw method draws the visible board tiles in the screen.
         """
-        self.sprite.draw(a_screen)
+        self.refresh()
+        a_screen.blit(self.sprite.image, self.sprite.rect)
 
 
 class BCell:
-    """BCell class implements the cells that will be in a board.
+    """BCell class implements a lightweight view of one cell in the board
+    grid. Reading any attribute reads the grid arrays and setting it updates
+    the grid, which notifies the board.
     """
 
-    def __init__(self, a_specs):
+    __slots__ = ("grid", "x", "y")
+
+    def __init__(self, a_grid, a_x, a_y):
         """__init__ method initializes a BCell instance.
+
+        - grid attribute stores the Grid instance containing the cell.
+
+        - x attribute stores the cell X board coordinate.
+
+        - y attribute stores the cell Y board coordinate.
         """
-        self.x = a_specs.get("x", 0)
-        self.y = a_specs.get("y", 0)
-        self.color = a_specs.get("color", icolors.BLACK)
-        self.gx = a_specs.get("gx", 0)
-        self.gy = a_specs.get("gy", 0)
-        self.gwidth = a_specs.get("width", idefaults.DEFAULT_WIDTH)
-        self.glength = a_specs.get("length", idefaults.DEFAULT_LENGTH)
-        self.gborder = a_specs.get("border", 1)
-        self.gcell = GCell(a_foreground_color=self.color,
-            a_position=pygame.Vector2(self.gx, self.gy),
-            a_width=self.gwidth,
-            a_length=self.glength,
-            a_border=self.gborder)
-
-
-class GCell(isprite.ISprite):
-    """GCell class implements the cells that will be displayed in a graphical
-    board.
-    """
+        self.grid = a_grid
+        self.x = a_x
+        self.y = a_y
 
-    def __init__(self, **kwargs):
-        """__init__ method initializes a GCell instance.
+    @property
+    def color(self):
+        """color property returns the cell color.
+        """
+        return tuple(int(l_value) for l_value in self.grid.get(self.x, self.y, "color"))
+
+    @color.setter
+    def color(self, a_color):
+        """color setter property sets the cell color.
+        """
+        self.grid.set_cell(self.x, self.y, color=a_color)
+
+    @property
+    def border(self):
+        """border property returns the cell border width.
+        """
+        return int(self.grid.get(self.x, self.y, "border"))
+
+    @border.setter
+    def border(self, a_border):
+        """border setter property sets the cell border width.
+        """
+        self.grid.set_cell(self.x, self.y, border=a_border)
+
+    @property
+    def terrain(self):
+        """terrain property returns the cell terrain identifier.
+        """
+        return int(self.grid.get(self.x, self.y, "terrain"))
+
+    @terrain.setter
+    def terrain(self, a_terrain):
+        """terrain setter property sets the cell terrain identifier.
+        """
+        self.grid.set_cell(self.x, self.y, terrain=a_terrain)
 
-        - x attribute stores the graphical X position where cell sprite should
-        be displayed.
+    @property
+    def flags(self):
+        """flags property returns the cell bit flags.
+        """
+        return int(self.grid.get(self.x, self.y, "flags"))
 
-        - y attribute stores the graphical Y position where cell sprite should
-        be displayed.
+    @flags.setter
+    def flags(self, a_flags):
+        """flags setter property sets the cell bit flags.
+        """
+        self.grid.set_cell(self.x, self.y, flags=a_flags)
 
-        - width attribute stores the cell sprite width.
+    @property
+    def occupancy(self):
+        """occupancy property returns the number of objects in the cell.
+        """
+        return int(self.grid.get(self.x, self.y, "occupancy"))
 
-        - length attribute stores the cell sprite length.
 
-        - color attribute stores the pygame Color to be used to display the
-        cell sprite.
+class BoardSprite(isprite.ISprite):
+    """BoardSprite class implements the sprite covering the visible part of
+    the board, where the visible tiles are composed.
+    """
 
-        - border attribute stores if the cell sprite board (0 means it is
-        filled with the color).
+    def __init__(self, **kwargs):
+        """__init__ method initializes a BoardSprite instance.
 
-        - image pygame Surface instance is a derived attribute where the
-        pygame Surface used to display the cell sprite is stored.
+        - board attribute stores the Board instance rendered in the sprite.
 
-        - rect pygame Rectangle instance is a derived attribute where the
-        surface rectangle used to display the cell sprite is stored.
+        - scroll attribute stores the camera scroll when the sprite surface
+        was composed, or None when it was never composed.
+
+        - zoom attribute stores the camera zoom when the sprite surface was
+        composed.
         """
+        self.board = kwargs.get("a_board")
+        self.scroll = None
+        self.zoom = None
         super().__init__(**kwargs)
 
     def draw_sprite(self, a_screen):
-        """draw method draws the cell board in the surface.
+        """draw_sprite method composes all visible tiles in the sprite
+        surface.
+        """
+        self.board.render_visible_tiles(a_screen, pygame.Rect(self.position, a_screen.get_size()))
+
+    def set_view(self, a_view_rect):
+        """set_view method places the sprite in the given screen rectangle and
+        composes the visible tiles again. When the camera only scrolled, the
+        surface is moved and only tiles in the uncovered areas are drawn.
+        """
+        v_shift = None
+        if self.scroll is not None and self.image.get_size() == a_view_rect.size:
+            v_shift = self.board.get_view_shift(self.scroll, self.zoom)
+        if v_shift is not None:
+            v_dx = v_shift[0] - (a_view_rect.x - self.rect.x)
+            v_dy = v_shift[1] - (a_view_rect.y - self.rect.y)
+            if abs(v_dx) >= a_view_rect.width or abs(v_dy) >= a_view_rect.height:
+                v_shift = None
+        if self.image.get_size() != a_view_rect.size:
+            self.image = pygame.Surface(a_view_rect.size)
+            self.rect.size = a_view_rect.size
+        self.set_position(a_view_rect.topleft)
+        if v_shift is None:
+            self.image.fill(icolors.WHITE)
+            self.draw_sprite(self.image)
+        elif v_dx or v_dy:
+            self.image.scroll(v_dx, v_dy)
+            v_width, v_length = a_view_rect.size
+            if v_dx:
+                self.board.render_view_area(self.image, self.rect, pygame.Rect(0 if v_dx > 0 else v_width + v_dx, 0, abs(v_dx), v_length))
+            if v_dy:
+                self.board.render_view_area(self.image, self.rect, pygame.Rect(0, 0 if v_dy > 0 else v_length + v_dy, v_width, abs(v_dy)))
+        self.scroll = pygame.Vector2(self.board.camera.scroll)
+        self.zoom = self.board.camera.zoom
+        self.mark_dirty()
+
+    def update(self, a_fps):
+        """update method is called by the sprite group and it renders again
+        any visible board tile that changed.
         """
-        rect = (0, 0, self.width, self.length)
-        pygame.draw.rect(a_screen, self.foreground_color, rect, self.border)
-        if self.border == 0:
-            pygame.draw.rect(a_screen, self.background_color, rect, 1)
+        self.board.refresh()
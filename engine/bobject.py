@@ -11,6 +11,8 @@ class BObject(gobject.GObject):
     object contained in a game board.
     """
 
+    __slots__ = ("board_position", "board", "board_to_screen", "out_of_bounds", "blocking")
+
     def __init__(self, **kwargs):
         """___init__ method creates a new BObject instance.
 
@@ -22,11 +24,23 @@ class BObject(gobject.GObject):
 
         - out_of_bounds function checks if a board object is inside or outside
         the board.
+
+        - board attribute stores the optional Board instance where the object
+        is placed. When it is given, board_to_screen and out_of_bounds default
+        to the board ones, and the board occupancy index is updated every
+        time the object moves.
+
+        - blocking attribute stores if the object blocks other objects to
+        enter in the same cell.
         """
         super().__init__(**kwargs)
         self.board_position = kwargs.get("a_board_position", pygame.Vector2())
-        self.board_to_screen = kwargs.get("a_board_to_screen", None)
-        self.out_of_bounds = kwargs.get("a_out_of_bounds", None)
+        self.board = kwargs.get("a_board", None)
+        self.board_to_screen = kwargs.get("a_board_to_screen", self.board.board_to_screen if self.board else None)
+        self.out_of_bounds = kwargs.get("a_out_of_bounds", self.board.out_of_bounds if self.board else None)
+        self.blocking = kwargs.get("a_blocking", False)
+        if self.board:
+            self.board.place_object(self, self.board_position)
 
     @property
     def position(self):
@@ -48,4 +62,23 @@ class BObject(gobject.GObject):
         position.
         """
         self.board_position = a_position
+        if self.board:
+            self.board.place_object(self, a_position)
         _ = self.position
+
+    def can_move_to(self, a_position):
+        """can_move_to method checks if the object can move to the given board
+        position.
+        """
+        if self.board:
+            return not self.board.is_blocked(a_position, self)
+        if self.out_of_bounds:
+            return not self.out_of_bounds(a_position)
+        return True
+
+    def sync_sprite_position(self):
+        """sync_sprite_position method places the object sprite in the actual
+        screen position, like when the board camera scrolls or zooms.
+        """
+        if self.sprite:
+            self.sprite.set_position(self.position)
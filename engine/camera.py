@@ -0,0 +1,117 @@
+"""camera.py module contains the camera used to display a part of a large
+world (like a board) in a screen viewport.
+"""
+
+import math
+import pygame
+
+
+class Camera:
+    """Camera class implements a scrollable and zoomable view of the world.
+
+    World coordinates are pixels in the world at zoom 1. Screen coordinates
+    are pixels in the display.
+    """
+
+    def __init__(self, a_viewport, a_zoom=1.0):
+        """__init__ method creates a new Camera instance.
+
+        - viewport attribute stores the pygame Rect in the screen where the
+        world is displayed.
+
+        - scroll attribute stores the world position displayed at the
+        viewport top-left corner.
+
+        - zoom attribute stores the scale factor from world to screen.
+
+        - listeners list stores callbacks to be called every time the camera
+        scrolls or zooms.
+        """
+        self.viewport = pygame.Rect(a_viewport)
+        self.scroll = pygame.Vector2()
+        self.zoom = a_zoom
+        self.listeners = []
+
+    def add_listener(self, a_callback):
+        """add_listener method adds a callback to be called when the camera
+        changes.
+        """
+        if a_callback in self.listeners:
+            return False
+        self.listeners.append(a_callback)
+        return True
+
+    def remove_listener(self, a_callback):
+        """remove_listener method removes a callback added with
+        add_listener.
+        """
+        if a_callback not in self.listeners:
+            return False
+        self.listeners.remove(a_callback)
+        return True
+
+    def notify(self):
+        """notify method calls all listeners because the camera changed.
+        """
+        for l_callback in self.listeners:
+            l_callback()
+
+    def world_to_screen(self, a_position):
+        """world_to_screen method translates world coordinates to screen
+        coordinates.
+        """
+        return ((a_position[0] - self.scroll.x) * self.zoom + self.viewport.x,
+                (a_position[1] - self.scroll.y) * self.zoom + self.viewport.y)
+
+    def screen_to_world(self, a_position):
+        """screen_to_world method translates screen coordinates to world
+        coordinates.
+        """
+        return ((a_position[0] - self.viewport.x) / self.zoom + self.scroll.x,
+                (a_position[1] - self.viewport.y) / self.zoom + self.scroll.y)
+
+    def world_rect_to_screen(self, a_rect):
+        """world_rect_to_screen method translates a world rectangle to the
+        screen rectangle where it is displayed. Edges are floored, so
+        adjacent world rectangles do not overlap or leave gaps.
+        """
+        v_left, v_top = self.world_to_screen(a_rect.topleft)
+        v_right, v_bottom = self.world_to_screen(a_rect.bottomright)
+        v_left, v_top = math.floor(v_left), math.floor(v_top)
+        return pygame.Rect(v_left, v_top, math.floor(v_right) - v_left, math.floor(v_bottom) - v_top)
+
+    def get_world_rect(self):
+        """get_world_rect method returns the world rectangle visible in the
+        viewport.
+        """
+        return pygame.Rect(math.floor(self.scroll.x), math.floor(self.scroll.y),
+                           math.ceil(self.viewport.width / self.zoom) + 1,
+                           math.ceil(self.viewport.height / self.zoom) + 1)
+
+    def scroll_to(self, a_position):
+        """scroll_to method sets the world position displayed at the viewport
+        top-left corner.
+        """
+        self.scroll = pygame.Vector2(a_position)
+        self.notify()
+
+    def scroll_by(self, a_dx, a_dy):
+        """scroll_by method moves the camera the given world distance.
+        """
+        self.scroll_to(self.scroll + pygame.Vector2(a_dx, a_dy))
+
+    def center_on(self, a_position):
+        """center_on method scrolls the camera to display the given world
+        position at the viewport center.
+        """
+        v_half = pygame.Vector2(self.viewport.size) / (2 * self.zoom)
+        self.scroll_to(pygame.Vector2(a_position) - v_half)
+
+    def set_zoom(self, a_zoom):
+        """set_zoom method sets a new zoom factor.
+        """
+        if a_zoom <= 0 or a_zoom == self.zoom:
+            return False
+        self.zoom = a_zoom
+        self.notify()
+        return True
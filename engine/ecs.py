@@ -0,0 +1,347 @@
+"""ecs.py module contains an optional entity-component-system layer, used to
+process thousands of game entities in batched NumPy passes.
+
+Entities are integer identifiers. Every component type is stored in one
+contiguous NumPy array indexed by entity, with a boolean mask for the
+entities that have it. Systems process all entities with the components
+they require at once, instead of calling a method for every object.
+"""
+
+import numpy
+import pygame
+from . import idefaults
+
+ANIMATION_DTYPE = numpy.dtype([
+    ("index", numpy.float32),
+    ("frames", numpy.int32),
+    ("speed", numpy.float32),
+])
+
+
+class ComponentStore:
+    """ComponentStore class stores one component type for all entities.
+    """
+
+    def __init__(self, a_name, a_dtype, a_shape=(), a_capacity=idefaults.DEFAULT_ECS_CAPACITY):
+        """__init__ method creates a new ComponentStore instance.
+
+        - name attribute stores the component name.
+
+        - data attribute stores the NumPy array with the component value for
+        every entity, indexed by entity.
+
+        - mask attribute stores the boolean NumPy array with the entities that
+        have the component.
+        """
+        self.name = a_name
+        self.data = numpy.zeros((a_capacity,) + tuple(a_shape), dtype=a_dtype)
+        self.mask = numpy.zeros(a_capacity, dtype=bool)
+
+    def __len__(self):
+        """__len__ method returns the number of entities with the component.
+        """
+        return int(numpy.count_nonzero(self.mask))
+
+    def resize(self, a_capacity):
+        """resize method grows the arrays to the given capacity.
+        """
+        v_data = numpy.zeros((a_capacity,) + self.data.shape[1:], dtype=self.data.dtype)
+        v_data[:len(self.data)] = self.data
+        v_mask = numpy.zeros(a_capacity, dtype=bool)
+        v_mask[:len(self.mask)] = self.mask
+        self.data = v_data
+        self.mask = v_mask
+
+
+class System:
+    """System class is the base class for any system. Derived classes set
+    the components required and implement process.
+    """
+
+    components = ()
+
+    def process(self, a_world, a_entities, a_fps):
+        """process method is a virtual method called once per update with the
+        NumPy array of entities that have all required components.
+        """
+        pass
+
+
+class MovementSystem(System):
+    """MovementSystem class moves all entities with position and velocity.
+    Velocities are given in units per second.
+    """
+
+    components = ("position", "velocity")
+
+    def process(self, a_world, a_entities, a_fps):
+        """process method moves all entities in one batched operation.
+        """
+        v_positions = a_world.components["position"].data
+        v_positions[a_entities] += a_world.components["velocity"].data[a_entities] / a_fps
+
+
+class AnimationSystem(System):
+    """AnimationSystem class advances the animation frame for all entities
+    with an animation component. Speed is given in loops per second.
+    """
+
+    components = ("animation",)
+
+    def process(self, a_world, a_entities, a_fps):
+        """process method advances all animations in one batched operation.
+        """
+        v_animations = a_world.components["animation"].data
+        v_frames = numpy.maximum(v_animations["frames"][a_entities], 1)
+        v_index = v_animations["index"][a_entities] + v_frames * v_animations["speed"][a_entities] / a_fps
+        v_animations["index"][a_entities] = numpy.where(v_index >= v_frames, 0.0, v_index)
+
+
+class World:
+    """World class contains all entities, their components and the systems
+    that process them.
+
+    Existing GObject and BObject instances can be registered: they get an
+    entity with a position component, and the position is written back to
+    the object (and its sprite) when a system changes it.
+    """
+
+    def __init__(self, a_capacity=idefaults.DEFAULT_ECS_CAPACITY):
+        """__init__ method creates a new World instance.
+
+        - capacity attribute stores the number of entities the arrays can
+        store before growing.
+
+        - alive attribute stores the boolean NumPy array with the entities in
+        use.
+
+        - free list stores the identifiers released to be reused.
+
+        - next_entity attribute stores the next identifier never used.
+
+        - components dictionary stores the ComponentStore for every component
+        name. position, velocity and animation are always registered.
+
+        - systems list stores all systems, in processing order.
+
+        - objects dictionary stores the object registered for every entity.
+
+        - entities dictionary stores the entity for every object registered.
+
+        - synced attribute stores the positions last written back to the
+        objects registered.
+        """
+        self.capacity = a_capacity
+        self.alive = numpy.zeros(a_capacity, dtype=bool)
+        self.free = []
+        self.next_entity = 0
+        self.components = {}
+        self.systems = []
+        self.objects = {}
+        self.entities = {}
+        self.add_component_type("position", numpy.float32, (2,))
+        self.add_component_type("velocity", numpy.float32, (2,))
+        self.add_component_type("animation", ANIMATION_DTYPE)
+        self.synced = numpy.zeros((a_capacity, 2), dtype=numpy.float32)
+
+    def __len__(self):
+        """__len__ method returns the number of entities alive.
+        """
+        return int(numpy.count_nonzero(self.alive))
+
+    # Entity methods -- start --
+    def create_entity(self):
+        """create_entity method returns a new entity identifier.
+        """
+        if self.free:
+            v_entity = self.free.pop()
+        else:
+            v_entity = self.next_entity
+            self.next_entity += 1
+            if v_entity >= self.capacity:
+                self.resize(self.capacity * 2)
+        self.alive[v_entity] = True
+        return v_entity
+
+    def destroy_entity(self, a_entity):
+        """destroy_entity method removes the entity and all its components.
+        """
+        if not self.alive[a_entity]:
+            return False
+        self.alive[a_entity] = False
+        for l_store in self.components.values():
+            l_store.mask[a_entity] = False
+        v_object = self.objects.pop(a_entity, None)
+        if v_object is not None:
+            del self.entities[v_object]
+        self.free.append(a_entity)
+        return True
+
+    def resize(self, a_capacity):
+        """resize method grows all arrays to the given capacity.
+        """
+        v_alive = numpy.zeros(a_capacity, dtype=bool)
+        v_alive[:self.capacity] = self.alive
+        self.alive = v_alive
+        v_synced = numpy.zeros((a_capacity, 2), dtype=numpy.float32)
+        v_synced[:self.capacity] = self.synced
+        self.synced = v_synced
+        for l_store in self.components.values():
+            l_store.resize(a_capacity)
+        self.capacity = a_capacity
+    # Entity methods -- end --
+
+    # Component methods -- start --
+    def add_component_type(self, a_name, a_dtype, a_shape=()):
+        """add_component_type method registers a new component type.
+        """
+        if a_name in self.components:
+            return False
+        self.components[a_name] = ComponentStore(a_name, a_dtype, a_shape, self.capacity)
+        return True
+
+    def add_component(self, a_entity, a_name, a_value=None):
+        """add_component method adds the component to the entity, with the
+        given value (zeros by default).
+        """
+        v_store = self.components[a_name]
+        v_store.mask[a_entity] = True
+        v_store.data[a_entity] = 0 if a_value is None else a_value
+        return True
+
+    def remove_component(self, a_entity, a_name):
+        """remove_component method removes the component from the entity.
+        """
+        v_store = self.components[a_name]
+        if not v_store.mask[a_entity]:
+            return False
+        v_store.mask[a_entity] = False
+        return True
+
+    def has_component(self, a_entity, a_name):
+        """has_component method checks if the entity has the component.
+        """
+        return bool(self.components[a_name].mask[a_entity])
+
+    def get_component(self, a_entity, a_name):
+        """get_component method returns the component value for the entity.
+        Array components are returned as views, so they can be updated in
+        place.
+        """
+        return self.components[a_name].data[a_entity]
+
+    def set_component(self, a_entity, a_name, a_value):
+        """set_component method sets the component value for the entity.
+        """
+        self.components[a_name].data[a_entity] = a_value
+
+    def query(self, *a_names):
+        """query method returns the NumPy array with all entities alive that
+        have all the given components.
+        """
+        v_mask = self.alive.copy()
+        for l_name in a_names:
+            v_mask &= self.components[l_name].mask
+        return numpy.flatnonzero(v_mask)
+    # Component methods -- end --
+
+    # System methods -- start --
+    def add_system(self, a_system):
+        """add_system method adds a system to be processed in every update.
+        """
+        if a_system in self.systems:
+            return False
+        self.systems.append(a_system)
+        return True
+
+    def remove_system(self, a_system):
+        """remove_system method removes a system.
+        """
+        if a_system not in self.systems:
+            return False
+        self.systems.remove(a_system)
+        return True
+
+    def update(self, a_fps):
+        """update method processes all systems, in order, and writes changed
+        positions back to the objects registered.
+        """
+        for l_system in self.systems:
+            v_entities = self.query(*l_system.components)
+            if len(v_entities):
+                l_system.process(self, v_entities, a_fps)
+        self.sync_objects()
+    # System methods -- end --
+
+    # Object adapter methods -- start --
+    def register_object(self, a_object, a_velocity=None):
+        """register_object method creates an entity for the given GObject or
+        BObject, with its position (board position for BObject). It returns
+        the entity.
+        """
+        v_entity = self.entities.get(a_object)
+        if v_entity is not None:
+            return v_entity
+        v_entity = self.create_entity()
+        v_position = self.get_object_position(a_object)
+        self.add_component(v_entity, "position", v_position)
+        if a_velocity is not None:
+            self.add_component(v_entity, "velocity", a_velocity)
+        self.synced[v_entity] = self.components["position"].data[v_entity]
+        self.objects[v_entity] = a_object
+        self.entities[a_object] = v_entity
+        return v_entity
+
+    def unregister_object(self, a_object):
+        """unregister_object method destroys the entity for the given object.
+        """
+        v_entity = self.entities.get(a_object)
+        if v_entity is None:
+            return False
+        return self.destroy_entity(v_entity)
+
+    def get_entity(self, a_object):
+        """get_entity method returns the entity for the given object or None.
+        """
+        return self.entities.get(a_object)
+
+    def get_object_position(self, a_object):
+        """get_object_position method returns the position stored for the
+        object: board position for board objects, screen position otherwise.
+        """
+        v_position = getattr(a_object, "board_position", None)
+        if v_position is None:
+            v_position = a_object.position
+        return (v_position[0], v_position[1])
+
+    def set_object_position(self, a_object, a_position):
+        """set_object_position method writes the position back to the object
+        and its sprite.
+        """
+        v_position = pygame.Vector2(float(a_position[0]), float(a_position[1]))
+        if hasattr(a_object, "set_board_position"):
+            a_object.set_board_position(v_position)
+            a_object.sync_sprite_position()
+            return
+        a_object.position = v_position
+        if getattr(a_object, "sprite", None) is not None:
+            a_object.sprite.set_position(v_position)
+
+    def sync_objects(self):
+        """sync_objects method writes back the positions changed since the last
+        call to the objects registered. Only objects that moved are touched.
+        """
+        if not self.objects:
+            return 0
+        v_positions = self.components["position"].data
+        v_changed = numpy.flatnonzero(numpy.any(v_positions != self.synced, axis=1))
+        v_synced = 0
+        for l_entity in v_changed:
+            v_object = self.objects.get(int(l_entity))
+            if v_object is None:
+                continue
+            self.set_object_position(v_object, v_positions[l_entity])
+            v_synced += 1
+        self.synced[v_changed] = v_positions[v_changed]
+        return v_synced
+    # Object adapter methods -- end --
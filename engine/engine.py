@@ -1,10 +1,15 @@
 """engine.py module contains all the engine framework functionality.
 """
 
+import os
 import pygame
 from pygame.locals import *
-from . import icolors
 from . import handler
+from . import iclock
+from . import profiler
+from . import startup
+
+PROFILE_TRACE_VARIABLE = "DANDELO_PROFILE_TRACE"
 
 
 class Engine:
@@ -23,7 +28,7 @@ class Engine:
         - clock attribute stores the pygame clock used to keep frame per
         second constant.
 
-        - screen attribute stores the pygame Surface used to display any 
+        - screen attribute stores the pygame Surface used to display any
         sprite.
 
         - is_running attribute stores the flag showing if the engine has to
@@ -32,6 +37,24 @@ class Engine:
         - width attribute stores the width of the game window.
 
         - length attribute stores the length of the game window.
+
+        - headless attribute stores if the engine runs without a real display
+        (SDL dummy video driver), so nothing is presented in the screen.
+
+        - steps attribute stores the number of logic steps executed by the
+        engine since it started running.
+
+        - game_clock attribute stores the clock used for game timers. It is a
+        VirtualClock advanced by the fixed timestep when the engine is
+        headless.
+
+        - profiler attribute stores the FrameProfiler recording the time spent
+        in every frame phase. It is disabled by default, and enabled when the
+        DANDELO_PROFILE_TRACE environment variable is set: the Chrome trace
+        is written to that path when the engine stops running.
+
+        - overlay attribute stores the ProfilerOverlay displaying profiler
+        statistics, or None.
         """
         self.name = a_name
         self.fps = a_fps
@@ -41,34 +64,164 @@ class Engine:
         self.is_running = False
         self.width = None
         self.length = None
+        self.headless = False
+        self.steps = 0
+        self.game_clock = None
+        self.profiler = profiler.FrameProfiler()
+        self.overlay = None
 
-    def init(self, a_width, a_length):
+    def init(self, a_width, a_length, a_headless=False):
         """init method initializes the engine.
+
+        When a_headless is True the SDL dummy video and audio drivers are
+        selected before pygame is initialized, so a display surface exists
+        (required to convert images) but nothing is shown.
         """
         self.width = a_width
         self.length = a_length
+        self.headless = a_headless
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
+        startup.mark("pygame.init")
         self.clock = pygame.time.Clock()
-        self.handler = handler.GameHandler()
+        self.game_clock = iclock.VirtualClock() if self.headless else iclock.Clock()
+        self.handler = handler.GameHandler(self.game_clock)
         pygame.display.set_caption(self.name)
         self.screen = pygame.display.set_mode((self.width, self.length))
+        startup.mark("display")
+        if os.environ.get(PROFILE_TRACE_VARIABLE):
+            self.enable_profiler()
+
+    # Profiler methods -- start --
+    def enable_profiler(self, a_overlay=False):
+        """enable_profiler method starts recording the time spent in every
+        frame phase, in the engine, the game handler and the active scene.
+        When a_overlay is True the profiler statistics are displayed on top
+        of the screen.
+        """
+        self.profiler.enable()
+        self.handler.profiler = self.profiler
+        if a_overlay and self.overlay is None:
+            self.overlay = profiler.ProfilerOverlay(self.profiler)
+            self.handler.sprites.add(self.overlay)
+
+    def disable_profiler(self):
+        """disable_profiler method stops recording frame phases and removes
+        the overlay. Frames already recorded are kept.
+        """
+        self.profiler.disable()
+        self.handler.profiler = None
+        if self.overlay is not None:
+            self.overlay.kill()
+            self.overlay = None
+
+    def measure(self, a_phase, a_callable, *args):
+        """measure method calls a_callable with the given arguments, recording
+        the time it took for the given frame phase when the profiler is
+        enabled. It returns the callable result.
+        """
+        if not self.profiler.enabled:
+            return a_callable(*args)
+        return self.profiler.measure(a_phase, None, a_callable, *args)
+
+    def begin_frame(self):
+        """begin_frame method starts recording a frame in the profiler.
+        """
+        if self.profiler.enabled:
+            self.profiler.begin_frame()
+
+    def end_frame(self):
+        """end_frame method finishes recording a frame in the profiler.
+        """
+        if self.profiler.enabled:
+            self.profiler.end_frame()
+
+    def stop_profiler(self):
+        """stop_profiler method writes the Chrome trace and prints the
+        profiler report when the profiler was enabled with the
+        DANDELO_PROFILE_TRACE environment variable.
+        """
+        v_path = os.environ.get(PROFILE_TRACE_VARIABLE)
+        if v_path and self.profiler.frames:
+            self.profiler.export_chrome_trace(v_path)
+            print(self.profiler.format_report())
+    # Profiler methods -- end --
+
+    def process_input(self):
+        """process_input method dispatches all pending pygame events.
+        """
+        for l_event in pygame.event.get():
+            if l_event.type == QUIT:
+                self.is_running = False
+            if l_event.type == KEYDOWN:
+                self.handler.handle_keyboard_event(l_event)
+
+    def step(self):
+        """step method runs one logic step with the fixed engine timestep.
+        The startup report is printed after the first step.
+        """
+        self.measure("start_frame", self.handler.start_frame, self.fps)
+        self.measure("input", self.process_input)
+        self.measure("update", self.handler.update, self.fps)
+        self.measure("events", self.handler.handle_all_events)
+        self.measure("end_frame", self.handler.end_frame)
+        self.steps += 1
+        if self.steps == 1:
+            startup.mark("first frame")
+            startup.print_report()
+        if self.headless:
+            self.game_clock.advance(1000 / self.fps)
+
+    def render(self):
+        """render method draws the handler in the screen surface. Only the
+        screen rectangles changed are presented in the display, and only when
+        the engine is not headless.
+        """
+        v_rects = self.measure("draw", self.handler.draw, self.screen)
+        if v_rects and not self.headless:
+            self.measure("display", pygame.display.update, v_rects)
 
     def run(self):
         """run method runs the engine.
         """
+        if self.headless:
+            self.run_headless()
+            self.stop_profiler()
+            pygame.quit()
+            return
         self.is_running = True
         while self.is_running:
-            self.screen.fill(icolors.WHITE)
-            self.handler.draw(self.screen)
-            pygame.display.update()
-            self.handler.start_frame(self.fps)
-            for l_event in pygame.event.get():
-                if l_event.type == QUIT:
-                    self.is_running = False
-                if l_event.type == KEYDOWN:
-                    self.handler.handle_keyboard_event(l_event)
-            self.handler.update(self.fps)
-            self.handler.handle_all_events()
-            self.handler.end_frame()
-            self.clock.tick(self.fps)
-        pygame.quit()        
\ No newline at end of file
+            self.begin_frame()
+            self.render()
+            self.step()
+            self.measure("tick", self.clock.tick, self.fps)
+            self.end_frame()
+        self.stop_profiler()
+        pygame.quit()
+
+    def run_headless(self, a_steps=None, a_render_every=0):
+        """run_headless method runs the engine logic as fast as possible,
+        without presenting anything and without sleeping in the clock.
+
+        Every step advances the game by the fixed timestep 1/fps.
+
+        - a_steps argument is the number of logic steps to run. None runs
+        until is_running is cleared.
+
+        - a_render_every argument renders the screen every N steps. Zero
+        means the screen is never rendered.
+
+        It returns the number of steps executed.
+        """
+        v_steps = 0
+        self.is_running = True
+        while self.is_running and (a_steps is None or v_steps < a_steps):
+            self.begin_frame()
+            if a_render_every and v_steps % a_render_every == 0:
+                self.render()
+            self.step()
+            self.end_frame()
+            v_steps += 1
+        return v_steps
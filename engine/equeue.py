@@ -0,0 +1,141 @@
+"""equeue.py module contains the queue used by handlers to store the events to
+be processed.
+"""
+
+import collections
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITY_LEVELS = 3
+
+
+class EventHandle:
+    """EventHandle class contains an event stored in the queue. It is a stable
+    handle that can be used to cancel the event.
+    """
+
+    __slots__ = ("event", "priority", "queued")
+
+    def __init__(self, a_event, a_priority):
+        """__init__ method creates a new EventHandle instance.
+
+        - event attribute stores the event queued.
+
+        - priority attribute stores the event priority level.
+
+        - queued attribute stores if the event is still waiting in the queue.
+        Cancelled and processed events are not queued.
+        """
+        self.event = a_event
+        self.priority = a_priority
+        self.queued = True
+
+
+class EventQueue:
+    """EventQueue class implements a priority queue of events with one FIFO
+    deque per priority level. Cancelled events are discarded lazily when they
+    reach the head of the queue, so every operation is O(1).
+    """
+
+    def __init__(self, a_levels=PRIORITY_LEVELS):
+        """__init__ method creates a new EventQueue instance.
+
+        - queues list stores one deque of EventHandle instances for every
+        priority level, from the highest priority to the lowest.
+
+        - handles dictionary stores the handle for every queued event.
+
+        - size attribute stores the number of events queued.
+        """
+        self.queues = [collections.deque() for _ in range(a_levels)]
+        self.handles = {}
+        self.size = 0
+
+    def __len__(self):
+        """__len__ method returns the number of events queued.
+        """
+        return self.size
+
+    def __iter__(self):
+        """__iter__ method iterates all queued events in processing order.
+        """
+        for l_queue in self.queues:
+            for l_handle in l_queue:
+                if l_handle.queued:
+                    yield l_handle.event
+
+    def push(self, a_event, a_priority=PRIORITY_NORMAL):
+        """push method queues an event with the given priority and returns its
+        EventHandle.
+        """
+        v_handle = EventHandle(a_event, a_priority)
+        self.queues[a_priority].append(v_handle)
+        self.handles[a_event] = v_handle
+        self.size += 1
+        return v_handle
+
+    def cancel(self, a_event):
+        """cancel method removes the given event (or EventHandle) from the
+        queue.
+        """
+        v_handle = a_event if isinstance(a_event, EventHandle) else self.handles.get(a_event)
+        if v_handle is None or not v_handle.queued:
+            return False
+        v_handle.queued = False
+        self.handles.pop(v_handle.event, None)
+        self.size -= 1
+        return True
+
+    def _take(self, a_handle):
+        """_take internal method marks the given handle as no more queued.
+        """
+        a_handle.queued = False
+        if self.handles.get(a_handle.event) is a_handle:
+            del self.handles[a_handle.event]
+        self.size -= 1
+
+    def pop(self):
+        """pop method removes and returns the next event to be processed, or
+        None when the queue is empty.
+        """
+        for l_queue in self.queues:
+            while l_queue:
+                v_handle = l_queue.popleft()
+                if v_handle.queued:
+                    self._take(v_handle)
+                    return v_handle.event
+        return None
+
+    def process(self, a_callback, a_budget=None):
+        """process method calls a_callback for events queued before the call,
+        in priority order, up to a_budget events (all of them when it is
+        None). Events added while processing wait for the next call. Events
+        the callback does not handle (returns a false value) and events over
+        the budget are kept, ahead of any newer event, for the next call.
+
+        It returns the number of events handled.
+        """
+        v_pending = self.queues
+        self.queues = [collections.deque() for _ in v_pending]
+        v_handled = 0
+        v_processed = 0
+        for l_priority, l_queue in enumerate(v_pending):
+            v_deferred = collections.deque()
+            while l_queue and (a_budget is None or v_processed < a_budget):
+                v_handle = l_queue.popleft()
+                if not v_handle.queued:
+                    continue
+                self._take(v_handle)
+                v_processed += 1
+                if a_callback(v_handle.event):
+                    v_handled += 1
+                else:
+                    v_handle.queued = True
+                    self.handles.setdefault(v_handle.event, v_handle)
+                    self.size += 1
+                    v_deferred.append(v_handle)
+            v_deferred.extend(l_queue)
+            v_deferred.extend(self.queues[l_priority])
+            self.queues[l_priority] = v_deferred
+        return v_handled
@@ -0,0 +1,210 @@
+"""fonts.py module contains the font registry shared by the whole process and
+the cache with all text surfaces rendered.
+"""
+
+import atexit
+import json
+import os
+import pygame
+from . import idefaults
+
+
+def color_key(a_color):
+    """color_key function returns a hashable value for any pygame color
+    representation, or None.
+    """
+    if a_color is None:
+        return None
+    return tuple(pygame.Color(a_color))
+
+
+class FontPathCache:
+    """FontPathCache class implements a cache, persisted in disk, with the
+    font file resolved for every family and style, so system fonts are only
+    enumerated the first time the game runs.
+
+    Fonts resolved are written in disk once, with flush, not every time a
+    font is resolved. The shared registry flushes its cache at exit.
+    """
+
+    def __init__(self, a_path=idefaults.DEFAULT_FONT_CACHE_PATH):
+        """__init__ method creates a new FontPathCache instance.
+
+        - path attribute stores the JSON file where the cache is persisted.
+        None means the cache is not persisted.
+
+        - paths dictionary stores the font file (or None when it was not
+        found) for every "family:bold:italic" key.
+
+        - loaded attribute stores if the cache file was already read.
+
+        - changed attribute stores if there are fonts resolved not written in
+        the cache file yet.
+        """
+        self.path = a_path
+        self.paths = {}
+        self.loaded = False
+        self.changed = False
+
+    def load(self):
+        """load method reads the cache file. Missing or wrong files are
+        ignored.
+        """
+        self.loaded = True
+        if self.path is None or not os.path.isfile(self.path):
+            return False
+        try:
+            with open(self.path) as v_file:
+                self.paths.update(json.load(v_file))
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def save(self):
+        """save method writes the cache file. Errors writing it are ignored.
+        """
+        if self.path is None:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as v_file:
+                json.dump(self.paths, v_file, indent=1, sort_keys=True)
+        except OSError:
+            return False
+        return True
+
+    def flush(self):
+        """flush method writes the cache file when fonts were resolved since
+        the last time. Errors writing it are ignored and not retried.
+        """
+        if not self.changed:
+            return False
+        self.changed = False
+        return self.save()
+
+    def resolve(self, a_family, a_bold=False, a_italic=False):
+        """resolve method returns the font file for the given family and style,
+        looking it in the system fonts only when it is not cached or the
+        cached file does not exist anymore.
+        """
+        if not self.loaded:
+            self.load()
+        v_key = "{}:{:d}:{:d}".format(a_family, a_bold, a_italic)
+        if v_key in self.paths:
+            v_path = self.paths[v_key]
+            if v_path is None or os.path.isfile(v_path):
+                return v_path
+        v_path = pygame.font.match_font(a_family, a_bold, a_italic)
+        self.paths[v_key] = v_path
+        self.changed = True
+        return v_path
+
+
+class FontRegistry:
+    """FontRegistry class implements a registry with all fonts used, so every
+    family and size is resolved only once, and a cache with the surfaces for
+    all text rendered with those fonts.
+
+    The text cache is keyed by (font, text, antialias, color, background) and
+    evicts the least recently used surface when it is full.
+    """
+
+    def __init__(self, a_max_texts=idefaults.DEFAULT_TEXT_CACHE, a_font_paths=None):
+        """__init__ method creates a new FontRegistry instance.
+
+        - font_paths attribute stores the FontPathCache used to find the font
+        file for every family.
+
+        - fonts dictionary stores the pygame Font for every (family, size,
+        bold, italic) entry.
+
+        - max_texts attribute stores the maximum number of text surfaces
+        cached.
+
+        - texts dictionary stores the cached text surfaces, in least recently
+        used order.
+
+        - hits and misses attributes store text cache statistics.
+        """
+        self.font_paths = a_font_paths if a_font_paths else FontPathCache()
+        self.fonts = {}
+        self.max_texts = a_max_texts
+        self.texts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, a_family, a_size, a_bold=False, a_italic=False):
+        """get_font method returns the shared font for the given family and
+        size, resolving it the first time.
+        """
+        v_key = (a_family, a_size, a_bold, a_italic)
+        v_font = self.fonts.get(v_key)
+        if v_font is None:
+            v_font = self.load_font(a_family, a_size, a_bold, a_italic)
+            self.fonts[v_key] = v_font
+        return v_font
+
+    def load_font(self, a_family, a_size, a_bold, a_italic):
+        """load_font method creates a new pygame Font for the given family and
+        size, with the font file from the font paths cache. Like SysFont, the
+        style is emulated when there is not a specific file for it.
+        """
+        v_path = self.font_paths.resolve(a_family, a_bold, a_italic)
+        v_font = pygame.font.Font(v_path, a_size)
+        if a_bold or a_italic:
+            v_regular = self.font_paths.resolve(a_family)
+            if v_path is None or v_path == v_regular:
+                v_font.set_bold(a_bold)
+                v_font.set_italic(a_italic)
+        return v_font
+
+    def render(self, a_font, a_text, a_antialias, a_color, a_background=None):
+        """render method returns the shared surface with the given text
+        rendered, rasterizing it only the first time. The surface returned
+        must not be modified.
+        """
+        v_key = (a_font, a_text, a_antialias, color_key(a_color), color_key(a_background))
+        v_surface = self.texts.pop(v_key, None)
+        if v_surface is not None:
+            self.hits += 1
+            self.texts[v_key] = v_surface
+            return v_surface
+        self.misses += 1
+        v_surface = a_font.render(a_text, a_antialias, a_color, a_background)
+        self.texts[v_key] = v_surface
+        if len(self.texts) > self.max_texts:
+            del self.texts[next(iter(self.texts))]
+        return v_surface
+
+    def clear(self):
+        """clear method removes all text surfaces cached.
+        """
+        self.texts.clear()
+
+
+_registry = None
+
+
+def get_registry():
+    """get_registry function returns the font registry shared by the whole
+    process, creating it the first time.
+    """
+    global _registry
+    if _registry is None:
+        _registry = FontRegistry()
+        atexit.register(_registry.font_paths.flush)
+    return _registry
+
+
+def get_font(a_family, a_size, a_bold=False, a_italic=False):
+    """get_font function returns the shared font for the given family and
+    size.
+    """
+    return get_registry().get_font(a_family, a_size, a_bold, a_italic)
+
+
+def render_text(a_font, a_text, a_antialias, a_color, a_background=None):
+    """render_text function returns the shared surface with the given text
+    rendered.
+    """
+    return get_registry().render(a_font, a_text, a_antialias, a_color, a_background)
@@ -2,6 +2,30 @@
 event.
 """
 
+import collections
+import sys
+
+POOL_SIZE = 256
+
+GRoute = collections.namedtuple("GRoute", ["trigger", "destination", "role", "timing"])
+
+_ROUTES = {}
+
+
+def parse_route(a_type):
+    """parse_route function returns the GRoute for the given event type. Routes
+    are parsed only once and the same GRoute instance is shared by all events
+    with the same type.
+    """
+    v_route = _ROUTES.get(a_type)
+    if v_route is None:
+        v_segments = [sys.intern(l_segment) for l_segment in a_type.split("/")]
+        v_segments += [None] * (4 - len(v_segments))
+        v_route = GRoute(*v_segments[:4])
+        _ROUTES[a_type] = v_route
+    return v_route
+
+
 class GEvent:
     """GEvent class contains all attributes and functionality for any game
     event.
@@ -14,40 +38,87 @@ class GEvent:
     timing: now/<time>
     """
 
+    __slots__ = ("_type", "route", "data", "pooled")
+
+    _pool = []
+
     def __init__(self, a_type, a_data):
         """__init__ method creates a new GEvent instance.
 
         = type attribute contains the event type.
 
+        - route attribute contains the GRoute with the event type already
+        parsed.
+
         - data dictionary contains all information required to process the
         event.
+
+        - pooled attribute stores if the event was acquired from the events
+        pool and it has to be released once it is processed.
         """
         self.type = a_type
         self.data = a_data
+        self.pooled = False
+
+    @classmethod
+    def acquire(cls, a_type, a_data):
+        """acquire class method returns an event from the events pool (or a
+        new one when the pool is empty) for high frequency events. The event
+        is released by the handler once it is processed.
+        """
+        if cls._pool:
+            v_event = cls._pool.pop()
+            v_event.type = a_type
+            v_event.data = a_data
+        else:
+            v_event = cls(a_type, a_data)
+        v_event.pooled = True
+        return v_event
+
+    def release(self):
+        """release method returns a pooled event to the events pool.
+        """
+        if not self.pooled:
+            return False
+        self.pooled = False
+        self.data = None
+        if len(GEvent._pool) < POOL_SIZE:
+            GEvent._pool.append(self)
+        return True
+
+    @property
+    def type(self):
+        """type property returns the event type.
+        """
+        return self._type
+
+    @type.setter
+    def type(self, a_type):
+        """type setter property sets the event type and its parsed route.
+        """
+        self._type = a_type
+        self.route = parse_route(a_type)
 
     @property
     def trigger(self):
         """trigger property returns the event trigger value.
         """
-        a_segments = self.type.split("/")
         #if a_segments[0] == "action":
         #    return self.actions.get("/".join(a_segments[1:]), None)
-        #return None        
-        return a_segments[0]
+        #return None
+        return self.route.trigger
 
     @property
     def destination(self):
         """destination property returns the event destination value.
         """
-        a_segments = self.type.split("/")
-        return a_segments[1]
+        return self.route.destination
 
     @property
     def role(self):
         """role property returns the event role value.
         """
-        a_segments = self.type.split("/")
-        return a_segments[2]
+        return self.route.role
 
     @property
     def timing(self):
@@ -55,12 +126,11 @@ class GEvent:
         It could be not defined, which means the event should be processed
         normally.
         """
-        a_segments = self.type.split("/")
-        return a_segments[3] if len(a_segments) >= 4 else None
+        return self.route.timing
 
     @property
     def handler(self):
-        """handler property returns the last handler provided in the 
+        """handler property returns the last handler provided in the
         event.data["handler"] property.
         """
         if self.data and self.data.get("handler"):
@@ -12,6 +12,8 @@ class GObject(iobject.IObject):
     sprite.
     """
 
+    __slots__ = ("_position", "sprite", "width", "height")
+
     def __init__(self, **kwargs):
         """___init__ method creates a new GObject instance.
 
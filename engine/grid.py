@@ -0,0 +1,150 @@
+"""grid.py module contains the board grid storage backed by a structured NumPy
+array.
+"""
+
+import numpy
+import pygame
+from . import icolors
+
+FLAG_BLOCKED = 0x1
+
+CELL_DTYPE = numpy.dtype([
+    ("color", numpy.uint8, (3,)),
+    ("border", numpy.int16),
+    ("terrain", numpy.uint16),
+    ("flags", numpy.uint32),
+    ("occupancy", numpy.int32),
+    ("cost", numpy.float32),
+])
+
+
+class Grid:
+    """Grid class implements the storage for all cells in a board. Cells are
+    stored in a structured NumPy array indexed by board coordinates [x, y],
+    with the fields defined in CELL_DTYPE:
+
+    - color: RGB color used to display the cell.
+
+    - border: cell border width (0 means it is filled with the color).
+
+    - terrain: game defined terrain identifier.
+
+    - flags: bit flags, like FLAG_BLOCKED.
+
+    - occupancy: number of board objects placed in the cell.
+
+    - cost: movement cost to enter the cell.
+    """
+
+    def __init__(self, a_width, a_length, **kwargs):
+        """__init__ method creates a new Grid instance. Any cell field can be
+        given as a keyword argument with the initial value for all cells.
+
+        - width attribute stores the number of cells in the X axis.
+
+        - length attribute stores the number of cells in the Y axis.
+
+        - cells attribute stores the structured NumPy array with all cells.
+
+        - listeners list stores the callbacks to be called when any cell
+        changes. They are called with the rectangle (in board coordinates)
+        that changed, the set of fields that changed and an optional boolean
+        mask with the rectangle shape for the cells that really changed.
+        """
+        self.width = a_width
+        self.length = a_length
+        self.cells = numpy.zeros((a_width, a_length), dtype=CELL_DTYPE)
+        self.cells["color"] = kwargs.pop("color", icolors.BLACK)
+        self.cells["border"] = kwargs.pop("border", 1)
+        self.cells["cost"] = kwargs.pop("cost", 1.0)
+        for l_field, l_value in kwargs.items():
+            self.cells[l_field] = l_value
+        self.listeners = []
+
+    def add_listener(self, a_callback):
+        """add_listener method adds a callback to be called when any cell
+        changes.
+        """
+        if a_callback in self.listeners:
+            return False
+        self.listeners.append(a_callback)
+        return True
+
+    def remove_listener(self, a_callback):
+        """remove_listener method removes a callback added with
+        add_listener.
+        """
+        if a_callback not in self.listeners:
+            return False
+        self.listeners.remove(a_callback)
+        return True
+
+    def notify(self, a_rect, a_fields, a_mask=None):
+        """notify method calls all listeners with the changed rectangle and
+        fields.
+        """
+        for l_callback in self.listeners:
+            l_callback(a_rect, a_fields, a_mask)
+
+    def in_bounds(self, a_x, a_y):
+        """in_bounds method checks if the given coordinates are inside the
+        grid.
+        """
+        return (0 <= a_x < self.width) and (0 <= a_y < self.length)
+
+    def get(self, a_x, a_y, a_field):
+        """get method returns the value of the given field for one cell.
+        """
+        return self.cells[a_field][a_x, a_y]
+
+    def set_cell(self, a_x, a_y, **kwargs):
+        """set_cell method sets the given fields for one cell.
+        """
+        for l_field, l_value in kwargs.items():
+            self.cells[l_field][a_x, a_y] = l_value
+        self.notify(pygame.Rect(a_x, a_y, 1, 1), set(kwargs))
+
+    def fill_region(self, a_x, a_y, a_width, a_length, **kwargs):
+        """fill_region method sets the given fields for all cells in the given
+        rectangle. The rectangle is clipped to the grid.
+        """
+        v_rect = pygame.Rect(a_x, a_y, a_width, a_length).clip(0, 0, self.width, self.length)
+        if not v_rect:
+            return False
+        v_region = self.cells[v_rect.left:v_rect.right, v_rect.top:v_rect.bottom]
+        for l_field, l_value in kwargs.items():
+            v_region[l_field] = l_value
+        self.notify(v_rect, set(kwargs))
+        return True
+
+    def set_by_mask(self, a_mask, **kwargs):
+        """set_by_mask method sets the given fields for all cells where the
+        boolean mask (with the grid shape) is True.
+        """
+        v_xs, v_ys = numpy.nonzero(a_mask)
+        if len(v_xs) == 0:
+            return False
+        for l_field, l_value in kwargs.items():
+            self.cells[l_field][a_mask] = l_value
+        v_rect = pygame.Rect(int(v_xs.min()), int(v_ys.min()), int(v_xs.max() - v_xs.min()) + 1, int(v_ys.max() - v_ys.min()) + 1)
+        self.notify(v_rect, set(kwargs), a_mask[v_rect.left:v_rect.right, v_rect.top:v_rect.bottom])
+        return True
+
+    def recolor(self, a_mask, a_color):
+        """recolor method sets the given color for all cells where the boolean
+        mask is True.
+        """
+        return self.set_by_mask(a_mask, color=a_color)
+
+    def count(self, a_predicate):
+        """count method returns the number of cells matching the predicate.
+        The predicate is called with the cells array and returns a boolean
+        mask.
+        """
+        return int(numpy.count_nonzero(a_predicate(self.cells)))
+
+    def where(self, a_predicate):
+        """where method returns an array with the [x, y] coordinates of all
+        cells matching the predicate.
+        """
+        return numpy.argwhere(a_predicate(self.cells))
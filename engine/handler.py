@@ -2,6 +2,8 @@
 """
 
 from . import ihandler
+from . import render
+from . import registry
 
 
 class GameHandler(ihandler.IHandler):
@@ -9,65 +11,155 @@ class GameHandler(ihandler.IHandler):
     control for all elements in the game.
     """
 
-    def __init__(self):
+    def __init__(self, a_clock=None):
         """___init__ method initializes a GameHandler instance.
 
-        - sprites list contains all game sprites. A sprite always belong to a
-        game object.
+        - a_clock argument is the clock used for all timers, in the handler
+        and in every scene added.
 
-        - scenes list contains all game scenes.
+        - sprites list contains the sprites for objects added to the handler
+        itself. They are drawn on top of all scenes.
+
+        - layers list contains the stack of render layers displayed, from
+        bottom to top. Every active scene pushes its own persistent sprite
+        group. Pushing and popping a layer does not visit its sprites, so
+        activating or deactivating a scene does not depend on its size.
+
+        - frozen_count attribute stores the number of layers, from the
+        bottom, covered by a modal scene. They are rendered once in the
+        renderer snapshot, they are not updated and their scenes are paused.
+
+        - scenes attribute is the Registry with all game scenes, indexed by
+        name.
 
         - active_scene list contains the queue with scenes that are active so
         they have to be displayed.
 
         - events list contains all events handle has to process.
+
+        - renderer attribute stores the DirtyRenderer used to redraw only the
+        screen areas that changed.
+
+        - profiler attribute stores the FrameProfiler recording the time
+        spent in every scene and handler phase, or None when profiling is
+        disabled.
         """
-        super().__init__()
-        self.scenes = []
+        super().__init__(a_clock=a_clock)
+        self.scenes = registry.Registry()
         self.active_scene = []
+        self.layers = []
+        self.frozen_count = 0
+        self.renderer = render.DirtyRenderer()
+        self.profiler = None
 
     def draw(self, a_screen):
-        """draw method calls to draw for every game object contained in
-        the handler.
+        """draw method draws every game object that changed since the last
+        frame and returns the list of screen rectangles to be updated. Scene
+        layers are drawn from bottom to top and handler sprites on top. Layers
+        covered by a modal scene are not drawn, they are in the renderer
+        snapshot.
         """
-        v_active_scene = self.get_active_scene()
-        if v_active_scene:
-            v_active_scene.draw(a_screen)
-        super().draw(a_screen)
+        return self.renderer.draw(a_screen, self.layers[self.frozen_count:] + [self.sprites])
 
     def update(self, a_fps):
         """update method updates the game handler and calls any update for
-        any children.
+        any children. Animations and entities in the active scene world are
+        processed in batched passes.
+        """
+        for l_layer in self.layers[self.frozen_count:]:
+            self.measure("update", l_layer.name, l_layer.update, a_fps)
+        self.measure("update", "handler", self.sprites.update, a_fps)
+        v_active_scene = self.get_active_scene()
+        if v_active_scene:
+            self.measure("update", "animator", v_active_scene.animator.update, a_fps)
+            if v_active_scene.world is not None:
+                self.measure("update", "world", v_active_scene.world.update, a_fps)
+
+    def measure(self, a_phase, a_owner, a_callable, *args):
+        """measure method calls a_callable with the given arguments, recording
+        the time it took for the given phase and owner when the profiler is
+        enabled. It returns the callable result.
+        """
+        if self.profiler is None:
+            return a_callable(*args)
+        return self.profiler.measure(a_phase, a_owner, a_callable, *args)
+
+    # Layer methods -- start --
+    def push_layer(self, a_layer):
+        """push_layer method displays the given sprite group on top of all
+        layers. All its sprites are redrawn in the next frame.
         """
-        self.sprites.update(a_fps)
+        if a_layer in self.layers:
+            if self.layers[-1] is a_layer:
+                return False
+            self.layers.remove(a_layer)
+        self.layers.append(a_layer)
+        a_layer.mark_all_dirty()
+        self.update_composition()
+        return True
+
+    def pop_layer(self, a_layer):
+        """pop_layer method stops displaying the given sprite group. The
+        screen area where its sprites were drawn is redrawn in the next frame.
+        """
+        if a_layer not in self.layers:
+            return False
+        if self.layers[-1] is a_layer:
+            self.layers.pop()
+        else:
+            self.layers.remove(a_layer)
+        self.renderer.add_dirty_rects(a_layer.pop_drawn_rects())
+        self.update_composition()
+        return True
+
+    def update_composition(self):
+        """update_composition method freezes all layers below the top modal
+        scene layer and pauses their scenes. Layers above it are drawn live.
+        """
+        v_modal_layers = [l_scene.sprites for l_scene in self.active_scene if l_scene.modal]
+        self.frozen_count = 0
+        for l_index in range(len(self.layers) - 1, -1, -1):
+            if any(self.layers[l_index] is l_layer for l_layer in v_modal_layers):
+                self.frozen_count = l_index
+                break
+        v_frozen = self.layers[:self.frozen_count]
+        for l_scene in self.active_scene:
+            l_scene.paused = any(l_scene.sprites is l_layer for l_layer in v_frozen)
+        self.renderer.freeze(v_frozen)
+
+    def invalidate(self, a_scene=None):
+        """invalidate method forces the given scene to be rendered again. When
+        the scene is paused under a modal scene its snapshot is rebuilt,
+        otherwise (or when no scene is given) the whole screen is repainted.
+        """
+        if a_scene is not None and a_scene.paused:
+            return self.renderer.invalidate_snapshot()
+        self.renderer.invalidate()
+        return True
+    # Layer methods -- end --
 
     # Scene methods -- start --
     def add_scene(self, a_scene):
         """add_scene method adds an scene to be handled.
         """
-        if a_scene in self.scenes:
+        if not self.scenes.add(a_scene):
             return False
-        self.scenes.append(a_scene)
         if hasattr(a_scene, "notifier") and a_scene.notifier is None:
             a_scene.notifier = self.event_notifier
+        if hasattr(a_scene, "set_clock"):
+            a_scene.set_clock(self.timers.clock)
         return True
 
     def remove_scene(self, a_scene):
         """remove_scene method removes an scene to be handled.
         """
-        if a_scene not in self.scenes:
-            return False
-        self.scenes.remove(a_scene)
-        return True
+        return self.scenes.remove(a_scene)
 
     def get_scene_by_name(self, a_name):
         """get_scene_by_name method looks for a scene with the given name
         in all scenes.
         """
-        for l_scene in self.scenes:
-            if l_scene.name == a_name:
-                return l_scene
-        return None
+        return self.scenes.get_by_name(a_name)
 
     def get_active_scene(self):
         """get_active_scene method returns the scene that is at the
@@ -84,8 +176,7 @@ class GameHandler(ihandler.IHandler):
             return False
         self.active_scene.append(a_scene)
         a_scene.open(**kwargs)
-        for l_object in a_scene.objects:
-            self.add_object(l_object)
+        self.push_layer(a_scene.sprites)
         self.keyboard_control_object = a_scene.keyboard_control_object
         return True
 
@@ -98,6 +189,7 @@ class GameHandler(ihandler.IHandler):
         if self.get_active_scene() != a_scene:
             self.active_scene.remove(a_scene)
             self.active_scene.append(a_scene)
+            self.push_layer(a_scene.sprites)
         self.keyboard_control_object = a_scene.keyboard_control_object
         return True
 
@@ -116,11 +208,10 @@ class GameHandler(ihandler.IHandler):
         # call to the scene close method in order to notify to the scene that
         # is being deactivated.
         a_scene.close()
-        # remove the scene from the queue of active scenes and remove
-        # all scene objects from the handler.
+        # remove the scene from the queue of active scenes and its layer from
+        # the layers displayed.
         self.active_scene.remove(a_scene)
-        for l_object in a_scene.objects:
-            self.remove_object(l_object)
+        self.pop_layer(a_scene.sprites)
         return True
 
     def deactivate_active_scene(self):
@@ -174,27 +265,28 @@ class GameHandler(ihandler.IHandler):
         """
         v_active_scene = self.get_active_scene()
         if v_active_scene:
-            v_active_scene.handle_all_events()
-        super().handle_all_events()
+            self.measure("events", v_active_scene.name, v_active_scene.handle_all_events)
+        self.measure("events", "handler", super().handle_all_events)
     # Handle engine events -- start --
 
-    def tick_timers(self):
-        """tick_timers method updates all timers being handled.
+    def tick_timers(self, a_now=None):
+        """tick_timers method updates all timers being handled. The clock is
+        sampled only once for the handler and the active scene.
         """
+        v_now = self.timers.clock.get_ticks() if a_now is None else a_now
         v_active_scene = self.get_active_scene()
         if v_active_scene:
-            v_active_scene.tick_timers()
-        for l_timer in self.timers:
-            l_timer.tick(self)
+            v_active_scene.tick_timers(v_now)
+        self.timers.tick(v_now)
 
     def start_frame(self, a_fps):
         """start_frame method is called by the engine at the start of every
         frame.
         """
-        self.tick_timers()
+        self.measure("start_frame", "timers", self.tick_timers)
         v_active_scene = self.get_active_scene()
         if v_active_scene:
-            v_active_scene.start_frame(a_fps)
+            self.measure("start_frame", v_active_scene.name, v_active_scene.start_frame, a_fps)
 
     def end_frame(self):
         """end_frame method is called by the engine at the end of every frame.
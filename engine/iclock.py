@@ -0,0 +1,39 @@
+"""iclock.py module contains the clocks used by the engine to measure game
+time in milliseconds.
+"""
+
+import pygame
+
+
+class Clock:
+    """Clock class implements the system clock, using pygame ticks.
+    """
+
+    def get_ticks(self):
+        """get_ticks method returns the number of milliseconds since pygame was
+        initialized.
+        """
+        return pygame.time.get_ticks()
+
+
+class VirtualClock:
+    """VirtualClock class implements a clock that only moves forward when it
+    is advanced, used for deterministic and fast-forwarded runs.
+    """
+
+    def __init__(self, a_start=0):
+        """__init__ method creates a new VirtualClock instance.
+
+        - ticks attribute stores the actual time in milliseconds.
+        """
+        self.ticks = a_start
+
+    def get_ticks(self):
+        """get_ticks method returns the actual time in milliseconds.
+        """
+        return self.ticks
+
+    def advance(self, a_milliseconds):
+        """advance method moves the clock forward the given milliseconds.
+        """
+        self.ticks += a_milliseconds
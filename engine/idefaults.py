@@ -1,10 +1,27 @@
 """idefaults.py module contains some defaults values to be used in the game.
 """
 
+import os
 from . import icolors
 
 
 DEFAULT_WIDTH = 64
 DEFAULT_LENGTH = 64
 DEFAULT_SPRITE_BORDER = 0
-DEFAULT_SPRITE_COLOR = icolors.BLACK
\ No newline at end of file
+DEFAULT_SPRITE_COLOR = icolors.BLACK
+DEFAULT_RENDER_MAX_RECTS = 256
+DEFAULT_RENDER_MAX_AREA = 0.5
+DEFAULT_BOARD_TILE_SIZE = 8
+DEFAULT_BOARD_TILE_CACHE = 256
+DEFAULT_PATHFINDING_FIELDS = 16
+DEFAULT_PATHFINDING_REBUILD_AREA = 1024
+DEFAULT_ASSET_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_PRELOAD_WORKERS = 4
+DEFAULT_TEXT_CACHE = 512
+DEFAULT_MENU_ROWS = 10
+DEFAULT_FONT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "dandelo", "fonts.json")
+DEFAULT_ECS_CAPACITY = 1024
+DEFAULT_ANIMATION_CAPACITY = 64
+DEFAULT_PROFILER_FRAMES = 600
+DEFAULT_PROFILER_PHASES = 32
+DEFAULT_PROFILER_OVERLAY_FRAMES = 30
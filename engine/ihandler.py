@@ -2,7 +2,10 @@
 interface functionality.
 """
 
-import pygame
+from . import render
+from . import equeue
+from . import scheduler
+from . import registry
 
 # def callback(a_func):
 #     """callback function is a decorator to be used inside class methods and it
@@ -32,13 +35,17 @@ class IHandler:
     functionality for any handler in the game.
     """
 
-    def __init__(self, a_type="top"):
+    def __init__(self, a_type="top", a_clock=None):
         """___init__ method initializes a GameHandler instance.
 
         - a_type attribute stores the kind of handler. "top" is used for the
         main and top handler.
 
-        - objects list contains all game object.
+        - objects attribute is the Registry with all game objects, indexed by
+        uid, name and type.
+
+        - sprites DirtyGroup contains the sprites for all game objects and
+        keeps track of the ones that changed since the last frame.
 
         - keyboard_control_object attribute stores the game object that should
         receive and process keyboard events.
@@ -54,20 +61,27 @@ class IHandler:
         - actions dictionary stores functions to be called when an action has
         to be invoked.
 
-        - events list stores all events to be processed by the handler.
+        - events EventQueue stores all events to be processed by the handler.
+
+        - event_budget attribute stores the maximum number of events processed
+        in every frame. None means no limit. Events over the budget are
+        processed in the next frames.
 
-        - timers attribute is a list with all timers to be handled.
+        - timers attribute is the TimerScheduler with all timers to be
+        handled. a_clock is the clock used by the scheduler (system clock by
+        default).
 
         - notifier attribute keeps the callback to be used to notify events to
         the proper parent.
         """
         self.type = a_type
-        self.objects = []
-        self.sprites = pygame.sprite.Group()
+        self.objects = registry.Registry()
+        self.sprites = render.DirtyGroup()
         self.keyboard_control_object = None
         self.actions = {}
-        self.events = []
-        self.timers = []
+        self.events = equeue.EventQueue()
+        self.event_budget = None
+        self.timers = scheduler.TimerScheduler(a_clock)
         self.notifier = None
         self.setup_default_actions()
 
@@ -92,9 +106,8 @@ class IHandler:
     def add_object(self, a_object):
         """add_object method adds the given object to be handle.
         """
-        if a_object in self.objects:
+        if not self.objects.add(a_object):
             return False
-        self.objects.append(a_object)
         if hasattr(a_object, "notifier") and a_object.notifier is None:
             a_object.notifier = self.event_notifier
         if hasattr(a_object, "get_sprite"):
@@ -106,14 +119,25 @@ class IHandler:
     def remove_object(self, a_object):
         """remove_object method removes the given object to be handled.
         """
-        if a_object not in self.objects:
+        if not self.objects.remove(a_object):
             return False
-        self.objects.remove(a_object)
         if hasattr(a_object, "get_sprite"):
             v_object_sprite = a_object.get_sprite()
             if v_object_sprite:
                 self.sprites.remove(v_object_sprite)
         return True
+
+    def get_object_by_name(self, a_name):
+        """get_object_by_name method returns the object with the given name or
+        None.
+        """
+        return self.objects.get_by_name(a_name)
+
+    def get_objects_by_type(self, a_type):
+        """get_objects_by_type method returns a list with all objects that are
+        instances of the given class.
+        """
+        return self.objects.get_by_type(a_type)
     # Object methods -- end --
 
     # Action methods -- start --
@@ -160,75 +184,82 @@ class IHandler:
     # Action methods -- end --
 
     # Event methods -- start --
-    def add_event(self, a_event):
-        """add_event method adds a new event to processed by the handler.
+    def add_event(self, a_event, a_priority=equeue.PRIORITY_NORMAL):
+        """add_event method adds a new event to processed by the handler. It
+        returns the EventHandle that can be used to remove the event.
         """
-        self.events.append(a_event)
-        return True
+        return self.events.push(a_event, a_priority)
 
     def remove_event(self, a_event):
-        """remove_event method removes an event to be processed by the handler.
+        """remove_event method removes an event (or EventHandle) to be
+        processed by the handler.
         """
-        if a_event in self.events:
-            self.events.remove(a_event)
-            return True
-        return False
+        return self.events.cancel(a_event)
 
     def next_event(self):
         """next_event method returns the first event.
         """
-        return self.events.pop(0)
+        return self.events.pop()
 
     def event_notifier(self, a_event, **kwargs):
         """event_notifier method allows to create events for any object in the
-        handler.
+        handler. a_priority keyword argument sets the event priority.
         """
         if a_event.data.get("handler", None) is None:
             a_event.data["handler"] = []
         a_event.data["handler"].append(self)
-        if a_event.destination in [self.type, "parent"]:
-            self.add_event(a_event)
+        v_destination = a_event.route.destination
+        if v_destination == self.type or v_destination == "parent":
+            self.add_event(a_event, kwargs.get("a_priority", equeue.PRIORITY_NORMAL))
         else:
             if self.notifier:
-                self.notifier(a_event)
+                self.notifier(a_event, **kwargs)
 
     def handle_all_events(self):
-        """handle_events method handles all events in the event list.
+        """handle_events method handles all events in the event list, up to
+        the event budget. Events not handled are kept for the next frame.
         """
-        for l_event in self.events[:]:
-            if self.handle_event(l_event):
-                self.events.remove(l_event)
+        self.events.process(self.process_event, self.event_budget)
+
+    def process_event(self, a_event):
+        """process_event method handles the given event and releases it when
+        it is a pooled event.
+        """
+        v_handled = self.handle_event(a_event)
+        if v_handled and a_event.pooled:
+            a_event.release()
+        return v_handled
 
     def handle_event(self, a_event):
         """handle_event method processes a given event.
         """
-        if a_event.trigger == "action":
-            v_role = a_event.role
-            if v_role in self.actions:
-                return self.actions[v_role](a_event)
+        v_route = a_event.route
+        if v_route.trigger == "action":
+            v_action = self.actions.get(v_route.role)
+            if v_action:
+                return v_action(a_event)
         return False
     # Event methods -- end --
 
     # Timer methods -- start --
+    def set_clock(self, a_clock):
+        """set_clock method sets the clock used by the handler timers.
+        """
+        self.timers.clock = a_clock
+
     def add_timer(self, a_timer):
         """add_timer method adds a new timer to be handled.
         """
-        if a_timer in self.timers:
-            return False
-        self.timers.append(a_timer)
-        return True
+        return self.timers.add(a_timer)
 
     def remove_timer(self, a_timer):
         """remove_timer method removes a timer to be handled.
         """
-        if a_timer not in self.timers:
-            return False
-        self.timers.remove(a_timer)
-        return True
+        return self.timers.remove(a_timer)
 
-    def tick_timers(self):
-        """tick_timers method updates all timers being handled.
+    def tick_timers(self, a_now=None):
+        """tick_timers method fires all timers expired. a_now is the actual
+        time, when it is not given the timers clock is used.
         """
-        for l_timer in self.timers:
-            l_timer.tick()
+        self.timers.tick(a_now)
     # Timer methods -- end --
@@ -2,20 +2,36 @@
 any object created in the game.
 """
 
-import uuid
+import itertools
+
+_uids = itertools.count(1)
+
+
+def next_uid():
+    """next_uid function returns a new unique identifier. Identifiers are
+    integers increasing monotonically for the whole process.
+    """
+    return next(_uids)
 
 
 class IObject:
     """IObject class contains all common attributes and functionality for any
     object created in the game.
+
+    Engine objects use __slots__ to avoid a dictionary per instance. Classes
+    derived without __slots__ still get one, so they work as usual.
     """
 
+    __slots__ = ("uid", "_name", "notifier", "opened")
+
     def __init__(self, a_name=None):
         """__init__ method creates an IObject instance.
 
-        - uuid attribute stores the object unique identifier.
+        - uid attribute stores the object unique integer identifier.
 
-        - name attribute stores the optional object name.
+        - name attribute stores the optional object name. When it is not
+        given, it is formatted from the class name and the uid the first time
+        it is used.
 
         - notifier attribute keeps the callback to be used to notify events to
         the proper parent.
@@ -23,11 +39,25 @@ class IObject:
         - opened attribute keeps the status if the object has been already
         activated in a scene.
         """
-        self.uid = str(uuid.uuid1())
-        self.name = a_name if a_name else self.uid
+        self.uid = next_uid()
+        self._name = a_name if a_name else None
         self.notifier = None
         self.opened = False
 
+    @property
+    def name(self):
+        """name property returns the object name.
+        """
+        if self._name is None:
+            self._name = "{}-{}".format(type(self).__name__, self.uid)
+        return self._name
+
+    @name.setter
+    def name(self, a_name):
+        """name setter property sets a new object name.
+        """
+        self._name = a_name
+
     def open(self, a_handler):
         """open method is a virtual call done by the handler the first time
         the object is being activated in the scene.
@@ -5,6 +5,7 @@ game that contains an sprite.
 import uuid
 import pygame
 from . import idefaults
+from . import render
 
 
 class ISprite(pygame.sprite.Sprite):
@@ -46,6 +47,8 @@ class ISprite(pygame.sprite.Sprite):
         - rect pygame Rectangle instance is a derived attribute where the
         surface rectangle used to display the player sprite is stored.
 
+        Changes in the image or position (using set_position) mark the sprite
+        as dirty, so it is redrawn by the renderer.
         """
         super().__init__()
         self.position = kwargs.get("a_position", pygame.Vector2())
@@ -64,6 +67,38 @@ class ISprite(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.topleft = self.position
 
+    @property
+    def image(self):
+        """image property returns the pygame Surface displayed for the
+        sprite.
+        """
+        return self._image
+
+    @image.setter
+    def image(self, a_image):
+        """image setter property sets a new pygame Surface to be displayed
+        for the sprite and marks it as dirty when it is a different one.
+        """
+        if a_image is getattr(self, "_image", None):
+            return
+        self._image = a_image
+        self.mark_dirty()
+
+    def set_position(self, a_position):
+        """set_position method sets a new graphical position for the sprite.
+        """
+        self.previous_position = self.position
+        self.position = a_position
+        self.rect.topleft = a_position
+        self.mark_dirty()
+
+    def mark_dirty(self, a_area=None):
+        """mark_dirty method notifies the sprite has to be redrawn. a_area is
+        an optional rectangle, in sprite local coordinates, with the part of
+        the image that changed.
+        """
+        render.mark_dirty(self, a_area)
+
     def draw_sprite(self, a_screen):
         """draw_sprite method is a virtual method to be overwritten in
         any derived class with the actual sprite drawing information.
@@ -11,6 +11,8 @@ class Timer(iobject.IObject):
     """Timer class contains all functionality to create an engine timer.
     """
 
+    __slots__ = ("timeout", "start_time", "times", "callback", "callback_args", "active", "scheduler")
+
     def __init__(self, a_name, a_timeout, a_callback, a_cb_args={}, a_time=ONE_TIME):
         """__init__ method creates a new Timer instance.
 
@@ -30,6 +32,9 @@ class Timer(iobject.IObject):
 
         - callback_args attribute contains the dictionary with parameter to be
         passed to the timer callback.
+
+        - scheduler attribute contains the TimerScheduler the timer was added
+        to, or None.
         """
         super().__init__(a_name)
         self.timeout = a_timeout
@@ -38,31 +43,44 @@ class Timer(iobject.IObject):
         self.callback = a_callback
         self.callback_args = a_cb_args
         self.active = False
+        self.scheduler = None
 
     def activate(self):
-        """activate method activates the timer.
+        """activate method activates the timer. When it was added to a
+        scheduler, it is scheduled again from the scheduler time.
         """
-        self.activate = True
-        self.start_time = pygame.time.get_ticks()
+        self.active = True
+        if self.scheduler is not None:
+            self.scheduler.reschedule(self)
+        else:
+            self.start_time = pygame.time.get_ticks()
 
     def deactivate(self):
         """deactivate method deactivates the timer.
         """
-        self.activate = False
+        self.active = False
         self.start_time = 0
 
-    def tick(self):
+    def expire(self, a_now):
+        """expire method is called when the timer expires at the given time.
+        It calls the timer callback and deactivates the timer when it has
+        been repeated the given number of times.
+        """
+        self.callback(**self.callback_args)
+        self.start_time = a_now
+        if self.times != ALWAYS_TIME:
+            self.times -= 1
+        if self.times == 0:
+            self.deactivate()
+
+    def tick(self, a_now=None):
         """tick method adds a new tick time to the timer and check if it has
-        expired.
+        expired. Timers added to a handler are fired by its TimerScheduler
+        instead.
         """
-        if not self.activate:
+        if not self.active:
             return False
-        v_actual_time = pygame.time.get_ticks()
+        v_actual_time = pygame.time.get_ticks() if a_now is None else a_now
         if v_actual_time - self.start_time >= self.timeout:
-            self.callback(**self.callback_args)
-            self.start_time = v_actual_time 
-            if self.times != ALWAYS_TIME:
-                self.times -= 1
-            if self.times == 0:
-                self.deactivate()
+            self.expire(v_actual_time)
         return True
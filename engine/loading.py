@@ -0,0 +1,100 @@
+"""loading.py module contains the loading scene displayed while assets are
+preloaded.
+"""
+
+import pygame
+from . import icolors
+from . import isprite
+from . import gobject
+from . import gevent
+from . import scene
+
+
+class ProgressBar(isprite.ISprite):
+    """ProgressBar class implements a sprite displaying a horizontal progress
+    bar.
+    """
+
+    def __init__(self, **kwargs):
+        """__init__ method creates a new ProgressBar instance.
+
+        - progress attribute stores the fraction displayed, from 0.0 to 1.0.
+        """
+        self.progress = 0.0
+        kwargs.setdefault("a_width", 200)
+        kwargs.setdefault("a_length", 16)
+        kwargs.setdefault("a_foreground_color", icolors.BLUE)
+        kwargs.setdefault("a_background_color", icolors.WHITE)
+        super().__init__(**kwargs)
+
+    def draw_sprite(self, a_surface):
+        """draw_sprite method draws the progress bar.
+        """
+        a_surface.fill(self.background_color)
+        v_fill = int((self.width - 4) * self.progress)
+        if v_fill > 0:
+            a_surface.fill(self.foreground_color, (2, 2, v_fill, self.length - 4))
+        pygame.draw.rect(a_surface, self.foreground_color, a_surface.get_rect(), 1)
+
+    def set_progress(self, a_progress):
+        """set_progress method sets a new progress value and redraws the bar
+        when it changed.
+        """
+        v_progress = min(max(a_progress, 0.0), 1.0)
+        if v_progress == self.progress:
+            return False
+        self.progress = v_progress
+        self.draw_sprite(self.image)
+        self.mark_dirty()
+        return True
+
+
+class LoadingScene(scene.Scene):
+    """LoadingScene class implements the scene displayed while a Preloader
+    loads assets. The preloader is polled at the start of every frame and the
+    progress is displayed with a ProgressBar. When all assets are loaded the
+    scene notifies the "action/top/scene:loaded" event.
+    """
+
+    def __init__(self, a_preloader, **kwargs):
+        """__init__ method creates a new LoadingScene instance.
+
+        - preloader attribute stores the Preloader being polled.
+
+        - budget attribute stores the maximum number of images converted in
+        every frame. None means no limit.
+
+        - bar attribute stores the GObject with the ProgressBar sprite.
+
+        - loaded attribute stores if the loaded event was already notified.
+        """
+        super().__init__(a_name=kwargs.get("a_name", "scene/loading"))
+        self.preloader = a_preloader
+        self.budget = kwargs.get("a_budget", None)
+        v_position = kwargs.get("a_position", pygame.Vector2())
+        self.bar = gobject.GObject(a_position=v_position)
+        self.bar.sprite = ProgressBar(a_position=v_position)
+        self.bar.width = self.bar.sprite.width
+        self.bar.height = self.bar.sprite.length
+        self.add_object(self.bar)
+        self.loaded = False
+
+    def open(self, **kwargs):
+        """open method starts loading assets.
+        """
+        super().open(**kwargs)
+        self.preloader.start()
+
+    def start_frame(self, a_fps):
+        """start_frame method polls the preloader and updates the progress
+        displayed.
+        """
+        super().start_frame(a_fps)
+        if self.loaded:
+            return
+        self.preloader.poll(self.budget)
+        self.bar.sprite.set_progress(self.preloader.progress)
+        if self.preloader.finished:
+            self.loaded = True
+            if self.notifier:
+                self.notifier(gevent.GEvent("action/top/scene:loaded", {"object": self, "errors": self.preloader.errors}))
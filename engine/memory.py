@@ -0,0 +1,64 @@
+"""memory.py module contains the report with the memory used by engine
+objects, grouped by type.
+"""
+
+import collections
+import sys
+
+
+def object_bytes(a_object):
+    """object_bytes function returns the bytes used by the object itself and
+    its attributes dictionary, when it has one. Attribute values are not
+    included.
+    """
+    v_bytes = sys.getsizeof(a_object)
+    v_dict = getattr(a_object, "__dict__", None)
+    if v_dict is not None:
+        v_bytes += sys.getsizeof(v_dict)
+    return v_bytes
+
+
+def collect_handler_objects(a_handler):
+    """collect_handler_objects function returns a list with all objects in the
+    given handler: game objects, sprites, timers and queued events, and the
+    ones in every scene when it is a game handler.
+    """
+    v_objects = []
+    v_handlers = [a_handler] + list(getattr(a_handler, "scenes", []))
+    for l_handler in v_handlers:
+        for l_object in l_handler.objects:
+            v_objects.append(l_object)
+            v_sprite = getattr(l_object, "sprite", None)
+            if v_sprite is not None:
+                v_objects.append(v_sprite)
+        v_objects.extend(l_handler.timers)
+        v_objects.extend(l_handler.events)
+    return v_objects
+
+
+def memory_report(a_objects):
+    """memory_report function returns a dictionary with (number of objects,
+    total bytes, bytes per object) for every type name in the given objects.
+    Objects are counted only once.
+    """
+    v_counts = collections.Counter()
+    v_bytes = collections.Counter()
+    v_seen = set()
+    for l_object in a_objects:
+        if id(l_object) in v_seen:
+            continue
+        v_seen.add(id(l_object))
+        v_name = type(l_object).__name__
+        v_counts[v_name] += 1
+        v_bytes[v_name] += object_bytes(l_object)
+    return {l_name: (v_counts[l_name], v_bytes[l_name], v_bytes[l_name] / v_counts[l_name])
+            for l_name in sorted(v_counts)}
+
+
+def format_memory_report(a_report):
+    """format_memory_report function returns the memory report as a string.
+    """
+    v_lines = ["{:<20} {:>8} {:>12} {:>10}".format("type", "count", "bytes", "bytes/obj")]
+    for l_name, (l_count, l_bytes, l_per_object) in a_report.items():
+        v_lines.append("{:<20} {:>8} {:>12} {:>10.1f}".format(l_name, l_count, l_bytes, l_per_object))
+    return "\n".join(v_lines)
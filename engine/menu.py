@@ -4,6 +4,9 @@
 import pygame
 from pygame.locals import *
 from . import icolors
+from . import idefaults
+from . import render
+from . import fonts
 
 
 class PopUpMenu(pygame.sprite.Sprite):
@@ -11,7 +14,7 @@ class PopUpMenu(pygame.sprite.Sprite):
     options.
     """
 
-    def __init__(self, a_position, a_options):
+    def __init__(self, a_position, a_options, a_visible=idefaults.DEFAULT_MENU_ROWS):
         """__init__ methods initializes a PopUpMenu instance with the given
         options (list).
 
@@ -24,19 +27,30 @@ class PopUpMenu(pygame.sprite.Sprite):
         - selected attribute marks the index of the options being selected at
         any time.
 
+        - visible attribute stores the number of options displayed at the same
+        time. Longer lists are scrolled.
+
+        - top attribute stores the index of the first option displayed.
+
         - font_size attribute stores the size of the pygame font to be used.
 
-        - font attribute stores the pygame font being used.
+        - font attribute stores the pygame font being used, shared through the
+        font registry.
 
         - padding attribute stores the padding between any string displayed for
         every option.
 
         - width attribute stores the width for the popup menu.
 
-        - length attribute stores the length for the popup menu
+        - length attribute stores the length for every option row.
+
+        - rows dictionary stores the rendered row surface for every (option
+        index, highlighted) entry, in least recently used order. It is bounded
+        by the number of options displayed, not by the number of options.
 
         - image pygame Surface instance is a derived attribute where the
-        pygame Surface used to display the popup menu is stored.
+        pygame Surface used to display the popup menu is stored. It only
+        contains the options displayed.
 
         - rect pygame Rectangle instance is a derived attribute where the
         surface rectangle used to display the popup menu is stored.
@@ -45,13 +59,16 @@ class PopUpMenu(pygame.sprite.Sprite):
         self.position = a_position
         self.options = a_options
         self.selected = 0
+        self.visible = max(1, min(a_visible, len(self.options))) if a_visible else max(1, len(self.options))
+        self.top = 0
         self.font_size = 24
-        self.font = pygame.font.SysFont("arial", self.font_size)
+        self.font = fonts.get_font("arial", self.font_size)
         max_width = max(map(lambda x: self.font.size(x)[0], self.options))
         self.padding = 4
         self.width = max_width + 8 * self.padding
         self.length = self.font_size + 2 * self.padding
-        self.image = pygame.Surface((self.width, self.length * len(self.options)))
+        self.rows = {}
+        self.image = pygame.Surface((self.width, self.length * self.visible))
         self.draw()
         self.rect = self.image.get_rect()
         self.rect.topleft = a_position
@@ -67,27 +84,76 @@ class PopUpMenu(pygame.sprite.Sprite):
         """
         self.position = a_position
         self.rect.topleft = self.position
-        self.draw()
+        render.mark_dirty(self)
+
+    def get_row(self, a_index, a_highlighted):
+        """get_row method returns the surface for the given option, rendering
+        it only the first time.
+        """
+        v_key = (a_index, a_highlighted)
+        v_row = self.rows.pop(v_key, None)
+        if v_row is None:
+            v_row = self.render_row(self.options[a_index], a_highlighted)
+            if len(self.rows) >= 4 * self.visible:
+                del self.rows[next(iter(self.rows))]
+        self.rows[v_key] = v_row
+        return v_row
+
+    def render_row(self, a_option, a_highlighted):
+        """render_row method renders a new surface for the given option.
+        """
+        if a_highlighted:
+            v_background_color = icolors.BLACK
+            v_foreground_color = icolors.WHITE
+        else:
+            v_background_color = icolors.WHITE
+            v_foreground_color = icolors.BLACK
+        v_row = pygame.Surface((self.width, self.length))
+        v_row.fill(v_background_color)
+        pygame.draw.rect(v_row, icolors.BLACK, (0, 0, self.width, self.length), 1)
+        v_option_image = fonts.render_text(self.font, a_option, True, v_foreground_color)
+        v_row.blit(v_option_image, (self.padding, self.padding))
+        return v_row
+
+    def draw_row(self, a_index):
+        """draw_row method displays one option, when it is visible, and marks
+        only its area as dirty.
+        """
+        if not (self.top <= a_index < self.top + self.visible):
+            return False
+        v_area = pygame.Rect(0, (a_index - self.top) * self.length, self.width, self.length)
+        self.image.blit(self.get_row(a_index, a_index == self.selected), v_area)
+        render.mark_dirty(self, v_area)
+        return True
 
     def draw(self):
-        """draw methods displays the menu in the surface.
+        """draw methods displays all visible options in the surface.
         """
         self.image.fill(icolors.WHITE)
-        v_background_color = icolors.WHITE
-        v_foreground_color = icolors.BLACK
-        v_pos_y = 0
-        for l_index, l_option in enumerate(self.options):
-            if l_index == self.selected:
-                v_background_color = icolors.BLACK
-                v_foreground_color = icolors.WHITE
-            else:
-                v_background_color = icolors.WHITE
-                v_foreground_color = icolors.BLACK
-            pygame.draw.rect(self.image, v_background_color, (0, v_pos_y, self.width, self.length))
-            pygame.draw.rect(self.image, icolors.BLACK, (0, v_pos_y, self.width, self.length), 1)
-            v_option_image = self.font.render(l_option, True, v_foreground_color)
-            self.image.blit(v_option_image, (self.padding, v_pos_y + self.padding))
-            v_pos_y += self.length
+        for l_index in range(self.top, min(self.top + self.visible, len(self.options))):
+            self.image.blit(self.get_row(l_index, l_index == self.selected), (0, (l_index - self.top) * self.length))
+        render.mark_dirty(self)
+
+    def select(self, a_index):
+        """select method selects the given option, scrolling the menu when it
+        is not visible. Only the rows whose highlight changed are redrawn,
+        unless the menu scrolls.
+        """
+        v_index = min(max(a_index, 0), len(self.options) - 1)
+        if v_index == self.selected:
+            return False
+        v_previous = self.selected
+        self.selected = v_index
+        if v_index < self.top:
+            self.top = v_index
+            self.draw()
+        elif v_index >= self.top + self.visible:
+            self.top = v_index - self.visible + 1
+            self.draw()
+        else:
+            self.draw_row(v_previous)
+            self.draw_row(v_index)
+        return True
 
     def handle_keyboard_event(self, a_event):
         """handle_keyboard_event method moves the player with the given
@@ -95,14 +161,15 @@ class PopUpMenu(pygame.sprite.Sprite):
         """
         v_selected = None
         if a_event.key == K_UP:
-            if self.selected != 0:
-                self.selected -= 1
+            self.select(self.selected - 1)
         if a_event.key == K_DOWN:
-            if self.selected < len(self.options) - 1:
-                self.selected += 1
+            self.select(self.selected + 1)
+        if a_event.key == K_PAGEUP:
+            self.select(self.selected - self.visible)
+        if a_event.key == K_PAGEDOWN:
+            self.select(self.selected + self.visible)
         if a_event.key == K_RETURN:
             v_selected = self.options[self.selected]
-        self.draw()
         return v_selected
 
 
@@ -0,0 +1,341 @@
+"""pathfinding.py module contains the pathfinding service over a board grid.
+
+Movement is 4-connected and moving into a cell costs the cell "cost" field.
+Cells flagged with FLAG_BLOCKED can not be entered and, when occupied cells
+are avoided, cells with objects can not be entered either.
+"""
+
+import heapq
+import math
+import numpy
+from . import idefaults
+from . import grid
+
+INFINITE = math.inf
+
+
+class DistanceField:
+    """DistanceField class contains the cost to reach a target cell from every
+    cell in the grid.
+    """
+
+    __slots__ = ("target", "avoid_occupied", "distances", "hops")
+
+    def __init__(self, a_target, a_avoid_occupied, a_distances, a_hops):
+        """__init__ method creates a new DistanceField instance.
+
+        - target attribute stores the target cell index.
+
+        - avoid_occupied attribute stores if occupied cells can not be
+        entered.
+
+        - distances list stores the cost to reach the target from every cell
+        index (INFINITE when it can not be reached).
+
+        - hops list stores the number of steps in the cheapest path to the
+        target from every cell index. Among paths with the same cost the one
+        with fewer steps is used, so following the field always gets closer
+        to the target, even through cells with zero cost.
+        """
+        self.target = a_target
+        self.avoid_occupied = a_avoid_occupied
+        self.distances = a_distances
+        self.hops = a_hops
+
+
+class PathFinder:
+    """PathFinder class implements A* and Dijkstra searches over a grid, with
+    cached distance fields toward common targets. Fields are updated when the
+    grid changes: cheaper cells are repaired in place and fields whose paths
+    crossed a more expensive cell are dropped and built again on demand.
+
+    Cells are given as (x, y) board coordinates.
+    """
+
+    def __init__(self, a_grid, a_max_fields=idefaults.DEFAULT_PATHFINDING_FIELDS):
+        """__init__ method creates a new PathFinder instance.
+
+        - grid attribute stores the Grid instance used to search.
+
+        - max_fields attribute stores the maximum number of distance fields
+        cached.
+
+        - fields dictionary stores the cached DistanceField instances by
+        (target, avoid_occupied), in least recently used order.
+
+        - static_costs list stores the cost to enter every cell index, with
+        INFINITE for blocked cells. It is built on demand.
+
+        - occupied_costs list stores the same costs, but with INFINITE for
+        occupied cells too.
+
+        - min_cost attribute stores a lower bound for the cost to enter any
+        cell, used as A* heuristic factor.
+        """
+        self.grid = a_grid
+        self.max_fields = a_max_fields
+        self.fields = {}
+        self.static_costs = None
+        self.occupied_costs = None
+        self.min_cost = 0.0
+        self.grid.add_listener(self.on_grid_change)
+
+    def to_index(self, a_cell):
+        """to_index method returns the flat index for the given cell.
+        """
+        return int(a_cell[0]) * self.grid.length + int(a_cell[1])
+
+    def to_cell(self, a_index):
+        """to_cell method returns the (x, y) cell for the given flat index.
+        """
+        return divmod(a_index, self.grid.length)
+
+    def neighbours(self, a_index):
+        """neighbours method returns the flat indexes for all cells adjacent
+        to the given one.
+        """
+        v_length = self.grid.length
+        v_x, v_y = divmod(a_index, v_length)
+        v_result = []
+        if v_x > 0:
+            v_result.append(a_index - v_length)
+        if v_x < self.grid.width - 1:
+            v_result.append(a_index + v_length)
+        if v_y > 0:
+            v_result.append(a_index - 1)
+        if v_y < v_length - 1:
+            v_result.append(a_index + 1)
+        return v_result
+
+    def compute_costs(self, a_cells):
+        """compute_costs method returns the static and occupied cost arrays
+        for the given cells array.
+        """
+        v_blocked = (a_cells["flags"] & grid.FLAG_BLOCKED) != 0
+        v_static = numpy.where(v_blocked, INFINITE, a_cells["cost"].astype(float))
+        v_occupied = numpy.where(a_cells["occupancy"] > 0, INFINITE, v_static)
+        return v_static, v_occupied
+
+    def get_costs(self, a_avoid_occupied):
+        """get_costs method returns the list with the cost to enter every cell
+        index.
+        """
+        if self.static_costs is None:
+            v_static, v_occupied = self.compute_costs(self.grid.cells)
+            self.static_costs = v_static.ravel().tolist()
+            self.occupied_costs = v_occupied.ravel().tolist()
+            self.min_cost = max(float(numpy.min(self.grid.cells["cost"])), 0.0)
+        return self.occupied_costs if a_avoid_occupied else self.static_costs
+
+    # Search methods -- start --
+    def find_path(self, a_start, a_goal, a_avoid_occupied=False):
+        """find_path method returns the list of cells to move from start to
+        goal (start not included) or None when goal can not be reached. A
+        cached distance field toward the goal is followed when available,
+        else A* is used. The goal cell is never considered occupied.
+        """
+        v_key = (self.to_index(a_goal), a_avoid_occupied)
+        if v_key in self.fields:
+            return self.follow_field(a_start, a_goal, a_avoid_occupied)
+        v_costs = self.get_costs(a_avoid_occupied)
+        v_static = self.get_costs(False)
+        v_start, v_goal = self.to_index(a_start), self.to_index(a_goal)
+        v_goal_x, v_goal_y = self.to_cell(v_goal)
+        v_min_cost = self.min_cost
+        v_distances = {v_start: 0.0}
+        v_previous = {}
+        v_heap = [(0.0, 0.0, v_start)]
+        while v_heap:
+            _, v_distance, v_index = heapq.heappop(v_heap)
+            if v_index == v_goal:
+                return self.build_path(v_previous, v_start, v_goal)
+            if v_distance > v_distances[v_index]:
+                continue
+            for l_next in self.neighbours(v_index):
+                v_step = v_static[l_next] if l_next == v_goal else v_costs[l_next]
+                v_next_distance = v_distance + v_step
+                if v_next_distance < v_distances.get(l_next, INFINITE):
+                    v_distances[l_next] = v_next_distance
+                    v_previous[l_next] = v_index
+                    v_x, v_y = self.to_cell(l_next)
+                    v_heuristic = (abs(v_x - v_goal_x) + abs(v_y - v_goal_y)) * v_min_cost
+                    heapq.heappush(v_heap, (v_next_distance + v_heuristic, v_next_distance, l_next))
+        return None
+
+    def build_path(self, a_previous, a_start, a_goal):
+        """build_path method returns the list of cells from start (not
+        included) to goal, using the previous index of every visited cell.
+        """
+        v_path = []
+        v_index = a_goal
+        while v_index != a_start:
+            v_path.append(self.to_cell(v_index))
+            v_index = a_previous[v_index]
+        v_path.reverse()
+        return v_path
+
+    def reachable(self, a_start, a_budget, a_avoid_occupied=True):
+        """reachable method returns a dictionary with all cells that can be
+        reached from start with the given movement budget (movement range)
+        and the cost to reach every one of them.
+        """
+        v_costs = self.get_costs(a_avoid_occupied)
+        v_start = self.to_index(a_start)
+        v_distances = {v_start: 0.0}
+        v_heap = [(0.0, v_start)]
+        while v_heap:
+            v_distance, v_index = heapq.heappop(v_heap)
+            if v_distance > v_distances[v_index]:
+                continue
+            for l_next in self.neighbours(v_index):
+                v_next_distance = v_distance + v_costs[l_next]
+                if v_next_distance <= a_budget and v_next_distance < v_distances.get(l_next, INFINITE):
+                    v_distances[l_next] = v_next_distance
+                    heapq.heappush(v_heap, (v_next_distance, l_next))
+        return {self.to_cell(l_index): l_distance for l_index, l_distance in v_distances.items()}
+    # Search methods -- end --
+
+    # Distance field methods -- start --
+    def get_field(self, a_target, a_avoid_occupied=False):
+        """get_field method returns the DistanceField toward the given target,
+        building it when it is not cached.
+        """
+        v_key = (self.to_index(a_target), a_avoid_occupied)
+        v_field = self.fields.pop(v_key, None)
+        if v_field is None:
+            v_field = self.build_field(v_key[0], a_avoid_occupied)
+        self.fields[v_key] = v_field
+        while len(self.fields) > self.max_fields:
+            del self.fields[next(iter(self.fields))]
+        return v_field
+
+    def build_field(self, a_target, a_avoid_occupied):
+        """build_field method runs a reverse Dijkstra search from the target
+        and returns the new DistanceField.
+        """
+        v_distances = [INFINITE] * (self.grid.width * self.grid.length)
+        v_distances[a_target] = 0.0
+        v_field = DistanceField(a_target, a_avoid_occupied, v_distances, [0] * len(v_distances))
+        self.propagate(v_field, [(0.0, 0, a_target)])
+        return v_field
+
+    def propagate(self, a_field, a_heap):
+        """propagate method runs the reverse Dijkstra search for the given
+        field from the (distance, hops, index) entries in the heap. Paths are
+        compared by cost and then by number of steps. Cells that can not be
+        entered get a distance but they are not expanded.
+        """
+        v_costs = self.get_costs(a_field.avoid_occupied)
+        v_static = self.get_costs(False)
+        v_distances = a_field.distances
+        v_hops = a_field.hops
+        v_target = a_field.target
+        while a_heap:
+            v_distance, v_hop, v_index = heapq.heappop(a_heap)
+            if (v_distance, v_hop) > (v_distances[v_index], v_hops[v_index]):
+                continue
+            v_step = v_static[v_index] if v_index == v_target else v_costs[v_index]
+            if v_step == INFINITE:
+                continue
+            v_next_distance = v_distance + v_step
+            v_next_hop = v_hop + 1
+            for l_next in self.neighbours(v_index):
+                if (v_next_distance, v_next_hop) < (v_distances[l_next], v_hops[l_next]):
+                    v_distances[l_next] = v_next_distance
+                    v_hops[l_next] = v_next_hop
+                    heapq.heappush(a_heap, (v_next_distance, v_next_hop, l_next))
+
+    def get_distance(self, a_start, a_target, a_avoid_occupied=False):
+        """get_distance method returns the cost to move from start to target
+        using the cached distance field.
+        """
+        return self.get_field(a_target, a_avoid_occupied).distances[self.to_index(a_start)]
+
+    def next_step(self, a_start, a_target, a_avoid_occupied=False):
+        """next_step method returns the next cell to move from start toward
+        the target, or None if target is reached or can not be reached.
+        """
+        v_field = self.get_field(a_target, a_avoid_occupied)
+        v_index = self.to_index(a_start)
+        v_next = self.next_index(v_field, v_index)
+        return None if v_next is None else self.to_cell(v_next)
+
+    def next_index(self, a_field, a_index):
+        """next_index method returns the adjacent cell index with the lowest
+        cost toward the field target, and the fewest steps among the ones with
+        the same cost. The step count always decreases.
+        """
+        if a_index == a_field.target or a_field.distances[a_index] == INFINITE:
+            return None
+        v_costs = self.get_costs(a_field.avoid_occupied)
+        v_static = self.get_costs(False)
+        v_best, v_best_key = None, (INFINITE, 0)
+        for l_next in self.neighbours(a_index):
+            v_step = v_static[l_next] if l_next == a_field.target else v_costs[l_next]
+            v_key = (a_field.distances[l_next] + v_step, a_field.hops[l_next])
+            if v_key < v_best_key:
+                v_best, v_best_key = l_next, v_key
+        return v_best
+
+    def follow_field(self, a_start, a_target, a_avoid_occupied=False):
+        """follow_field method returns the path from start to target following
+        the distance field toward the target, or None when it can not be
+        reached. Every step decreases the field step count, so it ends even
+        with cells with zero cost.
+        """
+        v_field = self.get_field(a_target, a_avoid_occupied)
+        v_index = self.to_index(a_start)
+        if v_field.distances[v_index] == INFINITE:
+            return None
+        v_path = []
+        while v_index != v_field.target:
+            v_index = self.next_index(v_field, v_index)
+            if v_index is None:
+                return None
+            v_path.append(self.to_cell(v_index))
+        return v_path
+    # Distance field methods -- end --
+
+    def on_grid_change(self, a_rect, a_fields, a_mask=None):
+        """on_grid_change method is called by the grid when cells change. It
+        updates the cost lists and the cached distance fields.
+        """
+        v_static_change = "cost" in a_fields or "flags" in a_fields
+        if self.static_costs is None or not (v_static_change or "occupancy" in a_fields):
+            return
+        if a_rect.width * a_rect.height > idefaults.DEFAULT_PATHFINDING_REBUILD_AREA:
+            self.static_costs = None
+            self.occupied_costs = None
+            self.fields.clear()
+            return
+        v_cells = self.grid.cells[a_rect.left:a_rect.right, a_rect.top:a_rect.bottom]
+        v_static, v_occupied = self.compute_costs(v_cells)
+        for l_x in range(a_rect.width):
+            for l_y in range(a_rect.height):
+                v_index = self.to_index((a_rect.left + l_x, a_rect.top + l_y))
+                v_old = (self.static_costs[v_index], self.occupied_costs[v_index])
+                v_new = (float(v_static[l_x, l_y]), float(v_occupied[l_x, l_y]))
+                if v_old == v_new:
+                    continue
+                self.static_costs[v_index], self.occupied_costs[v_index] = v_new
+                self.min_cost = max(min(self.min_cost, v_new[0]), 0.0)
+                self.update_fields(v_index, v_old, v_new)
+
+    def update_fields(self, a_index, a_old, a_new):
+        """update_fields method updates all cached distance fields because the
+        cost to enter the given cell index changed from a_old to a_new
+        (static, occupied) costs.
+        """
+        for l_key, l_field in list(self.fields.items()):
+            v_which = 1 if l_field.avoid_occupied and a_index != l_field.target else 0
+            v_old, v_new = a_old[v_which], a_new[v_which]
+            if v_old == v_new:
+                continue
+            v_distances = l_field.distances
+            v_distance = v_distances[a_index]
+            if v_distance == INFINITE:
+                continue
+            if v_new < v_old:
+                self.propagate(l_field, [(v_distance, l_field.hops[a_index], a_index)])
+            elif any(v_distances[l_next] == v_distance + v_old for l_next in self.neighbours(a_index)):
+                del self.fields[l_key]
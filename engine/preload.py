@@ -0,0 +1,131 @@
+"""preload.py module contains the preloader used to load images in background
+before they are required.
+"""
+
+import collections
+import concurrent.futures
+from . import assets
+from . import idefaults
+
+
+class Preloader:
+    """Preloader class loads a set of images into the asset manager. Image
+    files are decoded in a pool of worker threads (SDL_image releases the GIL
+    while decoding) and decoded images are converted to the display format
+    and cached in the main thread, when poll is called.
+    """
+
+    def __init__(self, a_paths, a_manager=None, a_workers=idefaults.DEFAULT_PRELOAD_WORKERS):
+        """__init__ method creates a new Preloader instance.
+
+        - manager attribute stores the AssetManager where images are cached.
+
+        - files list stores all image files to be loaded. Files already cached
+        are skipped.
+
+        - workers attribute stores the number of worker threads.
+
+        - executor attribute stores the thread pool while loading.
+
+        - pending deque stores (file, future) entries decoding, in the order
+        they were submitted.
+
+        - loaded attribute stores the number of files already cached.
+
+        - errors dictionary stores the exception raised for every file that
+        could not be loaded.
+        """
+        self.manager = a_manager if a_manager else assets.get_manager()
+        self.files = [l_file for l_file in self.manager.expand(a_paths) if l_file not in self.manager]
+        self.workers = a_workers
+        self.executor = None
+        self.pending = collections.deque()
+        self.loaded = 0
+        self.errors = {}
+
+    @property
+    def total(self):
+        """total property returns the number of files to be loaded.
+        """
+        return len(self.files)
+
+    @property
+    def progress(self):
+        """progress property returns the fraction of files already processed,
+        from 0.0 to 1.0.
+        """
+        if not self.files:
+            return 1.0
+        return (self.loaded + len(self.errors)) / len(self.files)
+
+    @property
+    def finished(self):
+        """finished property returns if all files have been processed.
+        """
+        return self.loaded + len(self.errors) == len(self.files)
+
+    def start(self):
+        """start method submits all files to the worker threads.
+        """
+        if self.executor is not None or self.finished:
+            return False
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        for l_file in self.files:
+            self.pending.append((l_file, self.executor.submit(self.manager.decode, l_file)))
+        return True
+
+    def poll(self, a_budget=None):
+        """poll method converts and caches images already decoded, in the order
+        they were submitted, up to a_budget images (all of them when it is
+        None). It never blocks and it has to be called from the main thread.
+
+        It returns the number of images processed.
+        """
+        self.start()
+        v_processed = 0
+        while self.pending and self.pending[0][1].done() and (a_budget is None or v_processed < a_budget):
+            v_file, v_future = self.pending.popleft()
+            self.complete(v_file, v_future)
+            v_processed += 1
+        if not self.pending:
+            self.shutdown()
+        return v_processed
+
+    def wait(self):
+        """wait method blocks until all images are loaded and cached.
+        """
+        self.start()
+        while self.pending:
+            v_file, v_future = self.pending.popleft()
+            concurrent.futures.wait([v_future])
+            self.complete(v_file, v_future)
+        self.shutdown()
+
+    def complete(self, a_file, a_future):
+        """complete method caches the image decoded by the given future.
+        """
+        try:
+            v_image = a_future.result()
+        except Exception as ex:
+            self.errors[a_file] = ex
+            return False
+        self.manager.store(a_file, self.manager.convert(v_image))
+        self.loaded += 1
+        return True
+
+    def cancel(self):
+        """cancel method cancels all files not decoded yet.
+        """
+        for _, l_future in self.pending:
+            l_future.cancel()
+        self.pending.clear()
+        self.shutdown()
+
+    def shutdown(self):
+        """shutdown method releases the worker threads.
+        """
+        if self.executor is None:
+            return False
+        self.executor.shutdown(wait=False)
+        self.executor = None
+        return True
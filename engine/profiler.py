@@ -0,0 +1,256 @@
+"""profiler.py module contains the instrumentation to measure where the time
+of every engine frame goes.
+"""
+
+import json
+import time
+import numpy
+from . import icolors
+from . import idefaults
+from . import isprite
+from . import fonts
+
+
+class FrameProfiler:
+    """FrameProfiler class records the duration of every phase in the last
+    frames in a fixed-size ring buffer.
+
+    Phases are identified by a (phase, owner) key, like ("update", None) for
+    the whole handler update or ("update", "board") for one scene layer, and
+    they are displayed as "phase" or "phase/owner". The engine and the game
+    handler only call the profiler when it is enabled.
+    """
+
+    def __init__(self, a_frames=idefaults.DEFAULT_PROFILER_FRAMES, a_phases=idefaults.DEFAULT_PROFILER_PHASES):
+        """__init__ method creates a new FrameProfiler instance.
+
+        - enabled attribute stores if frames are being recorded.
+
+        - size attribute stores the number of frames kept in the ring buffer.
+
+        - names list stores the name for every phase column.
+
+        - columns dictionary stores the column for every phase key.
+
+        - durations attribute stores the NumPy array with the milliseconds
+        spent in every phase for every frame.
+
+        - starts attribute stores the NumPy array with the milliseconds from
+        the frame start to the first time every phase started.
+
+        - frame_starts attribute stores the NumPy array with the
+        perf_counter value (seconds) when every frame started.
+
+        - frame_times attribute stores the NumPy array with the milliseconds
+        every frame took.
+
+        - frames attribute stores the number of frames recorded since the last
+        reset. The actual row is frames modulo size.
+
+        - frame_start attribute stores when the actual frame started, or None
+        when no frame is being recorded.
+        """
+        self.enabled = False
+        self.size = a_frames
+        self.names = []
+        self.columns = {}
+        self.durations = numpy.zeros((a_frames, a_phases), dtype=numpy.float64)
+        self.starts = numpy.full((a_frames, a_phases), -1.0, dtype=numpy.float64)
+        self.frame_starts = numpy.zeros(a_frames, dtype=numpy.float64)
+        self.frame_times = numpy.zeros(a_frames, dtype=numpy.float64)
+        self.frames = 0
+        self.frame_start = None
+
+    def enable(self):
+        """enable method starts recording frames.
+        """
+        self.enabled = True
+
+    def disable(self):
+        """disable method stops recording frames.
+        """
+        self.enabled = False
+        self.frame_start = None
+
+    def reset(self):
+        """reset method removes all frames recorded.
+        """
+        self.durations.fill(0.0)
+        self.starts.fill(-1.0)
+        self.frames = 0
+        self.frame_start = None
+
+    def get_column(self, a_key):
+        """get_column method returns the column for the given phase key,
+        adding it the first time. The buffer grows when all columns are used.
+        """
+        v_column = self.columns.get(a_key)
+        if v_column is None:
+            v_column = len(self.names)
+            if v_column >= self.durations.shape[1]:
+                v_extra = self.durations.shape[1]
+                self.durations = numpy.hstack([self.durations, numpy.zeros((self.size, v_extra))])
+                self.starts = numpy.hstack([self.starts, numpy.full((self.size, v_extra), -1.0)])
+            v_phase, v_owner = a_key
+            self.names.append(v_phase if v_owner is None else "{}/{}".format(v_phase, v_owner))
+            self.columns[a_key] = v_column
+        return v_column
+
+    def begin_frame(self):
+        """begin_frame method starts recording a new frame.
+        """
+        v_row = self.frames % self.size
+        self.durations[v_row] = 0.0
+        self.starts[v_row] = -1.0
+        self.frame_start = time.perf_counter()
+        self.frame_starts[v_row] = self.frame_start
+
+    def end_frame(self):
+        """end_frame method finishes recording the actual frame.
+        """
+        if self.frame_start is None:
+            return
+        self.frame_times[self.frames % self.size] = (time.perf_counter() - self.frame_start) * 1000
+        self.frames += 1
+        self.frame_start = None
+
+    def record(self, a_phase, a_owner, a_start, a_end):
+        """record method adds the time between a_start and a_end (perf_counter
+        seconds) to the given phase in the actual frame.
+        """
+        if self.frame_start is None:
+            return
+        v_row = self.frames % self.size
+        v_column = self.get_column((a_phase, a_owner))
+        self.durations[v_row, v_column] += (a_end - a_start) * 1000
+        if self.starts[v_row, v_column] < 0:
+            self.starts[v_row, v_column] = (a_start - self.frame_start) * 1000
+
+    def measure(self, a_phase, a_owner, a_callable, *args):
+        """measure method calls a_callable with the given arguments and records
+        the time it took in the given phase. It returns the callable result.
+        """
+        v_start = time.perf_counter()
+        v_result = a_callable(*args)
+        self.record(a_phase, a_owner, v_start, time.perf_counter())
+        return v_result
+
+    # Statistics methods -- start --
+    def get_rows(self):
+        """get_rows method returns the ring buffer rows with frames recorded,
+        from the oldest to the newest.
+        """
+        if self.frames <= self.size:
+            return numpy.arange(self.frames)
+        return (numpy.arange(self.size) + self.frames) % self.size
+
+    def percentiles(self, a_name=None, a_percentiles=(50, 95, 99)):
+        """percentiles method returns a dictionary with the given percentiles,
+        plus mean and max, in milliseconds, for the frame time (or for the
+        phase with the given name) in the frames recorded.
+        """
+        v_rows = self.get_rows()
+        if len(v_rows) == 0:
+            return {}
+        if a_name is None:
+            v_values = self.frame_times[v_rows]
+        else:
+            v_values = self.durations[v_rows, self.names.index(a_name)]
+        v_stats = {"p{}".format(l_percentile): float(numpy.percentile(v_values, l_percentile)) for l_percentile in a_percentiles}
+        v_stats["mean"] = float(v_values.mean())
+        v_stats["max"] = float(v_values.max())
+        return v_stats
+
+    def get_report(self):
+        """get_report method returns a dictionary with the percentiles for the
+        frame time ("frame") and every phase.
+        """
+        v_report = {"frame": self.percentiles()}
+        for l_name in self.names:
+            v_report[l_name] = self.percentiles(l_name)
+        return v_report
+
+    def format_report(self):
+        """format_report method returns the profiler report as a string.
+        """
+        v_lines = ["{:<28} {:>8} {:>8} {:>8} {:>8}".format("phase (ms)", "p50", "p95", "p99", "max")]
+        for l_name, l_stats in self.get_report().items():
+            if l_stats:
+                v_lines.append("{:<28} {:>8.3f} {:>8.3f} {:>8.3f} {:>8.3f}".format(l_name, l_stats["p50"], l_stats["p95"], l_stats["p99"], l_stats["max"]))
+        return "\n".join(v_lines)
+    # Statistics methods -- end --
+
+    def get_chrome_trace(self):
+        """get_chrome_trace method returns a dictionary in the Chrome trace
+        event format (chrome://tracing, Perfetto) with every frame and phase
+        recorded as complete events.
+        """
+        v_events = []
+        for l_row in self.get_rows():
+            v_frame_start = self.frame_starts[l_row] * 1e6
+            v_events.append({"name": "frame", "ph": "X", "pid": 1, "tid": 1,
+                             "ts": v_frame_start, "dur": self.frame_times[l_row] * 1000})
+            for l_column, l_name in enumerate(self.names):
+                if self.starts[l_row, l_column] < 0:
+                    continue
+                v_events.append({"name": l_name, "ph": "X", "pid": 1, "tid": 1,
+                                 "ts": v_frame_start + self.starts[l_row, l_column] * 1000,
+                                 "dur": self.durations[l_row, l_column] * 1000})
+        return {"traceEvents": v_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, a_path):
+        """export_chrome_trace method writes the frames recorded in the given
+        file using the Chrome trace event JSON format.
+        """
+        with open(a_path, "w") as v_file:
+            json.dump(self.get_chrome_trace(), v_file)
+
+
+class ProfilerOverlay(isprite.ISprite):
+    """ProfilerOverlay class implements a sprite displaying the frame time
+    percentiles and the slowest phases of the last frame. It is refreshed
+    every few frames.
+    """
+
+    def __init__(self, a_profiler, **kwargs):
+        """__init__ method creates a new ProfilerOverlay instance.
+
+        - profiler attribute stores the FrameProfiler displayed.
+
+        - refresh_frames attribute stores every how many frames the overlay is
+        redrawn.
+
+        - lines attribute stores the number of phases displayed.
+
+        - font attribute stores the pygame font used.
+        """
+        self.profiler = a_profiler
+        self.refresh_frames = kwargs.get("a_refresh_frames", idefaults.DEFAULT_PROFILER_OVERLAY_FRAMES)
+        self.lines = kwargs.get("a_lines", 6)
+        self.font = fonts.get_font("arial", 14)
+        kwargs.setdefault("a_width", 240)
+        kwargs.setdefault("a_length", 16 * (self.lines + 1) + 4)
+        kwargs.setdefault("a_foreground_color", icolors.WHITE)
+        kwargs.setdefault("a_background_color", icolors.BLACK)
+        super().__init__(**kwargs)
+
+    def draw_sprite(self, a_surface):
+        """draw_sprite method draws the profiler statistics.
+        """
+        a_surface.fill(self.background_color)
+        v_stats = self.profiler.percentiles()
+        if not v_stats:
+            return
+        v_lines = ["frame p50 {:.2f} p95 {:.2f} p99 {:.2f}".format(v_stats["p50"], v_stats["p95"], v_stats["p99"])]
+        v_row = (self.profiler.frames - 1) % self.profiler.size
+        v_phases = sorted(zip(self.profiler.durations[v_row], self.profiler.names), reverse=True)[:self.lines]
+        v_lines.extend("{:<24} {:.3f}".format(l_name, l_duration) for l_duration, l_name in v_phases)
+        for l_index, l_line in enumerate(v_lines):
+            a_surface.blit(fonts.render_text(self.font, l_line, False, self.foreground_color), (4, 2 + 16 * l_index))
+
+    def update(self, a_fps):
+        """update method redraws the overlay every refresh_frames frames.
+        """
+        if self.profiler.frames % self.refresh_frames == 0:
+            self.draw_sprite(self.image)
+            self.mark_dirty()
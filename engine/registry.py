@@ -0,0 +1,133 @@
+"""registry.py module contains the registry used by handlers to store objects
+and scenes.
+"""
+
+
+class Registry:
+    """Registry class implements an insertion-ordered collection indexed by
+    uid, name and type, so adding, removing and looking for items is O(1).
+
+    Items are indexed by the uid and name they have when they are added.
+    Objects with a lazily formatted name are only indexed by an explicit one.
+    """
+
+    def __init__(self, a_items=()):
+        """__init__ method creates a new Registry instance.
+
+        - items dictionary stores all items, in insertion order, with the
+        (uid, name) keys they were indexed by when they were added.
+
+        - uids dictionary stores the item for every uid.
+
+        - names dictionary stores the items, in insertion order, for every
+        name.
+
+        - types dictionary stores the items, in insertion order, for every
+        item class.
+        """
+        self.items = {}
+        self.uids = {}
+        self.names = {}
+        self.types = {}
+        for l_item in a_items:
+            self.add(l_item)
+
+    def __len__(self):
+        """__len__ method returns the number of items.
+        """
+        return len(self.items)
+
+    def __contains__(self, a_item):
+        """__contains__ method checks if the item is in the registry.
+        """
+        return a_item in self.items
+
+    def __iter__(self):
+        """__iter__ method iterates all items in insertion order. Items can be
+        added or removed while iterating.
+        """
+        return iter(list(self.items))
+
+    def __repr__(self):
+        """__repr__ internal method represents the Registry instance as a
+        string.
+        """
+        return "Registry({})".format(list(self.items))
+
+    @staticmethod
+    def get_item_name(a_item):
+        """get_item_name static method returns the name the item is indexed
+        by, without formatting lazy names.
+        """
+        if hasattr(a_item, "_name"):
+            return a_item._name
+        return getattr(a_item, "name", None)
+
+    def add(self, a_item):
+        """add method adds a new item at the end of the registry.
+        """
+        if a_item in self.items:
+            return False
+        v_uid = getattr(a_item, "uid", None)
+        v_name = self.get_item_name(a_item)
+        self.items[a_item] = (v_uid, v_name)
+        if v_uid is not None:
+            self.uids[v_uid] = a_item
+        if v_name is not None:
+            self.names.setdefault(v_name, {})[a_item] = None
+        self.types.setdefault(type(a_item), {})[a_item] = None
+        return True
+
+    def remove(self, a_item):
+        """remove method removes the item from the registry, using the uid and
+        name it was indexed by, even if they changed after it was added.
+        """
+        if a_item not in self.items:
+            return False
+        v_uid, v_name = self.items.pop(a_item)
+        if v_uid is not None and self.uids.get(v_uid) is a_item:
+            del self.uids[v_uid]
+        v_named = self.names.get(v_name)
+        if v_named is not None:
+            v_named.pop(a_item, None)
+            if not v_named:
+                del self.names[v_name]
+        v_typed = self.types[type(a_item)]
+        del v_typed[a_item]
+        if not v_typed:
+            del self.types[type(a_item)]
+        return True
+
+    def get_by_uid(self, a_uid):
+        """get_by_uid method returns the item with the given uid or None.
+        """
+        return self.uids.get(a_uid)
+
+    def get_by_name(self, a_name):
+        """get_by_name method returns the first item added with the given name
+        or None.
+        """
+        v_named = self.names.get(a_name)
+        if not v_named:
+            return None
+        return next(iter(v_named))
+
+    def get_all_by_name(self, a_name):
+        """get_all_by_name method returns a list with all items with the given
+        name.
+        """
+        return list(self.names.get(a_name, ()))
+
+    def get_by_type(self, a_type, a_exact=False):
+        """get_by_type method returns a list with all items that are instances
+        of the given class (or only of that exact class when a_exact is True),
+        grouped by class. Only the classes registered are checked, not every
+        item.
+        """
+        if a_exact:
+            return list(self.types.get(a_type, ()))
+        v_result = []
+        for l_type, l_items in self.types.items():
+            if issubclass(l_type, a_type):
+                v_result.extend(l_items)
+        return v_result
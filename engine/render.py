@@ -0,0 +1,316 @@
+"""render.py module contains the dirty rectangle rendering pipeline.
+
+Sprites mark themselves dirty when their image or position changes, every
+DirtyGroup collects the screen areas changed since the last frame, and the
+DirtyRenderer only erases (with a cached background) and redraws those areas,
+returning them to be passed to pygame.display.update().
+"""
+
+import pygame
+from . import icolors
+from . import idefaults
+
+
+def mark_dirty(a_sprite, a_area=None):
+    """mark_dirty function notifies every group containing the given sprite
+    that it has to be redrawn.
+
+    - a_area argument is an optional pygame Rect, in sprite local
+    coordinates, with the only part of the sprite image that changed.
+    """
+    for l_group in a_sprite.groups():
+        v_mark_dirty = getattr(l_group, "mark_dirty", None)
+        if v_mark_dirty:
+            v_mark_dirty(a_sprite, a_area)
+
+
+def merge_rects(a_rects):
+    """merge_rects function joins all overlapping rectangles in the given
+    list, so no screen area is redrawn twice in the same frame.
+    """
+    v_merged = []
+    for l_rect in a_rects:
+        if not l_rect:
+            continue
+        v_rect = pygame.Rect(l_rect)
+        v_index = v_rect.collidelist(v_merged)
+        while v_index != -1:
+            v_rect.union_ip(v_merged.pop(v_index))
+            v_index = v_rect.collidelist(v_merged)
+        v_merged.append(v_rect)
+    return v_merged
+
+
+class DirtyGroup(pygame.sprite.Group):
+    """DirtyGroup class implements a pygame sprite Group that keeps track of
+    the sprites that changed since the last time the group was drawn.
+    """
+
+    def __init__(self, *sprites):
+        """__init__ method creates a new DirtyGroup instance.
+
+        - dirty_sprites dictionary stores sprites that have to be redrawn
+        (keys) and the list of local areas changed in every sprite (values).
+        None value means the whole sprite has changed.
+
+        - name attribute stores the name used to identify the group, like the
+        scene owning it, in profiler reports.
+
+        - all_dirty attribute stores if every sprite has to be redrawn in the
+        next frame, like when the group is displayed again. It is resolved
+        when the dirty rectangles are collected, so marking is O(1).
+
+        - drawn_rect attribute stores a pygame Rect bounding every screen area
+        where sprites were drawn since the group was displayed. It is used to
+        erase the group without visiting every sprite.
+
+        spritedict attribute (inherited) stores the screen rectangle where
+        every sprite was drawn the last time and lostsprites list (inherited)
+        stores the rectangles of removed sprites to be erased.
+        """
+        self.dirty_sprites = {}
+        self.name = None
+        self.all_dirty = False
+        self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """add_internal method adds a new sprite to the group, it has to be
+        drawn in the next frame.
+        """
+        super().add_internal(sprite, layer)
+        self.dirty_sprites[sprite] = None
+
+    def remove_internal(self, sprite):
+        """remove_internal method removes a sprite from the group, the area
+        where it was drawn has to be erased in the next frame.
+        """
+        super().remove_internal(sprite)
+        self.dirty_sprites.pop(sprite, None)
+
+    def mark_dirty(self, a_sprite, a_area=None):
+        """mark_dirty method marks the given sprite to be redrawn. a_area is
+        an optional rectangle in sprite local coordinates.
+        """
+        if a_sprite not in self.spritedict:
+            return False
+        if a_area is None:
+            self.dirty_sprites[a_sprite] = None
+            return True
+        v_areas = self.dirty_sprites.setdefault(a_sprite, [])
+        if v_areas is not None:
+            v_areas.append(pygame.Rect(a_area))
+        return True
+
+    def mark_all_dirty(self):
+        """mark_all_dirty method marks all sprites to be redrawn, like when the
+        group is displayed again. Sprites are not visited.
+        """
+        self.all_dirty = True
+
+    def add_drawn_rect(self, a_rect):
+        """add_drawn_rect method grows the bounding rectangle of the areas
+        drawn with the given screen rectangle.
+        """
+        if not self.drawn_rect:
+            self.drawn_rect = a_rect.copy()
+        elif a_rect:
+            self.drawn_rect.union_ip(a_rect)
+
+    def pop_drawn_rects(self):
+        """pop_drawn_rects method returns the screen rectangles where sprites
+        were drawn (or have to be erased) and resets the dirty tracking, like
+        when the group stops being displayed. Sprites are not visited: the
+        bounding rectangle of the areas drawn is returned.
+        """
+        v_rects = self.lostsprites
+        self.lostsprites = []
+        if self.drawn_rect:
+            v_rects.append(self.drawn_rect)
+        self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+        self.dirty_sprites.clear()
+        self.all_dirty = False
+        return v_rects
+
+    def pop_dirty_rects(self):
+        """pop_dirty_rects method returns all screen rectangles changed since
+        the last frame and resets the dirty tracking.
+        """
+        v_rects = self.lostsprites
+        self.lostsprites = []
+        if self.all_dirty:
+            self.all_dirty = False
+            if self.drawn_rect:
+                v_rects.append(self.drawn_rect)
+            self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+            for l_sprite in self.spritedict:
+                v_new_rect = l_sprite.rect.copy()
+                v_rects.append(v_new_rect)
+                self.spritedict[l_sprite] = v_new_rect
+                self.add_drawn_rect(v_new_rect)
+            self.dirty_sprites.clear()
+            return v_rects
+        for l_sprite, l_areas in self.dirty_sprites.items():
+            v_old_rect = self.spritedict[l_sprite]
+            v_new_rect = l_sprite.rect.copy()
+            if l_areas is not None and v_old_rect == v_new_rect:
+                v_rects.extend(l_area.move(v_new_rect.topleft) for l_area in l_areas)
+            else:
+                if v_old_rect:
+                    v_rects.append(v_old_rect)
+                v_rects.append(v_new_rect)
+                self.add_drawn_rect(v_new_rect)
+            self.spritedict[l_sprite] = v_new_rect
+        self.dirty_sprites.clear()
+        return v_rects
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        """draw method draws all sprites in the surface and resets the dirty
+        tracking.
+        """
+        self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+        for l_sprite in self.spritedict:
+            surface.blit(l_sprite.image, l_sprite.rect, None, special_flags)
+            v_rect = l_sprite.rect.copy()
+            self.spritedict[l_sprite] = v_rect
+            self.add_drawn_rect(v_rect)
+        self.lostsprites = []
+        self.dirty_sprites.clear()
+        self.all_dirty = False
+        return list(self.spritedict.values())
+
+    def draw_areas(self, a_surface, a_rects):
+        """draw_areas method draws in the surface all sprites colliding with
+        the given screen rectangles, clipped to every rectangle. Rectangles
+        should not overlap. Collisions are computed once for every sprite.
+        """
+        for l_sprite in self.spritedict:
+            for l_index in l_sprite.rect.collidelistall(a_rects):
+                a_surface.set_clip(a_rects[l_index])
+                a_surface.blit(l_sprite.image, l_sprite.rect)
+        a_surface.set_clip(None)
+
+
+class DirtyRenderer:
+    """DirtyRenderer class implements the renderer that only redraws screen
+    areas changed since the previous frame. When too many areas changed the
+    whole screen is repainted instead, because it is cheaper.
+    """
+
+    def __init__(self, a_background_color=icolors.WHITE):
+        """__init__ method creates a new DirtyRenderer instance.
+
+        - background_color attribute stores the color used to build the
+        background surface.
+
+        - background attribute stores the cached pygame Surface used to erase
+        dirty areas. It is created with the screen size in the first draw.
+
+        - repaint attribute stores if the whole screen has to be redrawn in
+        the next frame.
+
+        - dirty_rects list stores screen rectangles to be redrawn in the next
+        frame that do not belong to any group drawn, like the area of a layer
+        removed.
+
+        - frozen list stores the groups covered by a modal layer. They are
+        rendered once in the snapshot and not drawn live.
+
+        - snapshot attribute stores the pygame Surface with the background
+        and all frozen groups. It is used to erase dirty areas while there
+        are frozen groups.
+
+        - max_rects attribute stores the number of dirty rectangles over
+        which the whole screen is repainted instead.
+
+        - max_area attribute stores the fraction of the screen area covered
+        by dirty rectangles over which the whole screen is repainted instead.
+        """
+        self.background_color = a_background_color
+        self.background = None
+        self.repaint = True
+        self.dirty_rects = []
+        self.frozen = []
+        self.snapshot = None
+        self.max_rects = idefaults.DEFAULT_RENDER_MAX_RECTS
+        self.max_area = idefaults.DEFAULT_RENDER_MAX_AREA
+
+    def set_background(self, a_background):
+        """set_background method sets a new background surface, which forces
+        a full repaint.
+        """
+        self.background = a_background
+        self.repaint = True
+
+    def invalidate(self):
+        """invalidate method forces a full repaint in the next frame.
+        """
+        self.repaint = True
+
+    def freeze(self, a_groups):
+        """freeze method sets the groups to be rendered in the snapshot instead
+        of being drawn live. An empty list thaws all groups, so they are drawn
+        live again.
+        """
+        v_groups = list(a_groups)
+        if v_groups == self.frozen:
+            return False
+        self.frozen = v_groups
+        self.snapshot = None
+        self.repaint = True
+        return True
+
+    def invalidate_snapshot(self):
+        """invalidate_snapshot method renders again the frozen groups in the
+        snapshot in the next frame, like when they changed while covered.
+        """
+        if not self.frozen:
+            return False
+        self.snapshot = None
+        self.repaint = True
+        return True
+
+    def add_dirty_rects(self, a_rects):
+        """add_dirty_rects method adds screen rectangles to be redrawn in the
+        next frame.
+        """
+        self.dirty_rects.extend(a_rects)
+
+    def draw(self, a_screen, a_groups):
+        """draw method draws all given DirtyGroup instances, from bottom to
+        top, in the screen and returns the list of screen rectangles that
+        changed. Frozen groups are not given: they are part of the snapshot
+        used as background.
+        """
+        if self.background is None or self.background.get_size() != a_screen.get_size():
+            self.background = pygame.Surface(a_screen.get_size())
+            self.background.fill(self.background_color)
+            self.snapshot = None
+            self.repaint = True
+        if self.frozen and self.snapshot is None:
+            self.snapshot = self.background.copy()
+            for l_group in self.frozen:
+                l_group.draw(self.snapshot)
+            self.repaint = True
+        v_background = self.snapshot if self.frozen else self.background
+        if not self.repaint:
+            v_rects = self.dirty_rects
+            self.dirty_rects = []
+            for l_group in a_groups:
+                v_rects.extend(l_group.pop_dirty_rects())
+            v_screen_rect = a_screen.get_rect()
+            if len(v_rects) <= self.max_rects:
+                v_rects = merge_rects(v_screen_rect.clip(l_rect) for l_rect in v_rects)
+                v_area = sum(l_rect.width * l_rect.height for l_rect in v_rects)
+                if v_area <= self.max_area * v_screen_rect.width * v_screen_rect.height:
+                    for l_rect in v_rects:
+                        a_screen.blit(v_background, l_rect, l_rect)
+                    for l_group in a_groups:
+                        l_group.draw_areas(a_screen, v_rects)
+                    return v_rects
+        self.repaint = False
+        self.dirty_rects = []
+        a_screen.blit(v_background, (0, 0))
+        for l_group in a_groups:
+            l_group.draw(a_screen)
+        return [a_screen.get_rect()]
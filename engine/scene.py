@@ -2,6 +2,8 @@
 """
 
 from . import ihandler
+from . import assets
+from . import animation
 
 
 class Scene(ihandler.IHandler):
@@ -12,31 +14,161 @@ class Scene(ihandler.IHandler):
         """__init__ method initializes an Scene instance.
         
         - name attribute stores the name of the scene.
+
+        - assets list stores the image files and folders the scene uses. They
+        are preloaded and pinned in the asset manager while the scene is open.
+
+        - atlases list stores the animation folders for every atlas the scene
+        uses. Atlases are built and pinned in the asset manager while the
+        scene is open.
+
+        - animator attribute stores the Animator shared by all animated
+        sprites in the scene. It is updated by the game handler while the
+        scene is active.
+
+        - world attribute stores the optional ecs.World with the scene
+        entities. It is updated by the game handler while the scene is active.
+
+        - modal attribute stores if the scene covers the scenes below it, like
+        menus, dialogs or pause screens. Covered scenes are paused and they
+        are rendered once in a snapshot.
+
+        - paused attribute stores if the scene is covered by a modal scene.
+
+        - pending_open dictionary stores, in order, the objects added that
+        have to be opened at the next frame boundary.
+
+        - pending_close dictionary stores, in order, the objects removed that
+        have to be closed at the next frame boundary.
         """
         super().__init__(a_type="scene")
         self.name = kwargs.get("a_name", "")
+        self.sprites.name = self.name
+        self.assets = list(kwargs.get("a_assets", []))
+        self.atlases = list(kwargs.get("a_atlases", []))
+        self.animator = kwargs.get("a_animator", None)
+        if self.animator is None:
+            self.animator = animation.Animator()
+        self.world = kwargs.get("a_world", None)
+        self.modal = kwargs.get("a_modal", False)
+        self.paused = False
+        self.pending_open = {}
+        self.pending_close = {}
 
     def open(self, **kwargs):
         """open method is called when a scene is activated the first
         time and it contains any functionality required to start the
         scene.
         """
-        pass
+        self.preload_assets()
     
     def close(self):
         """close method is called when a scene is deactivated and it
-        contains any functionality required to end the scene.
+        contains any functionality required to end the scene. All objects are
+        closed and queued to be opened again if the scene is reactivated.
         """
+        self.process_pending_close()
         for l_object in self.objects:
+            if l_object.opened:
+                l_object.close(self)
+            self.pending_open[l_object] = None
+        self.unload_assets()
+
+    # Object lifecycle methods -- start --
+    def add_object(self, a_object):
+        """add_object method adds the given object to be handled and queues it
+        to be opened at the next frame boundary.
+        """
+        if not super().add_object(a_object):
+            return False
+        if a_object in self.pending_close:
+            # removed and added again before the frame boundary: it is kept
+            # opened.
+            del self.pending_close[a_object]
+        elif not a_object.opened:
+            self.pending_open[a_object] = None
+        return True
+
+    def remove_object(self, a_object):
+        """remove_object method removes the given object to be handled and
+        queues it to be closed at the next frame boundary.
+        """
+        if not super().remove_object(a_object):
+            return False
+        self.pending_open.pop(a_object, None)
+        if a_object.opened:
+            self.pending_close[a_object] = None
+        return True
+
+    def process_pending_open(self):
+        """process_pending_open method opens, in one batch, all objects
+        queued. It returns the list of objects opened.
+        """
+        if not self.pending_open:
+            return []
+        v_objects = list(self.pending_open)
+        self.pending_open.clear()
+        for l_object in v_objects:
+            l_object.open(self)
+        self.on_objects_opened(v_objects)
+        return v_objects
+
+    def process_pending_close(self):
+        """process_pending_close method closes, in one batch, all objects
+        queued. It returns the list of objects closed.
+        """
+        if not self.pending_close:
+            return []
+        v_objects = list(self.pending_close)
+        self.pending_close.clear()
+        for l_object in v_objects:
             l_object.close(self)
+        self.on_objects_closed(v_objects)
+        return v_objects
+
+    def process_lifecycle(self):
+        """process_lifecycle method closes objects removed and opens objects
+        added since the last frame boundary.
+        """
+        self.process_pending_close()
+        self.process_pending_open()
+
+    def on_objects_opened(self, a_objects):
+        """on_objects_opened method is a virtual hook called with the list of
+        objects opened in a batch, like all units spawned in the same frame.
+        """
+        pass
+
+    def on_objects_closed(self, a_objects):
+        """on_objects_closed method is a virtual hook called with the list of
+        objects closed in a batch.
+        """
+        pass
+    # Object lifecycle methods -- end --
+
+    def preload_assets(self):
+        """preload_assets method loads and pins all scene assets and atlases
+        in the asset manager. It returns the number of images and atlases
+        pinned.
+        """
+        v_count = assets.get_manager().preload(self.assets, self) if self.assets else 0
+        for l_paths in self.atlases:
+            assets.get_manager().get_atlas(l_paths, self)
+        return v_count + len(self.atlases)
+
+    def unload_assets(self):
+        """unload_assets method releases all scene assets, so the asset manager
+        can evict them.
+        """
+        return assets.get_manager().unload(self)
     
     def start_frame(self, a_fps):
         """start_frame method is called by the engine at the start of every
-        frame.
+        frame. Scene timers are ticked by the game handler, which samples the
+        clock once per frame. Objects added or removed since the last frame are
+        opened or closed here, without scanning all scene objects.
         """
-        self.tick_timers()
-        for l_object in [obj for obj in self.objects if not obj.opened]:
-            l_object.open(self)
+        self.process_lifecycle()
 
     def end_frame(self):
         """end_frame method is called by the engine at the end of every frame.
@@ -0,0 +1,121 @@
+"""scheduler.py module contains the scheduler in charge of firing engine
+timers when they expire.
+"""
+
+import heapq
+import itertools
+from . import iclock
+
+
+class TimerScheduler:
+    """TimerScheduler class keeps all timers in a min-heap sorted by
+    expiration time, so every tick only touches the timers that expired.
+    Removed timers are discarded lazily when they reach the top of the heap.
+
+    Finished and inactive timers are retired when they expire. They keep a
+    reference to the scheduler, so they are added again when they are
+    activated, until they are removed.
+    """
+
+    def __init__(self, a_clock=None):
+        """__init__ method creates a new TimerScheduler instance.
+
+        - clock attribute stores the clock used to get the actual time.
+
+        - now attribute stores the time sampled in the last tick.
+
+        - heap list stores (expiration time, sequence, timer) entries.
+
+        - timers dictionary stores the sequence of the valid heap entry for
+        every timer scheduled.
+        """
+        self.clock = a_clock if a_clock else iclock.Clock()
+        self.now = None
+        self.heap = []
+        self.timers = {}
+        self.sequence = itertools.count()
+
+    def __len__(self):
+        """__len__ method returns the number of timers scheduled.
+        """
+        return len(self.timers)
+
+    def __contains__(self, a_timer):
+        """__contains__ method checks if the given timer is scheduled.
+        """
+        return a_timer in self.timers
+
+    def __iter__(self):
+        """__iter__ method iterates all timers scheduled.
+        """
+        return iter(list(self.timers))
+
+    def get_now(self):
+        """get_now method returns the time of the last tick, or the clock
+        time if it has never ticked.
+        """
+        return self.clock.get_ticks() if self.now is None else self.now
+
+    def _schedule(self, a_timer, a_time):
+        """_schedule internal method pushes the timer to expire at the given
+        time.
+        """
+        v_sequence = next(self.sequence)
+        self.timers[a_timer] = v_sequence
+        heapq.heappush(self.heap, (a_time, v_sequence, a_timer))
+
+    def add(self, a_timer):
+        """add method schedules a new timer, counting its timeout from now.
+        """
+        if a_timer in self.timers:
+            return False
+        a_timer.scheduler = self
+        self.reschedule(a_timer)
+        return True
+
+    def reschedule(self, a_timer):
+        """reschedule method schedules again a timer added before, counting
+        its timeout from now, adding it again when it was retired. It is
+        called when the timer is activated.
+        """
+        v_now = self.get_now()
+        a_timer.start_time = v_now
+        self._schedule(a_timer, v_now + a_timer.timeout)
+
+    def remove(self, a_timer):
+        """remove method removes a timer from the scheduler, so it is not
+        added again when it is activated.
+        """
+        v_linked = a_timer.scheduler is self
+        if v_linked:
+            a_timer.scheduler = None
+        return self.timers.pop(a_timer, None) is not None or v_linked
+
+    def tick(self, a_now=None):
+        """tick method samples the clock once (unless a_now is given) and
+        fires all timers expired. Repeating timers are scheduled again and
+        finished or deactivated timers are retired.
+
+        It returns the number of timers fired.
+        """
+        self.now = self.clock.get_ticks() if a_now is None else a_now
+        v_fired = 0
+        while self.heap and self.heap[0][0] <= self.now:
+            _, v_sequence, v_timer = heapq.heappop(self.heap)
+            if self.timers.get(v_timer) != v_sequence:
+                continue
+            if not v_timer.active:
+                del self.timers[v_timer]
+                continue
+            # the entry is None while the callback runs, so removing or
+            # activating the timer from the callback is detected.
+            self.timers[v_timer] = None
+            v_timer.expire(self.now)
+            v_fired += 1
+            if v_timer not in self.timers or self.timers[v_timer] is not None:
+                continue
+            if v_timer.active:
+                self._schedule(v_timer, self.now + max(v_timer.timeout, 1))
+            else:
+                del self.timers[v_timer]
+        return v_fired
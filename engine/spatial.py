@@ -0,0 +1,121 @@
+"""spatial.py module contains the spatial index with all objects placed in a
+board.
+"""
+
+import pygame
+
+
+class OccupancyIndex:
+    """OccupancyIndex class implements an index with the objects placed in
+    every board cell. It keeps the grid occupancy field updated.
+    """
+
+    def __init__(self, a_grid):
+        """__init__ method creates a new OccupancyIndex instance.
+
+        - grid attribute stores the Grid instance whose occupancy field is
+        updated.
+
+        - cells dictionary stores the list of objects placed in every cell,
+        indexed by the (x, y) cell coordinates.
+
+        - positions dictionary stores the (x, y) cell coordinates for every
+        object placed.
+        """
+        self.grid = a_grid
+        self.cells = {}
+        self.positions = {}
+
+    def __len__(self):
+        """__len__ method returns the number of objects placed.
+        """
+        return len(self.positions)
+
+    def __contains__(self, a_object):
+        """__contains__ method checks if the given object is placed.
+        """
+        return a_object in self.positions
+
+    def _add(self, a_object, a_cell):
+        """_add internal method adds an object to the given cell.
+        """
+        self.positions[a_object] = a_cell
+        self.cells.setdefault(a_cell, []).append(a_object)
+        self._update_occupancy(a_cell, 1)
+
+    def _remove(self, a_object, a_cell):
+        """_remove internal method removes an object from the given cell.
+        """
+        v_objects = self.cells[a_cell]
+        v_objects.remove(a_object)
+        if not v_objects:
+            del self.cells[a_cell]
+        self._update_occupancy(a_cell, -1)
+
+    def _update_occupancy(self, a_cell, a_delta):
+        """_update_occupancy internal method updates the grid occupancy field
+        for the given cell.
+        """
+        v_x, v_y = a_cell
+        if not self.grid.in_bounds(v_x, v_y):
+            return
+        self.grid.cells["occupancy"][v_x, v_y] += a_delta
+        self.grid.notify(pygame.Rect(v_x, v_y, 1, 1), {"occupancy"})
+
+    def place(self, a_object, a_x, a_y):
+        """place method places the object in the given cell, moving it when
+        it was already placed.
+        """
+        v_cell = (int(a_x), int(a_y))
+        v_previous = self.positions.get(a_object)
+        if v_previous == v_cell:
+            return False
+        if v_previous is not None:
+            self._remove(a_object, v_previous)
+        self._add(a_object, v_cell)
+        return True
+
+    def remove(self, a_object):
+        """remove method removes the object from the index.
+        """
+        v_cell = self.positions.pop(a_object, None)
+        if v_cell is None:
+            return False
+        self._remove(a_object, v_cell)
+        return True
+
+    def get_position(self, a_object):
+        """get_position method returns the (x, y) cell where the object is
+        placed or None.
+        """
+        return self.positions.get(a_object)
+
+    def at(self, a_x, a_y):
+        """at method returns a tuple with all objects in the given cell.
+        """
+        return tuple(self.cells.get((a_x, a_y), ()))
+
+    def in_rect(self, a_x, a_y, a_width, a_length):
+        """in_rect method returns a list with all objects placed in the given
+        rectangle of cells. It walks the rectangle cells or the placed objects,
+        whatever is smaller.
+        """
+        v_result = []
+        if a_width * a_length <= len(self.cells):
+            for l_x in range(a_x, a_x + a_width):
+                for l_y in range(a_y, a_y + a_length):
+                    v_result.extend(self.cells.get((l_x, l_y), ()))
+            return v_result
+        for l_cell, l_objects in self.cells.items():
+            if a_x <= l_cell[0] < a_x + a_width and a_y <= l_cell[1] < a_y + a_length:
+                v_result.extend(l_objects)
+        return v_result
+
+    def in_radius(self, a_x, a_y, a_radius):
+        """in_radius method returns a list with all objects placed at a
+        euclidean distance lower or equal than the given radius (in cells).
+        """
+        v_radius = int(a_radius)
+        v_square_radius = a_radius * a_radius
+        return [l_object for l_object in self.in_rect(a_x - v_radius, a_y - v_radius, 2 * v_radius + 1, 2 * v_radius + 1)
+                if (self.positions[l_object][0] - a_x) ** 2 + (self.positions[l_object][1] - a_y) ** 2 <= v_square_radius]
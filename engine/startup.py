@@ -0,0 +1,66 @@
+"""startup.py module contains the timing report for the game startup, from
+the process start to the first frame displayed.
+
+This module only depends on the standard library, so it can be imported
+before anything else to measure the time spent importing.
+"""
+
+import os
+import sys
+import time
+
+STARTUP_REPORT_VARIABLE = "DANDELO_STARTUP_REPORT"
+
+_start = time.perf_counter()
+_marks = []
+
+
+def mark(a_phase):
+    """mark function records the given startup phase as finished now.
+    """
+    _marks.append((a_phase, time.perf_counter()))
+
+
+def reset():
+    """reset function removes all phases recorded and starts measuring again.
+    """
+    global _start
+    _start = time.perf_counter()
+    _marks.clear()
+
+
+def get_report():
+    """get_report function returns a list with (phase, phase milliseconds,
+    total milliseconds) for every phase recorded, in order.
+    """
+    v_report = []
+    v_previous = _start
+    for l_phase, l_time in _marks:
+        v_report.append((l_phase, (l_time - v_previous) * 1000, (l_time - _start) * 1000))
+        v_previous = l_time
+    return v_report
+
+
+def format_report():
+    """format_report function returns the startup report as a string.
+    """
+    v_lines = ["startup report"]
+    for l_phase, l_phase_ms, l_total_ms in get_report():
+        v_lines.append("  {:<20} {:>9.2f} ms {:>9.2f} ms".format(l_phase, l_phase_ms, l_total_ms))
+    return "\n".join(v_lines)
+
+
+def is_enabled():
+    """is_enabled function checks if the startup report has to be printed,
+    using the DANDELO_STARTUP_REPORT environment variable.
+    """
+    return os.environ.get(STARTUP_REPORT_VARIABLE, "") not in ("", "0")
+
+
+def print_report(a_force=False):
+    """print_report function prints the startup report when it is enabled.
+    """
+    if not (a_force or is_enabled()):
+        return False
+    print(format_report(), file=sys.stderr)
+    return True
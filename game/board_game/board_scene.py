@@ -3,6 +3,7 @@
 
 import pygame
 from engine import board
+from engine import camera
 from engine import scene
 from engine import idefaults
 from . import config
@@ -22,11 +23,11 @@ class BoardScene(scene.Scene):
     def __init__(self, **kwargs):
         """__init__ method creates a new BoardScene instance.
         """
-        super().__init__(a_name=config.SCENE_BOARD, **kwargs)
-        self.board = board.Board(10, 10, idefaults.DEFAULT_WIDTH, idefaults.DEFAULT_LENGTH)
+        super().__init__(a_name=config.SCENE_BOARD, a_atlases=[player.ATLAS_PATHS], **kwargs)
+        v_camera = camera.Camera((10, 10, config.WIDTH - 20, config.LENGTH - 20))
+        self.board = board.Board(10, 10, idefaults.DEFAULT_WIDTH, idefaults.DEFAULT_LENGTH, a_camera=v_camera)
         self.board.create_default_board(8)
-        self.player = player.Player(a_position=pygame.Vector2(), a_board_to_screen=self.board.board_to_screen)
-        self.player.out_of_bounds = self.board.out_of_bounds
+        self.player = player.Player(a_position=pygame.Vector2(), a_board=self.board, a_animator=self.animator)
         self.add_object(self.board)
         self.add_object(self.player)
         self.keyboard_control_object = self.player
@@ -6,5 +6,8 @@ FPS = 30
 WIDTH = 800
 LENGTH = 600
 
+PLAYER_GRAPHICS_PATH = "game/board_game/graphics/player"
+
+SCENE_LOADING = "scene/loading"
 SCENE_BOARD = "scene/board"
 SCENE_POPUP = "scene/popup"
\ No newline at end of file
@@ -1,9 +1,10 @@
 """gameplay.py modules contains the main gameplay.
 """
 
+import pygame
+from engine import loading
+from engine import preload
 from . import config
-from . import board_scene
-from . import popup_scene
 
 
 def handle_scene_this(a_event):
@@ -31,9 +32,39 @@ def handle_scene_end(a_event):
     return True
 
 
+def handle_scene_loaded(a_event):
+    """handle_scene_loaded function handles action scene:loaded. It ends the
+    loading scene and creates all game scenes.
+    """
+    v_handler = a_event.handler
+    if v_handler is None:
+        return False
+    for l_file, l_error in a_event.data["errors"].items():
+        print("failed loading ", l_file, l_error)
+    v_handler.deactivate_active_scene()
+    v_handler.remove_scene(a_event.data["object"])
+    create_board_scene(v_handler)
+    create_menu_scene(v_handler)
+    return True
+
+
+def create_loading_scene(a_game_handler):
+    """create_loading_scene function creates the scene that preloads all game
+    assets in background. Game scenes are created when it finishes.
+    """
+    v_preloader = preload.Preloader([config.PLAYER_GRAPHICS_PATH])
+    v_loading_scene = loading.LoadingScene(v_preloader, a_name=config.SCENE_LOADING,
+                                           a_position=pygame.Vector2(config.WIDTH / 2 - 100, config.LENGTH / 2 - 8))
+    a_game_handler.add_scene(v_loading_scene)
+    a_game_handler.activate_this_scene(v_loading_scene)
+    a_game_handler.add_action("scene:loaded", handle_scene_loaded)
+
+
 def create_board_scene(a_game_handler):
-    """create_board_scene function creates the game board scene.
+    """create_board_scene function creates the game board scene. The scene
+    module is imported here, so it is not loaded before the first frame.
     """
+    from . import board_scene
     v_board_scene = board_scene.BoardScene()
     a_game_handler.add_scene(v_board_scene)
     a_game_handler.activate_this_scene(v_board_scene)
@@ -41,8 +72,10 @@ def create_board_scene(a_game_handler):
 
 
 def create_menu_scene(a_game_handler):
-    """create_menu_scene function creates the game menu scene.
+    """create_menu_scene function creates the game menu scene. The scene
+    module is imported here, so it is not loaded before the first frame.
     """
+    from . import popup_scene
     v_menu_scene = popup_scene.PopUpMenuScene()
     a_game_handler.add_scene(v_menu_scene)
     a_game_handler.add_action("scene:end", handle_scene_end)
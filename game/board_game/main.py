@@ -1,12 +1,15 @@
 """main.py module is the game main module.
 """
 
+from engine import startup
 import sys
 # import pygame
 from game.board_game import config
 from game.board_game import gameplay
 from engine import engine
 
+startup.mark("import")
+
 
 def main():
     """main function is the main game function.
@@ -14,8 +17,8 @@ def main():
     # pygame.init()
     v_engine = engine.Engine("dandelo", config.FPS)
     v_engine.init(config.WIDTH, config.LENGTH)
-    gameplay.create_board_scene(v_engine.handler)
-    gameplay.create_menu_scene(v_engine.handler)
+    gameplay.create_loading_scene(v_engine.handler)
+    startup.mark("scenes")
     v_engine.run()
     sys.exit()
 
@@ -9,10 +9,13 @@ from engine import idefaults
 from engine import bobject
 from engine import isprite
 from engine import gevent
-from engine import support
-from engine import itimer
+from engine import assets
+from engine import animation
 from . import config
 
+ANIMATIONS_PER_SECOND = 2
+ATLAS_PATHS = tuple(os.path.join(config.PLAYER_GRAPHICS_PATH, l_animation) for l_animation in ("idle", "attack"))
+
 
 class PlayerSprite(isprite.ISprite):
     """PlayerSprite class implements the players sprite to be displayed in the
@@ -20,30 +23,42 @@ class PlayerSprite(isprite.ISprite):
     """
 
     def __init__(self, **kwargs):
-        """__init__ method creates a new PlayerSprite instance.
+        """__init__ method creates a new PlayerSprite instance. Animation
+        frames are subsurfaces of an atlas shared by all players through the
+        asset manager, which scenes pin by declaring ATLAS_PATHS in their
+        atlases, and they are played by the scene animator.
+
+        - animator attribute stores the Animator playing the sprite clips.
+        When none is given the sprite creates its own one.
+
+        - own_animator attribute stores if the sprite created its animator,
+        so it has to advance it in every update.
         """
         super().__init__(**kwargs)
-        self.animations = {"idle": [], "attack": []}
-        for l_animation in self.animations.keys():
-            v_animation_path = os.path.join("game/board_game/graphics/player", l_animation)
-            self.animations[l_animation] = support.import_images_from_path(v_animation_path)
-        self.animation_index = 0.0
-        self.animation_action = "idle"
-        self.image = self.animations[self.animation_action][int(self.animation_index)]
+        self.animator = kwargs.get("a_animator", None)
+        self.own_animator = self.animator is None
+        if self.own_animator:
+            self.animator = animation.Animator(a_capacity=1)
+        v_atlas = assets.get_atlas(ATLAS_PATHS)
+        self.image = v_atlas.get_frames("idle")[0]
         self.rect = self.image.get_rect()
         self.rect.topleft = self.position
+        for l_animation, l_loop in (("idle", True), ("attack", False)):
+            v_frames = v_atlas.get_frames(l_animation)
+            self.animator.add_clip(animation.Clip("player/" + l_animation, v_frames, len(v_frames) * ANIMATIONS_PER_SECOND, l_loop))
+        self.play("idle")
 
+    def play(self, a_animation, a_on_end=None, a_restart=True):
+        """play method plays the given player animation.
+        """
+        return self.animator.play(self, "player/" + a_animation, a_on_end, a_restart)
 
     def update(self, a_fps):
-        """update method is called by the sprite group.
+        """update method advances the sprite animation when the sprite owns
+        its animator. A shared animator is advanced by the game handler.
         """
-        v_number_images = len(self.animations[self.animation_action])
-        v_animation_per_second = 2
-        self.animation_index += v_number_images * v_animation_per_second / a_fps
-        if self.animation_index >= v_number_images:
-            self.animation_index = 0.0
-        self.image = self.animations[self.animation_action][int(self.animation_index)]
-        
+        if self.own_animator:
+            self.animator.update(a_fps)
 
 
 class Player(bobject.BObject):
@@ -59,7 +74,8 @@ class Player(bobject.BObject):
             a_width=idefaults.DEFAULT_WIDTH,
             a_length=idefaults.DEFAULT_LENGTH,
             a_foreground_color=icolors.RED,
-            a_key_color=idefaults.DEFAULT_SPRITE_COLOR)
+            a_key_color=idefaults.DEFAULT_SPRITE_COLOR,
+            a_animator=kwargs.get("a_animator", None))
         self.previous_position = None
 
     def set_position(self, a_position):
@@ -73,33 +89,31 @@ class Player(bobject.BObject):
         """handle_keyboard_event method moves the player with the given
         keyboard inputs.
         """
-        def stop_attack_animation(**kwargs):
-            self.sprite.animation_action = "idle"
+        def stop_attack_animation():
+            self.sprite.play("idle")
 
         self.previous_position = self.board_position.copy()
         v_result = a_event.key in [K_UP, K_DOWN, K_LEFT, K_RIGHT, K_SPACE, K_RETURN]
+        v_position = self.board_position.copy()
         if a_event.key == K_UP:
-            self.board_position.y -= 1
-            self.sprite.animation_action = "idle"
+            v_position.y -= 1
+            self.sprite.play("idle", a_restart=False)
         if a_event.key == K_DOWN:
-            self.board_position.y += 1
-            self.sprite.animation_action = "idle"
+            v_position.y += 1
+            self.sprite.play("idle", a_restart=False)
         if a_event.key == K_LEFT:
-            self.sprite.animation_action = "idle"
-            self.board_position.x -= 1
+            self.sprite.play("idle", a_restart=False)
+            v_position.x -= 1
         if a_event.key == K_RIGHT:
-            self.sprite.animation_action = "idle"
-            self.board_position.x += 1
+            self.sprite.play("idle", a_restart=False)
+            v_position.x += 1
         if a_event.key == K_SPACE:
-            self.sprite.animation_action = "attack"
-            v_timer = itimer.Timer("attack", 500, stop_attack_animation)
-            v_timer.activate()
-            self.notifier(gevent.GEvent("action/parent/timer:create/now", {"object": self, "timer": v_timer}))
+            self.sprite.play("attack", stop_attack_animation)
         if a_event.key == K_RETURN:
-            v_position = self.board_to_screen(self.board_position)
-            self.notifier(gevent.GEvent("action/top/scene:this", {"object": self, "scene":config.SCENE_POPUP, "position": v_position}))
-        if self.out_of_bounds and self.out_of_bounds(self.board_position):
-            self.set_position(self.previous_position)
+            v_screen_position = self.board_to_screen(self.board_position)
+            self.notifier(gevent.GEvent("action/top/scene:this", {"object": self, "scene":config.SCENE_POPUP, "position": v_screen_position}))
+        if v_position != self.board_position and self.can_move_to(v_position):
+            self.set_position(v_position)
         # self.sprite.rect.topleft = self.board_to_screen(self.board_position)
-        self.sprite.rect.topleft = self.position
+        self.sync_sprite_position()
         return v_result
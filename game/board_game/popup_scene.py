@@ -20,7 +20,7 @@ class PopUpMenuScene(scene.Scene):
     def __init__(self, **kwargs):
         """__init__ method creates a new PopUpMenuScene instance.
         """
-        super().__init__(a_name=config.SCENE_POPUP)
+        super().__init__(a_name=config.SCENE_POPUP, a_modal=True)
         self.position = None
         self.popup_menu = popup.PopUp()
         self.add_object(self.popup_menu)
@@ -31,6 +31,7 @@ class PopUpMenuScene(scene.Scene):
         time and it contains any functionality required to start the
         scene.
         """
+        super().open(**kwargs)
         self.position = kwargs.get("position", self.position)
         self.popup_menu.set_position(self.position)
 
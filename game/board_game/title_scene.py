@@ -3,6 +3,7 @@
 
 import pygame
 from engine import icolors
+from engine import fonts
 from engine import scene
 from engine import gobject
 
@@ -16,10 +17,10 @@ class Title(pygame.sprite.Sprite):
         """
         super().__init__()
         self.font_size = 48
-        self.font = pygame.font.SysFont("arial", self.font_size)
+        self.font = fonts.get_font("arial", self.font_size)
         self.image = pygame.Surface((640, 480))
         self.image.fill(icolors.WHITE)
-        title_image = self.font.render("Dandelo", True, icolors.BLUE)
+        title_image = fonts.render_text(self.font, "Dandelo", True, icolors.BLUE)
         self.image.blit(title_image, (300, 240))
         self.rect = self.image.get_rect()
         self.rect.topleft = (0, 0)